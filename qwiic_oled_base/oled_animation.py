@@ -0,0 +1,321 @@
+#-----------------------------------------------------------------------------
+# oled_animation.py
+#
+# Animations for the OLED display - a compact file format and a streaming player
+#
+#------------------------------------------------------------------------
+#
+# Written by  SparkFun Electronics, October 2026
+#
+# This python library supports the SparkFun Electroncis qwiic
+# qwiic sensor/board ecosystem on a Raspberry Pi (and compatable) single
+# board computers.
+#
+# More information on qwiic is at https://www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#
+#==================================================================================
+# Copyright (c) 2026 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#==================================================================================
+#
+#
+# Drawing an animation frame by frame and calling display() is slow - each frame is
+# rendered into the screen buffer, then compared with what the display shows. An
+# animation file holds the first frame (the keyframe), then for each frame only the
+# bytes that changed from the frame before, as runs of page data. The player maps
+# the file and sends the runs straight to the display, at the frame rate of the
+# animation.
+#
+# Each run is at most 32 bytes, the largest block the I2C driver sends, so a run
+# is sent as one block. Runs a few bytes apart are merged - a new run costs more to
+# send than the bytes between them.
+#
+# The changes for frame 0 take the last frame back to the first, so the animation
+# can loop.
+#
+# File Structure - all values little endian
+#   bytes 0-3       'QOLA'
+#   byte  4         version (1)
+#   byte  5         reserved
+#   bytes 6-7       width in pixels
+#   bytes 8-9       height in pixels
+#   bytes 10-11     frames per second - a whole number
+#   bytes 12-15     number of frames
+#   4 bytes         per frame + 1, the offset in the file of the changes for the frame.
+#                   The last offset is the end of the file.
+#   N bytes         the keyframe, in page format (N = width * pages)
+#   per frame       the changes - runs of page, column, length (one byte each) and the
+#                   page data of the run
+#
+
+import os
+import mmap
+import time
+import struct
+
+_MAGIC = b'QOLA'
+_VERSION = 1
+
+_HEADER = struct.Struct('<4sBBHHHI')
+_OFFSET = struct.Struct('<I')
+_RUN = struct.Struct('<BBB')
+
+_MAX_RUN = 32       # the largest block sent to the display
+_MERGE_GAP = 4      # runs this close together are merged
+
+#-----------------------------------------
+def encode_changes(previous, frame, width):
+    """
+        Encode the changes from one frame to the next, as runs of page data.
+
+        :param previous: The frame before, in page format
+        :param frame: The frame, in page format
+        :param width: The width of the frames in pixels (columns)
+
+        :return: The encoded changes
+        :rtype: bytes
+
+    """
+
+    out = bytearray()
+
+    for page in range(len(frame)//width):
+
+        iPage = page * width
+        column = 0
+        while column < width:
+
+            # find the start of the next run
+            while column < width and frame[iPage + column] == previous[iPage + column]:
+                column += 1
+            if column >= width:
+                break
+
+            # extend the run while the next change is close, up to the block size
+            start = column
+            end = column + 1
+            column += 1
+            while column < width and column - start < _MAX_RUN:
+                if frame[iPage + column] != previous[iPage + column]:
+                    end = column + 1
+                elif column - end >= _MERGE_GAP:
+                    break
+                column += 1
+
+            column = end
+            out += _RUN.pack(page, start, end - start)
+            out += frame[iPage + start:iPage + end]
+
+    return bytes(out)
+
+#-----------------------------------------
+# The header holds the frame rate as a whole number - a fraction would be dropped
+
+def _check_fps(fps):
+
+    if fps != int(fps) or not 1 <= fps <= 0xFFFF:
+        raise ValueError("The frame rate of an animation file is a whole number of frames per second, 1 to 65535 - not %r" % (fps,))
+
+#-----------------------------------------
+def write_animation(path, width, height, frames, fps=30):
+    """
+        Write an animation file.
+
+        :param path: Path of the animation file
+        :param width: The width of the animation in pixels
+        :param height: The height of the animation in pixels
+        :param frames: List of frames, each a screen buffer in page format (see draw_bitmap())
+        :param fps: The frame rate of the animation, in frames per second - a whole number, 1 to
+                    65535. Play at other rates with AnimationPlayer.play(fps=...).
+
+        :return: No return value
+
+    """
+
+    _check_fps(fps)
+
+    nBytes = width * ((height + 7)//8)
+    frames = [bytes(bytearray(frame)) for frame in frames]
+
+    if not frames:
+        raise ValueError("An animation needs at least one frame")
+
+    for frame in frames:
+        if len(frame) != nBytes:
+            raise ValueError("Frame size does not match the animation size %dx%d" % (width, height))
+
+    changes = [encode_changes(frames[iFrame - 1], frame, width) for iFrame, frame in enumerate(frames)]
+
+    offset = _HEADER.size + _OFFSET.size * (len(frames) + 1) + nBytes
+    offsets = []
+    for change in changes:
+        offsets.append(offset)
+        offset += len(change)
+    offsets.append(offset)
+
+    # write then rename, so a player never maps a partial file
+    tmpFile = path + '.tmp'
+    with open(tmpFile, 'wb') as fp:
+        fp.write(_HEADER.pack(_MAGIC, _VERSION, 0, width, height, int(fps), len(frames)))
+        fp.write(b''.join(_OFFSET.pack(value) for value in offsets))
+        fp.write(frames[0])
+        for change in changes:
+            fp.write(change)
+    os.replace(tmpFile, path)
+
+#-----------------------------------------
+# The player
+
+class AnimationPlayer(object):
+    """
+    AnimationPlayer
+
+        :param oled: The display (QwiicOledBase) to play the animation on
+        :param path: Path of the animation file
+        :return: The player object
+        :rtype: Object
+    """
+
+    def __init__(self, oled, path):
+
+        self._oled = oled
+
+        with open(path, 'rb') as fp:
+            self._mmap = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, _, self.width, self.height, self.fps, self.frames = _HEADER.unpack_from(self._mmap, 0)
+        if magic != _MAGIC or version != _VERSION:
+            self._mmap.close()
+            raise ValueError("Not an OLED animation file: %s" % path)
+
+        if self.width != oled.get_lcd_width() or self.height != oled.get_lcd_height():
+            self._mmap.close()
+            raise ValueError("Animation size %dx%d does not match the display" % (self.width, self.height))
+
+        self._view = memoryview(self._mmap)
+
+        nBytes = self.width * ((self.height + 7)//8)
+        iStart = _HEADER.size + _OFFSET.size * (self.frames + 1)
+        self._keyframe = self._view[iStart:iStart+nBytes]
+        self._offsets = [_OFFSET.unpack_from(self._mmap, _HEADER.size + i * _OFFSET.size)[0] for i in range(self.frames + 1)]
+
+        self._running = False
+
+    def _send_frame(self, iFrame):
+
+        oled = self._oled
+        offset = self._offsets[iFrame]
+        end = self._offsets[iFrame + 1]
+        lastPage = None
+
+        while offset < end:
+            page, column, length = _RUN.unpack_from(self._mmap, offset)
+            offset += _RUN.size
+
+            oled._send_block(None if page == lastPage else page, column, self._view[offset:offset+length]) # pylint: disable=protected-access
+            lastPage = page
+            offset += length
+
+    def play(self, loops=1, fps=None):
+        """
+            Play the animation. The first frame is sent with display(), then only the changes
+            of each frame are sent, straight from the file. When done, the screen buffer holds
+            the last frame. An animation can't be played inside a frame (see QwiicOledBase.frame()) -
+            if another thread has a frame open, the next change waits for it to end.
+
+            :param loops: Number of times to play the animation. 0 plays until stop() is called.
+            :param fps: The frame rate. Default is the frame rate of the animation.
+
+            :return: No return value
+
+        """
+
+        oled = self._oled
+        period = 1.0 / (fps or self.fps or 30)
+
+        # the changes go straight to the bus - nothing may be sent while a frame is drawn. Holding
+        # the frame owner lock, a frame can only be open in this thread.
+        frameOwner = oled._frameOwner # pylint: disable=protected-access
+
+        screenbuffer = oled.get_screenbuffer()
+        with frameOwner:
+            if oled.in_frame():
+                raise RuntimeError("An animation can't be played inside a frame")
+
+            screenbuffer[:] = self._keyframe
+            oled.display(force=True)
+
+        self._running = True
+        oled._remove_frame() # pylint: disable=protected-access
+
+        try:
+            tNext = time.monotonic() + period
+            iLoop = 0
+            while self._running and (loops == 0 or iLoop < loops):
+
+                # frame 0 was sent by display() - on later loops, its changes follow the last frame
+                for iFrame in range(0 if iLoop else 1, self.frames):
+
+                    delay = tNext - time.monotonic()
+                    if delay > 0:
+                        time.sleep(delay)
+                    tNext += period
+
+                    if not self._running:
+                        break
+
+                    # waits for a frame open in another thread to end
+                    with frameOwner, oled._busLock: # pylint: disable=protected-access
+                        self._send_frame(iFrame)
+
+                iLoop += 1
+
+        finally:
+            self._running = False
+
+            # the shadow buffer holds what was sent - unless the display contents are unknown,
+            # such as when the keyframe was not sent
+            shadow = oled._shadowbuffer # pylint: disable=protected-access
+            if shadow is not None:
+                screenbuffer[:] = shadow
+            oled._save_frame() # pylint: disable=protected-access
+
+    def stop(self):
+        """
+            Stop a playing animation, after the current frame.
+
+            :return: No return value
+
+        """
+        self._running = False
+
+    def close(self):
+        """
+            Close the animation file.
+
+            :return: No return value
+
+        """
+
+        self._keyframe.release()
+        self._view.release()
+        self._mmap.close()
@@ -0,0 +1,445 @@
+#-----------------------------------------------------------------------------
+# oled_bitmap.py
+#
+# Utilities to work with bitmaps in the SSD1306 page format
+#
+#------------------------------------------------------------------------
+#
+# Written by  SparkFun Electronics, October 2026
+#
+# This python library supports the SparkFun Electroncis qwiic
+# qwiic sensor/board ecosystem on a Raspberry Pi (and compatable) single
+# board computers.
+#
+# More information on qwiic is at https://www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#
+#==================================================================================
+# Copyright (c) 2026 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#==================================================================================
+#
+# Page format - the layout of the screen buffer (see oled_logos.py). A bitmap
+# that is <width> columns wide and <pages> pages high is stored page by page,
+# each page is <width> bytes, one per column. Bit 0 of a byte is the top pixel.
+#
+# The operations here work on whole pages at a time. A page row is converted to
+# a (big) python int, so a mask/or/xor of a page row is one integer operation,
+# not a loop over the pixels.
+#
+
+import struct
+import zlib
+
+# Tables to shift a byte down by n bits. For shift n, the low table holds the
+# part of the byte that stays in the page, the high table the part that spills
+# into the next page.
+_shiftLow = [bytes(bytearray(((b << n) & 0xFF) for b in range(256))) for n in range(8)]
+_shiftHigh = [bytes(bytearray((b >> (8 - n)) & 0xFF for b in range(256))) for n in range(8)]
+
+#-----------------------------------------
+def shift_pages(data, width, pages, shift):
+    """
+        Shift a page format bitmap down by 0-7 pixels.
+
+        :param data: The bitmap, in page format
+        :param width: The width of the bitmap in pixels (columns)
+        :param pages: The height of the bitmap in pages
+        :param shift: Number of pixels to shift the bitmap down by, 0-7
+
+        :return: The shifted bitmap. If shift is not 0, it is one page taller than the input.
+        :rtype: bytes
+
+    """
+
+    data = bytes(bytearray(data))
+
+    if shift == 0:
+        return data
+
+    low = _shiftLow[shift]
+    high = _shiftHigh[shift]
+
+    out = []
+    carry = 0
+    for page in range(pages):
+        row = data[page*width:(page+1)*width]
+        out.append(int.from_bytes(row.translate(low), 'big') | carry)
+        carry = int.from_bytes(row.translate(high), 'big')
+    out.append(carry)
+
+    return b''.join(value.to_bytes(width, 'big') for value in out)
+
+#-----------------------------------------
+def blit_pages(dst, dstWidth, dstPages, x, page, src, mask, srcWidth, srcPages, xor=False):
+    """
+        Copy a page format bitmap into a page format buffer, clipping at the buffer edges.
+
+        In normal mode the destination bits selected by the mask are replaced by the source
+        bits. In XOR mode, the source bits selected by the mask are XORed with the destination.
+
+        :param dst: The destination buffer (the screen buffer)
+        :param dstWidth: The width of the destination in pixels (columns)
+        :param dstPages: The height of the destination in pages
+        :param x: The X position of the bitmap in the destination
+        :param page: The page of the destination for the first page of the bitmap
+        :param src: The source bitmap, in page format
+        :param mask: The mask bitmap, in page format
+        :param srcWidth: The width of the source in pixels (columns)
+        :param srcPages: The height of the source in pages
+        :param xor: If True, the source is XORed into the destination
+
+        :return: No return value
+
+    """
+
+    iStart = max(0, -x)
+    iEnd = min(srcWidth, dstWidth - x)
+    if iEnd <= iStart:
+        return
+
+    nBytes = iEnd - iStart
+
+    for row in range(max(0, -page), min(srcPages, dstPages - page)):
+
+        sOffset = row * srcWidth
+        bMask = int.from_bytes(mask[sOffset+iStart:sOffset+iEnd], 'big')
+        if not bMask:
+            continue
+
+        bSrc = int.from_bytes(src[sOffset+iStart:sOffset+iEnd], 'big') & bMask
+
+        dOffset = (page + row) * dstWidth + x
+        bDst = int.from_bytes(bytearray(dst[dOffset+iStart:dOffset+iEnd]), 'big')
+
+        if xor:
+            bDst ^= bSrc
+        else:
+            bDst = (bDst & ~bMask) | bSrc
+
+        dst[dOffset+iStart:dOffset+iEnd] = bDst.to_bytes(nBytes, 'big')
+
+#-----------------------------------------
+# Row format - the layout of most 1 bit image files (PBM, XBM, raw). Each row of
+# the image is packed 8 pixels to a byte, left to right, and starts on a new byte.
+# In PBM and raw data the left pixel is the high bit of a byte, in XBM the low bit.
+# A set bit is a lit pixel.
+#
+# Converting between rows and pages is an 8x8 bit transpose of each block of 8
+# rows by 8 columns. The blocks of a whole image are put side by side in one (big)
+# python int, and transposed together with three mask and shift steps - the masks
+# are precomputed tables, one 64 bit pattern per block. No loop over the pixels,
+# or even the blocks.
+
+# The 8x8 transpose steps - shift and 64 bit mask (Hacker's Delight, transpose8)
+_transposeSteps = [(7, b'\x00\xaa\x00\xaa\x00\xaa\x00\xaa'),
+                   (14, b'\x00\x00\xcc\xcc\x00\x00\xcc\xcc'),
+                   (28, b'\x00\x00\x00\x00\xf0\xf0\xf0\xf0')]
+
+# number of blocks -> masks for that many blocks
+_transposeMasks = {}
+
+# Reverse the bits of a byte - rows are MSB first, pages LSB first. XBM rows are LSB first.
+_reverseBits = bytes(bytearray(int('{:08b}'.format(b)[::-1], 2) for b in range(256)))
+
+def _transpose_blocks(data):
+
+    # data is a series of 8 byte blocks, each 8 rows of 8 bits, MSB first. Returns the
+    # blocks transposed - byte n of a block is bit 7-n of each byte, MSB first.
+    nBlocks = len(data)//8
+
+    masks = _transposeMasks.get(nBlocks)
+    if masks is None:
+        masks = [(shift, int.from_bytes(mask * nBlocks, 'big')) for shift, mask in _transposeSteps]
+        _transposeMasks[nBlocks] = masks
+
+    x = int.from_bytes(data, 'big')
+    for shift, mask in masks:
+        t = (x ^ (x >> shift)) & mask
+        x ^= t ^ (t << shift)
+
+    return x.to_bytes(len(data), 'big')
+
+#-----------------------------------------
+def rows_to_pages(data, width, height):
+    """
+        Convert a 1 bit image in row format (MSB first, each row padded to a whole byte) to
+        page format.
+
+        :param data: The image in row format
+        :param width: The width of the image in pixels
+        :param height: The height of the image in pixels
+
+        :return: The image in page format - width * pages bytes
+        :rtype: bytes
+
+    """
+
+    data = bytes(bytearray(data))
+    stride = (width + 7)//8
+    pages = (height + 7)//8
+
+    # interleave the 8 rows of each page, so each 8 columns of a page are one block
+    blocks = bytearray(pages * stride * 8)
+    for row in range(height):
+        iStart = (row//8) * stride * 8 + row % 8
+        blocks[iStart:iStart + stride * 8:8] = data[row * stride:(row + 1) * stride]
+
+    # after the transpose each byte is a column, with the top pixel in the high bit
+    columns = _transpose_blocks(bytes(blocks)).translate(_reverseBits)
+
+    return b''.join(columns[page * stride * 8:page * stride * 8 + width] for page in range(pages))
+
+#-----------------------------------------
+def pages_to_rows(data, width, height):
+    """
+        Convert a page format bitmap to a 1 bit image in row format (MSB first, each row
+        padded to a whole byte).
+
+        :param data: The bitmap in page format
+        :param width: The width of the bitmap in pixels
+        :param height: The height of the bitmap in pixels
+
+        :return: The image in row format - ((width + 7)//8) * height bytes
+        :rtype: bytes
+
+    """
+
+    data = bytes(bytearray(data))
+    stride = (width + 7)//8
+    pages = (height + 7)//8
+    pad = bytes(stride * 8 - width)
+
+    # pad each page to whole blocks, with the top pixel of each column in the high bit
+    columns = b''.join(data[page * width:(page + 1) * width] + pad for page in range(pages)).translate(_reverseBits)
+
+    # after the transpose each block is the 8 rows of 8 columns of a page
+    blocks = _transpose_blocks(columns)
+
+    return b''.join(blocks[(row//8) * stride * 8 + row % 8:((row//8) + 1) * stride * 8:8] for row in range(height))
+
+#-----------------------------------------
+# Expand each bit of a byte to n bits, MSB first - for scaling rows. n -> table
+_scaleTables = {}
+
+def scale_rows(data, width, height, scale):
+    """
+        Scale a 1 bit image in row format by a whole number.
+
+        :param data: The image in row format
+        :param width: The width of the image in pixels
+        :param height: The height of the image in pixels
+        :param scale: The scale, 1 or more
+
+        :return: The scaled image in row format - it is scale times the width and height
+        :rtype: bytes
+
+    """
+
+    data = bytes(bytearray(data))
+    if scale == 1:
+        return data
+
+    table = _scaleTables.get(scale)
+    if table is None:
+        table = [int(''.join(c * scale for c in '{:08b}'.format(b)), 2).to_bytes(scale, 'big') for b in range(256)]
+        _scaleTables[scale] = table
+
+    stride = (width + 7)//8
+    outStride = (width * scale + 7)//8
+    expand = table.__getitem__
+
+    rows = []
+    for row in range(height):
+        line = b''.join(map(expand, data[row * stride:(row + 1) * stride]))[:outStride]
+        rows.extend([line] * scale)
+
+    return b''.join(rows)
+
+#-----------------------------------------
+# File formats
+
+def load_raw(path, width, height):
+    """
+        Load a raw 1 bit image file in row format (MSB first, each row padded to a whole byte).
+
+        :param path: Path of the file
+        :param width: The width of the image in pixels
+        :param height: The height of the image in pixels
+
+        :return: The image in page format
+        :rtype: bytes
+
+    """
+
+    with open(path, 'rb') as fp:
+        data = fp.read()
+
+    if len(data) < ((width + 7)//8) * height:
+        raise ValueError("Raw image file is too small for %dx%d: %s" % (width, height, path))
+
+    return rows_to_pages(data, width, height)
+
+def _pbm_tokens(data, count):
+
+    # the header fields of a PBM file, skipping white space and comments
+    tokens = []
+    iPos = 0
+    while len(tokens) < count:
+        while data[iPos:iPos+1].isspace():
+            iPos += 1
+        if data[iPos:iPos+1] == b'#':
+            iPos = data.index(b'\n', iPos) + 1
+            continue
+        iStart = iPos
+        while iPos < len(data) and not data[iPos:iPos+1].isspace() and data[iPos:iPos+1] != b'#':
+            iPos += 1
+        if iStart == iPos:
+            raise ValueError("Invalid PBM header")
+        tokens.append(data[iStart:iPos])
+
+    # a single white space character ends the header
+    return tokens, iPos + 1
+
+def parse_pbm(data):
+    """
+        Parse a PBM (portable bitmap) image - binary (P4) or plain (P1). Black pixels (set bits)
+        are lit.
+
+        :param data: The contents of the PBM file
+        :return: width, height and the image in page format
+        :rtype: tuple
+
+    """
+
+    tokens, iStart = _pbm_tokens(data, 3)
+    magic, width, height = tokens[0], int(tokens[1]), int(tokens[2])
+
+    if magic == b'P4':
+        return width, height, rows_to_pages(data[iStart:], width, height)
+
+    if magic == b'P1':
+        bits = bytes(bytearray(int(c) for c in data[iStart:].decode('ascii') if c in '01'))
+        stride = (width + 7)//8
+        rows = bytearray()
+        for row in range(height):
+            line = bits[row * width:(row + 1) * width] + bytes(stride * 8 - width)
+            rows += int(''.join('1' if b else '0' for b in line), 2).to_bytes(stride, 'big')
+        return width, height, rows_to_pages(rows, width, height)
+
+    raise ValueError("Not a PBM image")
+
+def load_pbm(path):
+    """
+        Load a PBM (portable bitmap) file - binary (P4) or plain (P1). Black pixels are lit.
+
+        :param path: Path of the file
+        :return: width, height and the image in page format
+        :rtype: tuple
+
+    """
+
+    with open(path, 'rb') as fp:
+        return parse_pbm(fp.read())
+
+def pages_to_pbm(data, width, height):
+    """
+        Convert a page format bitmap to a binary PBM (P4) image. Lit pixels are black.
+
+        :param data: The bitmap in page format
+        :param width: The width of the bitmap in pixels
+        :param height: The height of the bitmap in pixels
+
+        :return: The PBM file contents
+        :rtype: bytes
+
+    """
+    return b'P4\n%d %d\n' % (width, height) + pages_to_rows(data, width, height)
+
+def rows_to_png(data, width, height):
+    """
+        Convert a 1 bit image in row format to a PNG image (1 bit grayscale). Lit pixels are
+        white.
+
+        :param data: The image in row format
+        :param width: The width of the image in pixels
+        :param height: The height of the image in pixels
+
+        :return: The PNG file contents
+        :rtype: bytes
+
+    """
+
+    stride = (width + 7)//8
+
+    # each row starts with its filter type - 0, none
+    raw = b''.join(b'\x00' + data[row * stride:(row + 1) * stride] for row in range(height))
+
+    def chunk(kind, body):
+        return struct.pack('>I', len(body)) + kind + body + struct.pack('>I', zlib.crc32(kind + body) & 0xFFFFFFFF)
+
+    return (b'\x89PNG\r\n\x1a\n' +
+            chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 1, 0, 0, 0, 0)) +
+            chunk(b'IDAT', zlib.compress(raw, 9)) +
+            chunk(b'IEND', b''))
+
+def parse_xbm(text):
+    """
+        Parse an XBM (X bitmap) image - the C source format. Set bits are lit.
+
+        :param text: The contents of the XBM file
+        :return: width, height and the image in page format
+        :rtype: tuple
+
+    """
+
+    if isinstance(text, bytes):
+        text = text.decode('ascii')
+
+    width = height = None
+    for line in text.splitlines():
+        fields = line.split()
+        if len(fields) == 3 and fields[0] == '#define':
+            if fields[1].endswith('_width'):
+                width = int(fields[2])
+            elif fields[1].endswith('_height'):
+                height = int(fields[2])
+
+    if width is None or height is None or '{' not in text:
+        raise ValueError("Not an XBM image")
+
+    values = text[text.index('{') + 1:text.rindex('}')].replace(',', ' ').split()
+    rows = bytes(bytearray(int(value, 16) for value in values)).translate(_reverseBits)
+
+    return width, height, rows_to_pages(rows, width, height)
+
+def load_xbm(path):
+    """
+        Load an XBM (X bitmap) file. Set bits are lit.
+
+        :param path: Path of the file
+        :return: width, height and the image in page format
+        :rtype: tuple
+
+    """
+
+    with open(path, 'r') as fp:
+        return parse_xbm(fp.read())
@@ -0,0 +1,212 @@
+#-----------------------------------------------------------------------------
+# oled_canvas.py
+#
+# A numpy canvas for the OLED display
+#
+#------------------------------------------------------------------------
+#
+# Written by  SparkFun Electronics, October 2026
+#
+# This python library supports the SparkFun Electroncis qwiic
+# qwiic sensor/board ecosystem on a Raspberry Pi (and compatable) single
+# board computers.
+#
+# More information on qwiic is at https://www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#
+#==================================================================================
+# Copyright (c) 2026 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#==================================================================================
+#
+#
+# Drawing a frame with pixel() is a python call per pixel. A numpy canvas is a
+# 2D array (height x width) of the screen - fills, masks, XOR, shifts and
+# compositing are whole array operations, and code that already works with numpy
+# (plots, overlays) draws into it directly. Nonzero elements are lit pixels.
+#
+# The canvas is packed into the page format of the screen buffer just before it
+# is sent, by display(). Only the blocks that changed are sent, as usual.
+#
+# The canvas replaces the screen buffer when packed. To combine with the drawing
+# methods of the display (text, lines ...), unpack() the screen buffer into the
+# canvas first, or draw on the display after pack().
+#
+#   canvas = NumpyCanvas(oled)
+#   canvas.array[16:32, :] = True
+#   canvas.array ^= mask
+#   canvas.display()
+#
+
+from . import oled_image
+from .oled_image import np, _need_numpy
+
+#-----------------------------------------
+class NumpyCanvas(object):
+    """
+    NumpyCanvas
+
+        :param oled: The display (QwiicOledBase) the canvas is drawn on
+        :param dtype: The element type of the canvas - bool (default) or uint8
+        :return: The canvas object
+        :rtype: Object
+    """
+
+    def __init__(self, oled, dtype=None):
+
+        _need_numpy()
+
+        self._oled = oled
+        self.width = oled.get_lcd_width()
+        self.height = oled.get_lcd_height()
+
+        # the pixels, height x width - nonzero is lit
+        self.array = np.zeros((self.height, self.width), dtype=dtype or np.bool_)
+
+    def pack(self):
+        """
+            Pack the canvas into the screen buffer of the display. In thread safe mode (see
+            QwiicOledBase.thread_safe()), the pages are locked while the buffer is written.
+
+            :return: No return value
+
+        """
+
+        array = self.array
+        if array.dtype != np.bool_:
+            array = array != 0
+
+        bitmap, _ = oled_image.pack_pages(array)
+        self._oled._write_screen(bitmap) # pylint: disable=protected-access
+
+    def unpack(self):
+        """
+            Load the screen buffer of the display into the canvas.
+
+            :return: No return value
+
+        """
+
+        oled = self._oled
+        screen = oled.get_screenbuffer() if oled._pageLocks is None else oled._copy_screen() # pylint: disable=protected-access
+        self.array[:] = oled_image.unpack_pages(screen, self.width, self.height)
+
+    def display(self):
+        """
+            Pack the canvas into the screen buffer and send it to the display.
+
+            :return: No return value
+
+        """
+        self.pack()
+        self._oled.display()
+
+    #--------------------------------------------------------------------------
+    # Whole array drawing
+
+    def clear(self, value=0):
+        """
+            Set every pixel of the canvas.
+
+            :param value: The pixel value - 0 is off
+            :return: No return value
+
+        """
+        self.array.fill(value)
+
+    def blit(self, src, x=0, y=0, op='copy', mask=None):
+        """
+            Composite an array into the canvas, clipped at the canvas edges.
+
+            :param src: The array to draw - 2D, nonzero is lit
+            :param x: The X position of the array in the canvas
+            :param y: The Y position of the array in the canvas
+            :param op: 'copy', 'or', 'and' or 'xor'
+            :param mask: Optional array, the size of src - only the pixels where the mask is
+                        nonzero are changed
+
+            :return: No return value
+
+        """
+
+        src = np.asarray(src)
+        srcHeight, srcWidth = src.shape
+
+        x0, y0 = max(0, x), max(0, y)
+        x1, y1 = min(self.width, x + srcWidth), min(self.height, y + srcHeight)
+        if x1 <= x0 or y1 <= y0:
+            return
+
+        dst = self.array[y0:y1, x0:x1]
+        part = src[y0-y:y1-y, x0-x:x1-x].astype(self.array.dtype)
+
+        if op == 'or':
+            part = dst | part
+        elif op == 'and':
+            part = dst & part
+        elif op == 'xor':
+            part = dst ^ part
+        elif op != 'copy':
+            raise ValueError("Unknown blit operation '%s'" % op)
+
+        if mask is None:
+            dst[...] = part
+        else:
+            select = np.asarray(mask)[y0-y:y1-y, x0-x:x1-x] != 0
+            dst[select] = part[select]
+
+    def shift(self, dx, dy, fill=0):
+        """
+            Scroll the canvas contents - pixels shifted off the canvas are lost, and the
+            pixels uncovered are set to fill.
+
+            :param dx: Pixels to shift right (negative shifts left)
+            :param dy: Pixels to shift down (negative shifts up)
+            :param fill: The value of the uncovered pixels
+
+            :return: No return value
+
+        """
+
+        out = np.full_like(self.array, fill)
+
+        srcX = slice(max(0, -dx), min(self.width, self.width - dx))
+        srcY = slice(max(0, -dy), min(self.height, self.height - dy))
+        dstX = slice(max(0, dx), min(self.width, self.width + dx))
+        dstY = slice(max(0, dy), min(self.height, self.height + dy))
+
+        if srcX.start < srcX.stop and srcY.start < srcY.stop:
+            out[dstY, dstX] = self.array[srcY, srcX]
+
+        self.array[...] = out
+
+    def invert(self):
+        """
+            Invert every pixel of the canvas.
+
+            :return: No return value
+
+        """
+
+        if self.array.dtype == np.bool_:
+            np.logical_not(self.array, out=self.array)
+        else:
+            self.array[...] = self.array == 0
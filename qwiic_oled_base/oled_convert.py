@@ -0,0 +1,234 @@
+#-----------------------------------------------------------------------------
+# oled_convert.py
+#
+# Convert animated GIFs and image sequences to OLED animation files
+#
+#------------------------------------------------------------------------
+#
+# Written by  SparkFun Electronics, October 2026
+#
+# This python library supports the SparkFun Electroncis qwiic
+# qwiic sensor/board ecosystem on a Raspberry Pi (and compatable) single
+# board computers.
+#
+# More information on qwiic is at https://www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#
+#==================================================================================
+# Copyright (c) 2026 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#==================================================================================
+#
+#
+# The converter scales each frame to the display size, dithers it to one bit per
+# pixel, packs it into the page format of the screen buffer and writes the frames
+# as an animation file (see oled_animation.py), ready for AnimationPlayer.
+#
+# Dithering is the slow part, and each frame is independent - frames are converted
+# in a pool of processes. Each worker is sent a file path and a range of frames, and
+# reads the frames itself - frames are never decoded in the main process and
+# pickled to the workers.
+#
+# The converter uses the Pillow imaging library (pip install Pillow), which is only
+# needed to convert - not to play the animations.
+#
+#   qwiic-oled-convert clip.gif -o clip.qola --size 128x64
+#   qwiic-oled-convert frame_*.png -o clip.qola --size 64x48 --fps 15
+#
+
+from __future__ import print_function
+
+import os
+import sys
+import argparse
+
+from concurrent.futures import ProcessPoolExecutor
+
+from . import oled_bitmap
+from . import oled_animation
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:
+    Image = None
+
+# The display sizes of the qwiic OLED boards
+SIZES = [(64, 48), (128, 32), (128, 64)]
+
+#-----------------------------------------
+def _need_pillow():
+
+    if Image is None:
+        raise ImportError("The Pillow library is needed to convert images - pip install Pillow")
+
+#-----------------------------------------
+def image_to_pages(img):
+    """
+        Pack a one bit image (Pillow mode '1') into the page format of the screen buffer.
+        Lit pixels are set bits.
+
+        :param img: The image
+        :return: The image in page format - width * pages bytes
+        :rtype: bytes
+
+    """
+
+    # Pillow packs a one bit image in row format - MSB first, each row padded to a whole byte
+    width, height = img.size
+    return oled_bitmap.rows_to_pages(img.tobytes(), width, height)
+
+#-----------------------------------------
+def convert_frame(frame, width, height, dither=True, threshold=128, invert=False):
+    """
+        Convert one frame - scale it to fit the display (keeping the aspect ratio, centered on
+        black), convert it to one bit per pixel and pack it into page format.
+
+        :param frame: The frame - a Pillow image
+        :param width: The display width in pixels
+        :param height: The display height in pixels
+        :param dither: If True, the frame is dithered (Floyd-Steinberg), otherwise thresholded
+        :param threshold: The threshold (0-255) for a lit pixel, if not dithered
+        :param invert: If True, dark pixels of the frame are lit
+
+        :return: The frame in page format
+        :rtype: bytes
+
+    """
+
+    _need_pillow()
+
+    gray = frame.convert('L')
+    if invert:
+        gray = ImageOps.invert(gray)
+
+    gray = ImageOps.contain(gray, (width, height), Image.LANCZOS)
+
+    screen = Image.new('L', (width, height), 0)
+    screen.paste(gray, ((width - gray.size[0])//2, (height - gray.size[1])//2))
+
+    if dither:
+        mono = screen.convert('1', dither=Image.FLOYDSTEINBERG)
+    else:
+        mono = screen.point(lambda value: 255 if value >= threshold else 0).convert('1', dither=Image.NONE)
+
+    return image_to_pages(mono)
+
+# Convert a range of frames of an image file - run in the worker processes
+def _convert_range(args):
+
+    source, iStart, nFrames, width, height, dither, threshold, invert = args
+
+    pages = []
+    with Image.open(source) as img:
+        for iFrame in range(iStart, iStart + nFrames):
+            img.seek(iFrame)
+            pages.append(convert_frame(img, width, height, dither, threshold, invert))
+
+    return pages
+
+#-----------------------------------------
+def convert(sources, output, width=128, height=64, fps=None, dither=True, threshold=128, invert=False, workers=None):
+    """
+        Convert an animated GIF, or a sequence of images, to an animation file.
+
+        :param sources: List of image file paths
+        :param output: Path of the animation file
+        :param width: The display width in pixels
+        :param height: The display height in pixels
+        :param fps: The frame rate, a whole number. Default is the frame rate of a GIF (rounded), or 10.
+        :param dither: If True, the frames are dithered, otherwise thresholded
+        :param threshold: The threshold (0-255) for a lit pixel, if not dithered
+        :param invert: If True, dark pixels are lit
+        :param workers: Number of worker processes. Default is the number of CPUs.
+
+        :return: The number of frames
+        :rtype: integer
+
+    """
+
+    _need_pillow()
+
+    # the number of frames of each source - read from the headers, the frames are not decoded
+    counts = []
+    duration = None
+    for source in sources:
+        with Image.open(source) as img:
+            counts.append(getattr(img, 'n_frames', 1))
+            if duration is None and img.info.get('duration'):
+                duration = img.info['duration']
+
+    if fps is not None:
+        oled_animation._check_fps(fps) # pylint: disable=protected-access
+
+    nFrames = sum(counts)
+    if not nFrames:
+        raise ValueError("No frames to convert")
+
+    if fps is None:
+        fps = max(1, int(round(1000.0 / duration))) if duration else 10
+
+    # a few ranges per worker, so the work is shared evenly
+    nRange = max(1, -(-nFrames // ((workers or os.cpu_count() or 1) * 4)))
+    jobs = [(source, iStart, min(nRange, count - iStart), width, height, dither, threshold, invert)
+            for source, count in zip(sources, counts) for iStart in range(0, count, nRange)]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pages = [frame for frames in executor.map(_convert_range, jobs) for frame in frames]
+
+    oled_animation.write_animation(output, width, height, pages, fps)
+
+    return len(pages)
+
+#-----------------------------------------
+# Converter entry point
+
+def main(argv=None):
+    """
+        Convert images to an OLED animation file.
+
+        usage: qwiic-oled-convert SOURCE... -o OUTPUT [--size WIDTHxHEIGHT] [--fps FPS] [--threshold N] [--invert] [--workers N]
+
+    """
+
+    parser = argparse.ArgumentParser(description="Convert an animated GIF or image sequence to a SparkFun qwiic OLED animation")
+    parser.add_argument('sources', nargs='+', help="an animated GIF, or the images of the sequence in order")
+    parser.add_argument('-o', '--output', required=True, help="path of the animation file")
+    parser.add_argument('--size', default='128x64', choices=['%dx%d' % size for size in SIZES], help="display size")
+    parser.add_argument('--fps', type=int, default=None, help="frames per second. Default is the GIF frame rate, or 10")
+    parser.add_argument('--threshold', type=int, default=None, help="threshold each pixel at this level (0-255), instead of dithering")
+    parser.add_argument('--invert', action='store_true', help="light the dark pixels")
+    parser.add_argument('--workers', type=int, default=None, help="number of worker processes")
+    args = parser.parse_args(argv)
+
+    width, height = [int(value) for value in args.size.split('x')]
+
+    try:
+        nFrames = convert(args.sources, args.output, width, height, args.fps, dither=args.threshold is None,
+                          threshold=128 if args.threshold is None else args.threshold, invert=args.invert, workers=args.workers)
+    except (ImportError, IOError, ValueError) as exError:
+        print("Conversion failed: %s" % exError, file=sys.stderr)
+        return 1
+
+    print("%d frames written to %s" % (nFrames, args.output))
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
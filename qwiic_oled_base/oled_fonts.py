@@ -42,18 +42,26 @@ import sys
 import os
 
 import math
+import struct
+import itertools
+from bisect import bisect_left
+
+from . import oled_bitmap
 
 # Define storage for fonts
 
 # map - map font index to font name
 _fontIndexMap=[]
 
-# font cache - maps name to font data
-_fontCacheIndex = -1
-_fontCache=None
+# font cache - maps font index to font data. Fonts stay loaded, so their glyph
+# atlas is kept when switching between fonts.
+_fontCache={}
 
 _isInited = False
 
+# font serial numbers - identify a font in caches. Unlike id(), a serial number is never reused
+_fontSerials = itertools.count(1)
+
 
 
 #-----------------------------------------
@@ -67,11 +75,19 @@ class OLEDFont():
 		self.start_char = 0
 		self.total_char = 0
 		self.map_width = 0
+		self.cell_width = 0
 
 		# The font data is chunked - broken up into characters within a dictionary
 		# Good for memory state (fragementation), but slightly slower.
 		self._fontData = []
 
+		# glyph atlas - maps (character, shift) to the shifted glyph bitmaps. Built lazily
+		self._atlas = {}
+		self.atlas_hits = 0
+		self.atlas_misses = 0
+
+		self.serial = next(_fontSerials)
+
 		self._loadFontFile(fontFile)
 
 	def _loadFontFile(self, fontFile):
@@ -112,6 +128,9 @@ class OLEDFont():
 		# buffer padding bytes
 		bBuffer = bytearray(nPad)
 
+		# the width of a drawn character, including any pad
+		self.cell_width = self.width + nPad
+
 		# read in font
 		for iChar in range(self.total_char * rowsPerChar):
 
@@ -129,6 +148,91 @@ class OLEDFont():
 		fp.close()
 
 
+	# Return the font data for character c, one entry per row (page) of the character.
+	# Returns None if the font has no bitmap for c
+
+	def glyph(self, c):
+
+		if c < self.start_char or c > (self.start_char + self.total_char - 1):
+			return None
+
+		tempC = c - self.start_char
+
+		# each row (in datasheet is call page) is 8 bits high, 16 bit high character will have 2 rows
+		rowsToDraw = max(1, self.height//8)
+
+		# figure out position of the character in the font map. integer math is key here
+		charPerRow = self.map_width // self.width
+
+		rowPos = tempC // charPerRow  # the number of full rows to skip
+		colPos = tempC % charPerRow # the number of chars into the last
+		iStart = rowPos * charPerRow * self.height//8 + colPos
+
+		return [self._fontData[iStart + row * charPerRow] for row in range(rowsToDraw)]
+
+	# Return the font data for the unicode character with code point cp. The contiguous
+	# fonts are indexed by byte value - only the ASCII range matches unicode.
+
+	def unicode_glyph(self, cp):
+
+		if cp > 0x7F:
+			return None
+
+		return self.glyph(cp)
+
+	# Return the glyph for character c (a font index or a unicode character) shifted down
+	# by 0-7 pixels, in page format. Returns (glyph bits, cell mask, width, pages), or
+	# None if the font has no bitmap for c.
+	#
+	# A glyph drawn at a y that is not a multiple of 8 straddles two pages. The shifted
+	# glyphs are built the first time they are drawn and kept in the font's atlas, so
+	# drawing a glyph at any y is a mask and copy of ready made bytes.
+
+	def shifted_glyph(self, c, shift):
+
+		key = (c, shift)
+
+		bitmaps = self._atlas.get(key)
+		if bitmaps is None:
+
+			self.atlas_misses += 1
+
+			rows = self.unicode_glyph(ord(c)) if isinstance(c, str) else self.glyph(c)
+			if rows is None:
+				return None
+
+			width = len(rows[0])
+			pages = len(rows)
+			ink = b''.join(bytes(row) for row in rows)
+
+			bitmaps = (oled_bitmap.shift_pages(ink, width, pages, shift),
+					   oled_bitmap.shift_pages(b'\xff' * len(ink), width, pages, shift),
+					   width, pages + (1 if shift else 0))
+
+			self._atlas[key] = bitmaps
+
+		else:
+			self.atlas_hits += 1
+
+		return bitmaps
+
+	# Drop the glyph atlas of this font
+
+	def clear_atlas(self):
+
+		self._atlas = {}
+
+	# The glyph atlas statistics - hits, misses, entries and hit_rate
+
+	def atlas_stats(self):
+
+		lookups = self.atlas_hits + self.atlas_misses
+
+		return {'hits': self.atlas_hits,
+				'misses': self.atlas_misses,
+				'entries': len(self._atlas),
+				'hit_rate': (self.atlas_hits / float(lookups)) if lookups else 0.0}
+
 	# method to override [] access for this object. 
 	#
 	# key => character index into the data. 
@@ -143,6 +247,128 @@ class OLEDFont():
 		return self._fontData[key]
 
 
+#-----------------------------------------
+# Sparse Font Object - a font with glyphs for a set of unicode code points
+#
+# File Structure
+#	bytes 0-1	0x00 0x00 - marks a sparse font (a contiguous font never has a 0 width)
+#	byte  2		width
+#	byte  3		height
+#	bytes 4-5	number of glyphs (N), big endian
+#	N * 4 bytes	the code points of the glyphs, sorted, big endian
+#	glyph data	for each glyph, the rows (pages) of the glyph, width bytes per row
+#
+# The code points are kept in a sorted list, and looked up with a binary search.
+
+_SPARSE_MAGIC = b'\x00\x00'
+
+class SparseOLEDFont(OLEDFont):
+
+	def __init__(self, fontFile):
+
+		# sorted list of the code points in the font
+		self.code_points = []
+
+		OLEDFont.__init__(self, fontFile)
+
+	def _loadFontFile(self, fontFile):
+
+		fp = None
+
+		try:
+			fp = open(fontFile, 'rb')
+
+		except Exception as exError:
+			print("Error opening font file: %s" % fontFile)
+
+			raise exError
+
+		try:
+			fHeader = bytearray(fp.read(6))
+			self.width 		= fHeader[2]
+			self.height 	= fHeader[3]
+			nGlyphs = fHeader[4] << 8 | fHeader[5]
+
+			self.code_points = list(struct.unpack('>%dI' % nGlyphs, fp.read(4 * nGlyphs)))
+
+			# rows (pages) per glyph - a partial last page is stored whole
+			self._rowsPerChar = int(math.ceil(self.height/8.))
+
+			# single row fonts have no margin encoded - add a pad byte, like the contiguous fonts
+			bBuffer = bytearray((self._rowsPerChar == 1)*1)
+			self.cell_width = self.width + len(bBuffer)
+
+			self._fontData = [bytearray(fp.read(self.width)) + bBuffer for _ in range(nGlyphs * self._rowsPerChar)]
+
+		except Exception as exError:
+			print("Error reading sparse font file: %s" % fontFile)
+
+			fp.close()
+			raise exError
+
+		fp.close()
+
+		self.start_char = self.code_points[0] if nGlyphs else 0
+		self.total_char = nGlyphs
+		self.map_width = self.width * nGlyphs
+
+	def glyph(self, c):
+
+		iGlyph = bisect_left(self.code_points, c)
+		if iGlyph == len(self.code_points) or self.code_points[iGlyph] != c:
+			return None
+
+		return self._fontData[iGlyph * self._rowsPerChar:(iGlyph + 1) * self._rowsPerChar]
+
+	def unicode_glyph(self, cp):
+
+		return self.glyph(cp)
+
+#-----------------------------------------
+def load_font(fontFile):
+	"""
+		Load a font from a file. The file can be a contiguous (.bin) font, or a sparse font.
+
+		:param fontFile: Path of the font file
+		:return: The font
+		:rtype: OLEDFont
+
+	"""
+
+	with open(fontFile, 'rb') as fp:
+		magic = fp.read(len(_SPARSE_MAGIC))
+
+	if magic == _SPARSE_MAGIC:
+		return SparseOLEDFont(fontFile)
+
+	return OLEDFont(fontFile)
+
+def write_sparse_font(fontFile, width, height, glyphs):
+	"""
+		Write a sparse font file.
+
+		:param fontFile: Path of the font file to write
+		:param width: The width of the characters in pixels
+		:param height: The height of the characters in pixels
+		:param glyphs: Maps code point (or character) to the glyph data - the rows (pages)
+			of the glyph, width bytes per row
+		:return: No return value
+
+	"""
+
+	rowsPerChar = int(math.ceil(height/8.))
+
+	cPoints = sorted((ord(c) if isinstance(c, str) else c, bytes(bytearray(data))) for c, data in glyphs.items())
+
+	with open(fontFile, 'wb') as fp:
+		fp.write(_SPARSE_MAGIC + struct.pack('>BBH', width, height, len(cPoints)))
+		fp.write(struct.pack('>%dI' % len(cPoints), *[cp for cp, _ in cPoints]))
+
+		for cp, data in cPoints:
+			if len(data) != width * rowsPerChar:
+				raise ValueError("Invalid glyph size for code point %d" % cp)
+			fp.write(data)
+
 # handy util
 
 def _getFontDir():
@@ -227,18 +453,15 @@ def font_names():
 
 def get_font(iFont):
 
-	global _fontCache, _fontCacheIndex
-
 	if not _isInited:
 		_initFontSystem()
 
-	if iFont != _fontCacheIndex:
-
-		fFont = _getFontDir() + os.sep + str(iFont) + '_' + _fontIndexMap[iFont] + '.bin'
+	fFont = _fontCache.get(iFont)
+	if fFont is None:
 
-		_fontCache = OLEDFont(fFont)
-		_fontCacheIndex = iFont
+		fFont = load_font(_getFontDir() + os.sep + str(iFont) + '_' + _fontIndexMap[iFont] + '.bin')
+		_fontCache[iFont] = fFont
 
-	return _fontCache
+	return fFont
 
 
@@ -0,0 +1,179 @@
+#-----------------------------------------------------------------------------
+# oled_framemap.py
+#
+# Memory mapped frame files for the OLED display
+#
+#------------------------------------------------------------------------
+#
+# Written by  SparkFun Electronics, October 2026
+#
+# This python library supports the SparkFun Electroncis qwiic
+# qwiic sensor/board ecosystem on a Raspberry Pi (and compatable) single
+# board computers.
+#
+# More information on qwiic is at https://www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#
+#==================================================================================
+# Copyright (c) 2026 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#==================================================================================
+#
+# A frame map is a file that holds the screen buffer and the shadow buffer (what
+# the display is showing) of a display. The buffers of the display object are
+# memory mapped onto the file, so the file is always up to date, at no cost. Put
+# the file on a RAM backed file system (/dev/shm, /run).
+#
+# After a crash or restart, the display object maps the same file and knows what
+# is on the display. Other processes can read the file to see what the display
+# shows, without touching the I2C bus.
+#
+# File Structure
+#   bytes 0-3       'QOLF'
+#   byte  4         version (1)
+#   byte  5         flags - bit 0 is set if the shadow buffer matches the display
+#   bytes 6-7       width in pixels, little endian
+#   bytes 8-9       height in pixels, little endian
+#   bytes 10-11     reserved
+#   bytes 12-15     frame sequence number, little endian. Incremented each time
+#                   a transfer to the display completes.
+#   N bytes         the screen buffer, in page format (N = width * pages)
+#   N bytes         the shadow buffer, in page format
+#
+
+import os
+import mmap
+import struct
+
+_MAGIC = b'QOLF'
+_VERSION = 1
+
+_HEADER = struct.Struct('<4sBBHHHI')
+HEADER_SIZE = _HEADER.size
+
+FLAG_SHADOW_VALID = 0x01
+
+_FLAGS_OFFSET = 5
+_SEQUENCE = struct.Struct('<I')
+_SEQUENCE_OFFSET = 12
+
+#-----------------------------------------
+# The frame map of one display
+
+class FrameMap(object):
+
+    def __init__(self, path, width, height):
+
+        self.path = path
+        self.width = width
+        self.height = height
+
+        nBytes = width * ((height + 7)//8)
+        size = HEADER_SIZE + 2 * nBytes
+
+        # was there a valid frame map for this display size?
+        self.restored = False
+
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if os.fstat(fd).st_size == size:
+                header = _HEADER.unpack(os.pread(fd, HEADER_SIZE, 0))
+                self.restored = (header[0] == _MAGIC and header[1] == _VERSION and
+                                 header[3] == width and header[4] == height)
+            else:
+                os.ftruncate(fd, size)
+
+            self._mmap = mmap.mmap(fd, size)
+        finally:
+            os.close(fd)
+
+        if not self.restored:
+            self._mmap[:HEADER_SIZE] = _HEADER.pack(_MAGIC, _VERSION, 0, width, height, 0, 0)
+
+        view = memoryview(self._mmap)
+        self.screen = view[HEADER_SIZE:HEADER_SIZE+nBytes]
+        self.shadow = view[HEADER_SIZE+nBytes:HEADER_SIZE+2*nBytes]
+        view.release()
+
+    def _get_shadow_valid(self):
+        return bool(self._mmap[_FLAGS_OFFSET] & FLAG_SHADOW_VALID)
+
+    def _set_shadow_valid(self, valid):
+        if valid:
+            self._mmap[_FLAGS_OFFSET] |= FLAG_SHADOW_VALID
+        else:
+            self._mmap[_FLAGS_OFFSET] &= ~FLAG_SHADOW_VALID & 0xFF
+
+    shadow_valid = property(_get_shadow_valid, _set_shadow_valid)
+
+    def _get_sequence(self):
+        return _SEQUENCE.unpack_from(self._mmap, _SEQUENCE_OFFSET)[0]
+
+    sequence = property(_get_sequence)
+
+    def frame_done(self):
+        """
+            Mark the shadow buffer as valid and advance the frame sequence number.
+
+            :return: No return value
+
+        """
+
+        self.shadow_valid = True
+        _SEQUENCE.pack_into(self._mmap, _SEQUENCE_OFFSET, (self.sequence + 1) & 0xFFFFFFFF)
+
+    def close(self):
+        """
+            Release the buffers and close the map. The file is left in place.
+
+            :return: No return value
+
+        """
+
+        self.screen.release()
+        self.shadow.release()
+        self._mmap.close()
+
+#-----------------------------------------
+def read_frame_map(path):
+    """
+        Read a frame map file - for tools that show what a display is showing.
+
+        :param path: Path of the frame map file
+
+        :return: width, height, screen buffer, shadow buffer (None if the shadow is not valid)
+                and the frame sequence number
+        :rtype: tuple
+
+    """
+
+    with open(path, 'rb') as fp:
+        data = fp.read()
+
+    magic, version, flags, width, height, _, sequence = _HEADER.unpack_from(data, 0)
+    if magic != _MAGIC or version != _VERSION:
+        raise ValueError("Not an OLED frame map file: %s" % path)
+
+    nBytes = width * ((height + 7)//8)
+    screen = data[HEADER_SIZE:HEADER_SIZE+nBytes]
+    shadow = data[HEADER_SIZE+nBytes:HEADER_SIZE+2*nBytes] if flags & FLAG_SHADOW_VALID else None
+
+    return width, height, screen, shadow, sequence
@@ -0,0 +1,329 @@
+#-----------------------------------------------------------------------------
+# oled_image.py
+#
+# Import images into the OLED screen buffer - dithering and packing with numpy
+#
+#------------------------------------------------------------------------
+#
+# Written by  SparkFun Electronics, October 2026
+#
+# This python library supports the SparkFun Electroncis qwiic
+# qwiic sensor/board ecosystem on a Raspberry Pi (and compatable) single
+# board computers.
+#
+# More information on qwiic is at https://www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#
+#==================================================================================
+# Copyright (c) 2026 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#==================================================================================
+#
+#
+# Converts a Pillow image or a numpy array to one bit per pixel, then packs it into
+# the page format of the screen buffer. The conversion works on whole arrays with
+# numpy, not pixel by pixel in python. Error diffusion is sequential by nature, but
+# the pixels of each wavefront (x + 2y) don't depend on each other, so it is done a
+# wavefront at a time.
+#
+# Dithering
+#   'threshold'         a pixel is lit if its level is at or above the threshold
+#   'bayer'             ordered dither with an 8x8 Bayer matrix - stable between
+#                       frames, good for animation
+#   'floyd-steinberg'   error diffusion - the most detail
+#   'atkinson'          error diffusion that drops part of the error - more contrast,
+#                       good for small icons
+#
+# Converted images are kept in a cache, keyed by a hash of their content and the
+# conversion options, so drawing the same icon again costs a hash and a blit.
+#
+# numpy is needed (pip install numpy). Pillow images are accepted, but Pillow is
+# not needed for numpy arrays.
+#
+
+import hashlib
+
+from collections import OrderedDict
+
+from . import oled_bitmap
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+DITHER_THRESHOLD = 'threshold'
+DITHER_BAYER = 'bayer'
+DITHER_FLOYD_STEINBERG = 'floyd-steinberg'
+DITHER_ATKINSON = 'atkinson'
+
+DITHERS = [DITHER_THRESHOLD, DITHER_BAYER, DITHER_FLOYD_STEINBERG, DITHER_ATKINSON]
+
+# Error diffusion kernels - (dy, dx, weight), and the divisor of the weights
+_KERNELS = {
+    DITHER_FLOYD_STEINBERG: ([(0, 1, 7), (1, -1, 3), (1, 0, 5), (1, 1, 1)], 16.0),
+    DITHER_ATKINSON: ([(0, 1, 1), (0, 2, 1), (1, -1, 1), (1, 0, 1), (1, 1, 1), (2, 0, 1)], 8.0),
+}
+
+_CACHE_SIZE = 32
+
+#-----------------------------------------
+def _need_numpy():
+
+    if np is None:
+        raise ImportError("The numpy library is needed to draw images - pip install numpy")
+
+def _bayer(n):
+
+    matrix = np.zeros((1, 1), dtype=np.int32)
+    while matrix.shape[0] < n:
+        matrix = np.block([[4 * matrix, 4 * matrix + 2], [4 * matrix + 3, 4 * matrix + 1]])
+    return matrix
+
+#-----------------------------------------
+def to_gray(img):
+    """
+        Convert an image to an array of gray levels, 0-255.
+
+        :param img: A Pillow image, or a numpy array - 2D gray levels, 3D RGB/RGBA, boolean
+                    (True is lit) or floating point (0.0-1.0)
+        :return: The gray levels
+        :rtype: numpy array of uint8, height x width
+
+    """
+
+    _need_numpy()
+
+    if hasattr(img, 'convert') and hasattr(img, 'mode'):
+        return np.asarray(img.convert('L'), dtype=np.uint8)
+
+    array = np.asarray(img)
+
+    if array.dtype == np.bool_:
+        return array.astype(np.uint8) * 255
+
+    bFloat = np.issubdtype(array.dtype, np.floating)
+
+    if array.ndim == 3:
+        # luminance - ITU-R 601, the same weights Pillow uses
+        rgb = array[:, :, :3].astype(np.float32)
+        array = rgb[:, :, 0] * 0.299 + rgb[:, :, 1] * 0.587 + rgb[:, :, 2] * 0.114
+
+    if bFloat:
+        array = array * 255.0
+
+    if array.ndim != 2:
+        raise ValueError("An image must be 2D (gray) or 3D (RGB/RGBA)")
+
+    return np.clip(array, 0, 255).astype(np.uint8)
+
+#-----------------------------------------
+def dither(gray, method=DITHER_FLOYD_STEINBERG, threshold=128):
+    """
+        Convert gray levels to one bit per pixel.
+
+        :param gray: The gray levels, 0-255
+        :param method: The dither - 'threshold', 'bayer', 'floyd-steinberg' or 'atkinson'
+        :param threshold: The level (0-255) for a lit pixel, for 'threshold'
+
+        :return: The pixels - True is lit
+        :rtype: numpy array of bool, height x width
+
+    """
+
+    _need_numpy()
+
+    if method is None or method == DITHER_THRESHOLD:
+        return gray >= threshold
+
+    if method == DITHER_BAYER:
+        height, width = gray.shape
+        matrix = _bayer(8)
+        levels = (matrix * 4 + 2)[np.arange(height) % 8][:, np.arange(width) % 8]
+        return gray > levels
+
+    if method not in _KERNELS:
+        raise ValueError("Unknown dither '%s' - use one of %s" % (method, ', '.join(DITHERS)))
+
+    kernel, divisor = _KERNELS[method]
+    height, width = gray.shape
+
+    # Error diffusion, vectorized along wavefronts. A pixel only takes error from pixels to its
+    # left on its row, and from the rows above up to one column to its right - so all pixels
+    # with the same x + 2y are independent, and are dithered together. The result is the same
+    # as going pixel by pixel. The image is padded, so no error falls off the edges.
+    pad = 2
+    stride = width + 2 * pad
+    work = np.zeros((height + 2) * stride, dtype=np.float32)
+    work.reshape(height + 2, stride)[:height, pad:pad+width] = gray
+
+    weights = [(dy * stride + dx, np.float32(weight / divisor)) for dy, dx, weight in kernel]
+    yAll = np.arange(height)
+
+    for t in range(width + 2 * (height - 1)):
+        ys = yAll[max(0, (t - width + 2)//2):min(height - 1, t//2) + 1]
+        index = ys * stride + (t - 2 * ys) + pad
+
+        values = work[index]
+        error = values - np.float32(255.0) * (values >= 128)
+        for offset, weight in weights:
+            work[index + offset] += error * weight
+
+    # no error reaches a pixel after it is dithered - its final level decides it
+    return work.reshape(height + 2, stride)[:height, pad:pad+width] >= 128
+
+#-----------------------------------------
+def pack_pages(pixels):
+    """
+        Pack one bit pixels into page format - each byte is 8 pixels of a column, bit 0 is
+        the top pixel.
+
+        :param pixels: The pixels, height x width - True is lit
+        :return: The bitmap in page format (width * pages bytes) and the number of pages
+        :rtype: tuple
+
+    """
+
+    _need_numpy()
+
+    height, width = pixels.shape
+    pages = (height + 7)//8
+
+    if height % 8:
+        pixels = np.vstack([pixels, np.zeros((pages * 8 - height, width), dtype=pixels.dtype)])
+
+    # (pages, 8, width) -> (pages, width, 8), then pack the 8 pixels of each column
+    columns = pixels.reshape(pages, 8, width).transpose(0, 2, 1)
+    return np.packbits(columns, axis=-1, bitorder='little').tobytes(), pages
+
+#-----------------------------------------
+def unpack_pages(data, width, height):
+    """
+        Unpack a page format bitmap to one bit pixels - the reverse of pack_pages().
+
+        :param data: The bitmap in page format (width * pages bytes)
+        :param width: The width of the bitmap in pixels
+        :param height: The height of the bitmap in pixels
+
+        :return: The pixels, height x width - True is lit
+        :rtype: numpy array of bool
+
+    """
+
+    _need_numpy()
+
+    pages = (height + 7)//8
+    columns = np.frombuffer(bytes(data), dtype=np.uint8, count=width * pages).reshape(pages, width, 1)
+
+    # (pages, width, 8) -> (pages, 8, width) -> rows
+    pixels = np.unpackbits(columns, axis=-1, bitorder='little').transpose(0, 2, 1).reshape(pages * 8, width)
+    return pixels[:height].astype(np.bool_)
+
+#-----------------------------------------
+# A converted image, ready to blit
+
+class PackedImage(object):
+
+    def __init__(self, bitmap, width, height):
+
+        self.width = width
+        self.height = height
+        self.pages = (height + 7)//8
+        self.bitmap = bitmap
+
+        # the mask covers the rows of the image - the last page may be partial
+        mask = bytearray(b'\xff' * (width * self.pages))
+        if height % 8:
+            mask[-width:] = bytes(bytearray([(1 << (height % 8)) - 1])) * width
+        self.mask = bytes(mask)
+
+        # shift -> (bitmap, mask)
+        self._variants = {0: (self.bitmap, self.mask)}
+
+    def variant(self, shift):
+        """
+            Return the bitmap and mask of the image, shifted down by 0-7 pixels.
+
+            :param shift: The number of pixels to shift by
+            :return: bitmap, mask
+            :rtype: tuple
+
+        """
+
+        bitmaps = self._variants.get(shift)
+        if bitmaps is None:
+            bitmaps = (oled_bitmap.shift_pages(self.bitmap, self.width, self.pages, shift),
+                       oled_bitmap.shift_pages(self.mask, self.width, self.pages, shift))
+            self._variants[shift] = bitmaps
+
+        return bitmaps
+
+#-----------------------------------------
+# The cache - an LRU of converted images, keyed by content hash and options
+
+_cache = OrderedDict()
+
+def convert_image(img, method=DITHER_FLOYD_STEINBERG, threshold=128, invert=False):
+    """
+        Convert an image to a page format bitmap. The result is cached - converting the same
+        image again is a hash of its content.
+
+        :param img: A Pillow image or numpy array (see to_gray())
+        :param method: The dither - 'threshold', 'bayer', 'floyd-steinberg' or 'atkinson'
+        :param threshold: The level (0-255) for a lit pixel, for 'threshold'
+        :param invert: If True, dark pixels are lit
+
+        :return: The converted image
+        :rtype: PackedImage
+
+    """
+
+    gray = np.ascontiguousarray(to_gray(img))
+
+    digest = hashlib.blake2b(gray.tobytes(), digest_size=16)
+    digest.update(repr(gray.shape).encode())
+    key = (digest.digest(), method, threshold, bool(invert))
+
+    packed = _cache.get(key)
+    if packed is not None:
+        _cache.move_to_end(key)
+        return packed
+
+    if invert:
+        gray = 255 - gray
+
+    bitmap, _ = pack_pages(dither(gray, method, threshold))
+    packed = PackedImage(bitmap, gray.shape[1], gray.shape[0])
+
+    _cache[key] = packed
+    while len(_cache) > _CACHE_SIZE:
+        _cache.popitem(last=False)
+
+    return packed
+
+def clear_cache():
+    """
+        Remove all converted images from the cache.
+
+        :return: No return value
+
+    """
+    _cache.clear()
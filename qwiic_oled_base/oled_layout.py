@@ -0,0 +1,214 @@
+#-----------------------------------------------------------------------------
+# oled_layout.py
+#
+# Text layout for the OLED display - word wrap, alignment and clipping
+#
+#------------------------------------------------------------------------
+#
+# Written by  SparkFun Electronics, October 2026
+#
+# This python library supports the SparkFun Electroncis qwiic
+# qwiic sensor/board ecosystem on a Raspberry Pi (and compatable) single
+# board computers.
+#
+# More information on qwiic is at https://www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#
+#==================================================================================
+# Copyright (c) 2026 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#==================================================================================
+#
+# The layout stage turns a string, a box and a font into a list of positioned
+# glyph runs. All the cursor math (wrapping, alignment, truncation) happens
+# here, once, and the result is cached - drawing is then just a walk over the
+# runs. Lines that fall outside of the box are never part of the result, so they
+# are never rasterized.
+#
+# The OLED fonts are monospaced, so a layout only depends on the font metrics,
+# not on the glyph data. The cache is keyed on those metrics.
+#
+
+from __future__ import division
+from collections import namedtuple, OrderedDict
+
+# Alignment values
+ALIGN_LEFT      = 0
+ALIGN_CENTER    = 1
+ALIGN_RIGHT     = 2
+
+_ELLIPSIS = '...'
+
+# A run of glyphs on one line. x,y is the position of the first glyph, relative
+# to the origin of the layout box. chars is a tuple of the characters.
+GlyphRun = namedtuple('GlyphRun', ['x', 'y', 'chars'])
+
+# The result of a layout. truncated is True if any text did not fit in the box.
+TextLayout = namedtuple('TextLayout', ['runs', 'advance', 'truncated'])
+
+# layout cache - maps layout key to TextLayout, in LRU order
+_layoutCache = OrderedDict()
+_layoutCacheSize = 64
+
+#-----------------------------------------
+# handy utils
+
+def _cellWidth(font):
+
+    # single row fonts are drawn with a pad column
+    return font.cell_width
+
+def _cellHeight(font):
+
+    return (font.height + 7)//8 * 8
+
+def _wrapParagraph(text, maxChars):
+
+    # Greedy word wrap. Words longer than a line are broken at the line width.
+    lines = []
+    line = ''
+
+    for word in text.split(' '):
+
+        while len(word) > maxChars:
+            if line:
+                lines.append(line)
+                line = ''
+            lines.append(word[:maxChars])
+            word = word[maxChars:]
+
+        if not line:
+            line = word
+        elif len(line) + 1 + len(word) <= maxChars:
+            line = line + ' ' + word
+        else:
+            lines.append(line)
+            line = word
+
+    lines.append(line)
+
+    return [tLine.rstrip(' ') for tLine in lines]
+
+def _addEllipsis(line, maxChars):
+
+    if maxChars <= len(_ELLIPSIS):
+        return line[:maxChars]
+
+    if len(line) + len(_ELLIPSIS) > maxChars:
+        line = line[:maxChars - len(_ELLIPSIS)].rstrip(' ')
+
+    return line + _ELLIPSIS
+
+#-----------------------------------------
+def _layout(text, font, width, height, align, wrap, ellipsis):
+
+    advance = font.width + 1        # the same advance that write() uses
+    lineHeight = font.height
+    cellWidth = _cellWidth(font)
+    cellHeight = _cellHeight(font)
+
+    maxChars = (width - cellWidth)//advance + 1 if width >= cellWidth else 0
+    maxLines = (height - cellHeight)//lineHeight + 1 if height >= cellHeight else 0
+
+    truncated = False
+    lines = []
+
+    for paragraph in text.replace('\r', '').split('\n'):
+
+        if wrap and maxChars > 0:
+            lines.extend(_wrapParagraph(paragraph, maxChars))
+
+        elif len(paragraph) > maxChars:
+            truncated = True
+            lines.append(_addEllipsis(paragraph, maxChars) if ellipsis else paragraph[:maxChars])
+
+        else:
+            lines.append(paragraph)
+
+    if len(lines) > maxLines:
+        truncated = True
+        lines = lines[:maxLines]
+        if ellipsis and lines:
+            lines[-1] = _addEllipsis(lines[-1], maxChars)
+
+    runs = []
+    for iLine, line in enumerate(lines):
+
+        if not line:
+            continue
+
+        lineWidth = (len(line) - 1) * advance + cellWidth
+
+        if align == ALIGN_CENTER:
+            xPos = (width - lineWidth)//2
+        elif align == ALIGN_RIGHT:
+            xPos = width - lineWidth
+        else:
+            xPos = 0
+
+        runs.append(GlyphRun(xPos, iLine * lineHeight, tuple(line)))
+
+    return TextLayout(tuple(runs), advance, truncated)
+
+#-----------------------------------------
+def layout_text(text, font, width, height, align=ALIGN_LEFT, wrap=True, ellipsis=True):
+    """
+        Layout a string of text inside a box, using the given font.
+
+        :param text: The text to layout. A value of '\\\\n' starts a new line.
+        :param font: The font (OLEDFont) used to draw the text
+        :param width: The width of the layout box in pixels
+        :param height: The height of the layout box in pixels
+        :param align: ALIGN_LEFT, ALIGN_CENTER or ALIGN_RIGHT. Default is ALIGN_LEFT
+        :param wrap: If True, lines are word wrapped at the box width, otherwise they are truncated
+        :param ellipsis: If True, truncated text ends with '...'
+
+        :return: The layout of the text. Run positions are relative to the box origin.
+        :rtype: TextLayout
+
+    """
+
+    if not isinstance(text, str):
+        text = str(text)
+
+    key = (text, font.width, font.height, _cellWidth(font), width, height, align, wrap, ellipsis)
+
+    layout = _layoutCache.get(key)
+    if layout is not None:
+        _layoutCache.move_to_end(key)
+        return layout
+
+    layout = _layout(text, font, width, height, align, wrap, ellipsis)
+
+    _layoutCache[key] = layout
+    if len(_layoutCache) > _layoutCacheSize:
+        _layoutCache.popitem(last=False)
+
+    return layout
+
+def clear_cache():
+    """
+        Clear the text layout cache.
+
+        :return: No return value
+
+    """
+    _layoutCache.clear()
@@ -0,0 +1,265 @@
+#-----------------------------------------------------------------------------
+# oled_metrics.py
+#
+# Export OLED display counters in the Prometheus textfile format
+#
+#------------------------------------------------------------------------
+#
+# Written by  SparkFun Electronics, October 2026
+#
+# This python library supports the SparkFun Electroncis qwiic
+# qwiic sensor/board ecosystem on a Raspberry Pi (and compatable) single
+# board computers.
+#
+# More information on qwiic is at https://www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#
+#==================================================================================
+# Copyright (c) 2026 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#==================================================================================
+#
+#
+# The exporter writes the counters of each display to a file, in the text format
+# of the Prometheus node_exporter textfile collector - no network is needed, the
+# node exporter picks the file up:
+#
+#   node_exporter --collector.textfile.directory=/var/lib/node_exporter
+#
+#   exporter = TextfileExporter('/var/lib/node_exporter/qwiic_oled.prom')
+#   exporter.add(oled, 'status')
+#   exporter.start()
+#
+# The file is written to a temporary file, then renamed, so the collector never
+# reads a partial file. The counters are read by the exporter thread - the
+# display does no extra work for it.
+#
+
+from __future__ import print_function
+
+import os
+import sys
+import threading
+
+#-----------------------------------------
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _labels(labels):
+    return '{' + ','.join('%s="%s"' % (key, _escape(value)) for key, value in labels) + '}'
+
+#-----------------------------------------
+class TextfileExporter(object):
+    """
+    TextfileExporter
+
+        :param path: Path of the metrics file - in the textfile collector directory, with a .prom
+                    extension
+        :param interval: Seconds between writes of the file, when started. Default is 15
+        :return: The exporter object
+        :rtype: Object
+    """
+
+    def __init__(self, path, interval=15.0):
+
+        self.path = path
+        self.interval = interval
+
+        # (name, display)
+        self._displays = []
+        self._lock = threading.Lock()
+
+        self._thread = None
+        self._stop = threading.Event()
+
+    def add(self, oled, name=None):
+        """
+            Export the counters of a display.
+
+            :param oled: The display (QwiicOledBase)
+            :param name: The value of the display label. Default is the I2C address, such as '0x3d'.
+                    Displays at the same address on different buses need their own names.
+            :return: No return value
+
+        """
+
+        name = name or '0x%02x' % oled.address
+
+        with self._lock:
+            # Prometheus rejects a file with the same series twice
+            if any(name == other for other, _ in self._displays):
+                raise ValueError("A display is already exported as '%s' - give each display its own name" % name)
+            self._displays.append((name, oled))
+
+    def remove(self, oled):
+        """
+            Stop exporting the counters of a display.
+
+            :param oled: The display
+            :return: No return value
+
+        """
+
+        with self._lock:
+            self._displays = [(name, display) for name, display in self._displays if display is not oled]
+
+    #--------------------------------------------------------------------------
+    def render(self):
+        """
+            The metrics of all the displays, in the Prometheus text format.
+
+            :return: The metrics
+            :rtype: string
+
+        """
+
+        # metric name -> (type, help, [(labels, value)])
+        metrics = {}
+        order = []
+
+        def add(metric, kind, text, labels, value):
+            if metric not in metrics:
+                metrics[metric] = (kind, text, [])
+                order.append(metric)
+            metrics[metric][2].append((labels, value))
+
+        with self._lock:
+            displays = list(self._displays)
+
+        # font type -> font. Fonts are shared by all displays, so the glyph atlas of each font
+        # is exported once, labelled by font only
+        fonts = {}
+
+        for name, oled in displays:
+
+            labels = [('display', name)]
+            counters = oled.counters
+
+            add('qwiic_oled_frames_total', 'counter', 'Frames sent to the display', labels, counters.frames)
+            add('qwiic_oled_bytes_total', 'counter', 'Bytes sent to the display, commands and data', labels, counters.bytes)
+            add('qwiic_oled_transactions_total', 'counter', 'I2C writes to the display', labels, counters.transactions)
+            add('qwiic_oled_bus_seconds_total', 'counter', 'Time spent sending frames', labels, counters.bus_time)
+            add('qwiic_oled_merged_frames_total', 'counter', 'display() calls merged into a later frame by the frame rate limit', labels, counters.merged)
+            add('qwiic_oled_dropped_frames_total', 'counter', 'Frames replaced by a newer frame before they were sent', labels, counters.dropped)
+            add('qwiic_oled_write_retries_total', 'counter', 'Block writes retried after an I2C error', labels, counters.retries)
+            add('qwiic_oled_write_errors_total', 'counter', 'Block writes that failed after all retries', labels, counters.errors)
+
+            # no text cache - set_text_cache_size(0)
+            textCache = oled.get_text_cache_stats()
+            if textCache is not None:
+                add('qwiic_oled_text_cache_hits_total', 'counter', 'Text cache hits', labels, textCache['hits'])
+                add('qwiic_oled_text_cache_misses_total', 'counter', 'Text cache misses', labels, textCache['misses'])
+                add('qwiic_oled_text_cache_hit_ratio', 'gauge', 'Text cache hit ratio', labels, textCache['hit_rate'])
+
+            font = oled._font # pylint: disable=protected-access
+            if font is not None:
+                fonts[oled.fontType] = font
+
+            latency = oled.get_latency_stats()
+            if latency is not None:
+                for kind, text in (('display', 'Time in display()'), ('frame', 'Time of a whole frame - drawing and transfer')):
+                    metric = 'qwiic_oled_%s_latency_seconds' % kind
+                    summary = latency[kind]
+                    for quantile, key in (('0.5', 'p50'), ('0.95', 'p95'), ('0.99', 'p99'), ('1', 'max')):
+                        add(metric, 'summary', text, labels + [('quantile', quantile)], summary[key])
+                    add(metric + '_sum', None, None, labels, summary['mean'] * summary['count'])
+                    add(metric + '_count', None, None, labels, summary['count'])
+
+                add('qwiic_oled_missed_deadlines_total', 'counter', 'Frames longer than the target frame time', labels, latency['missed_deadlines'])
+
+        for fontType in sorted(fonts):
+            atlas = fonts[fontType].atlas_stats()
+            fontLabels = [('font', fontType)]
+            add('qwiic_oled_glyph_atlas_hits_total', 'counter', 'Glyph atlas hits of a font in use, all displays', fontLabels, atlas['hits'])
+            add('qwiic_oled_glyph_atlas_misses_total', 'counter', 'Glyph atlas misses of a font in use, all displays', fontLabels, atlas['misses'])
+            add('qwiic_oled_glyph_atlas_hit_ratio', 'gauge', 'Glyph atlas hit ratio of a font in use, all displays', fontLabels, atlas['hit_rate'])
+
+        lines = []
+        for metric in order:
+            kind, text, samples = metrics[metric]
+            if kind is not None:
+                lines.append('# HELP %s %s' % (metric, text))
+                lines.append('# TYPE %s %s' % (metric, kind))
+            for labels, value in samples:
+                lines.append('%s%s %s' % (metric, _labels(labels), repr(float(value)) if isinstance(value, float) else value))
+
+        return '\n'.join(lines) + '\n'
+
+    def write(self):
+        """
+            Write the metrics file - replaced in one step.
+
+            :return: No return value
+
+        """
+
+        data = self.render()
+
+        tmpFile = '%s.%d.tmp' % (self.path, os.getpid())
+        with open(tmpFile, 'w') as fp:
+            fp.write(data)
+        os.replace(tmpFile, self.path)
+
+    #--------------------------------------------------------------------------
+    def start(self):
+        """
+            Write the metrics file every interval seconds, from a background thread.
+
+            :return: No return value
+
+        """
+
+        if self._thread is not None:
+            return
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='qwiic-oled-metrics')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        """
+            Stop the background thread, after writing the file one last time.
+
+            :return: No return value
+
+        """
+
+        if self._thread is None:
+            return
+
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def _run(self):
+
+        while True:
+            bStop = self._stop.wait(self.interval)
+
+            # an error is logged and the file written again next interval - the thread never dies
+            try:
+                self.write()
+            except Exception as exError: # pylint: disable=broad-except
+                print("Metrics export - unable to write %s: %s" % (self.path, exError), file=sys.stderr)
+
+            if bStop:
+                return
@@ -0,0 +1,381 @@
+#-----------------------------------------------------------------------------
+# oled_profile.py
+#
+# A profiler for the drawing primitives of the OLED display
+#
+#------------------------------------------------------------------------
+#
+# Written by  SparkFun Electronics, October 2026
+#
+# This python library supports the SparkFun Electroncis qwiic
+# qwiic sensor/board ecosystem on a Raspberry Pi (and compatable) single
+# board computers.
+#
+# More information on qwiic is at https://www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#
+#==================================================================================
+# Copyright (c) 2026 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#==================================================================================
+#
+#
+# Counts the calls, time and pixels touched of each drawing primitive of a display,
+# per section - a section names the part of the UI drawing (a screen, a widget), so
+# the report says what caused the cost, which cProfile can't.
+#
+# The profiler wraps the methods of one display object when enabled, and removes
+# the wrappers when disabled - a display that is not profiled runs the plain
+# methods, at no cost. Profilers of the same display share one wrapper per method,
+# so they can be enabled and disabled in any order. Sections are per thread.
+#
+#   with Profiler(oled) as profiler:
+#       with profiler.section('clock'):
+#           draw_clock(oled)
+#       oled.display()
+#   print(profiler.report())
+#
+# Or set the environment variable QWIIC_OLED_PROFILE - every display is profiled,
+# and the report is written at exit, to stderr (QWIIC_OLED_PROFILE=1) or to the
+# file named by the variable.
+#
+# Pixels touched are estimated from the arguments - the area of a fill, the length
+# of a line, the cells of the characters drawn. Primitives built on others are
+# counted at each level - the time of rect_fill includes its calls to line_v.
+#
+
+from __future__ import print_function
+
+import sys
+import time
+import atexit
+import threading
+
+from contextlib import contextmanager
+
+ENV_VAR = 'QWIIC_OLED_PROFILE'
+
+# The methods profiled by default
+PRIMITIVES = ['pixel', 'line', 'line_h', 'line_v', 'rect', 'rect_fill', 'circle',
+              'draw_char', 'print', 'draw_text', 'draw_bitmap', 'draw_image', 'display']
+
+#-----------------------------------------
+# Pixels touched by a call, from its arguments
+
+def _cell(oled):
+    return oled.get_font_width() * oled.get_font_height() if oled._font else 0 # pylint: disable=protected-access
+
+def _line_pixels(oled, x0, y0, x1, y1, *args, **kwargs):
+    return max(abs(x1 - x0), abs(y1 - y0)) + 1
+
+def _rect_pixels(oled, x, y, width, height, *args, **kwargs):
+    return 2 * (width + height)
+
+def _fill_pixels(oled, x, y, width, height, *args, **kwargs):
+    return width * height
+
+def _circle_pixels(oled, x0, y0, radius, *args, **kwargs):
+    return int(6.3 * radius) + 1
+
+def _char_pixels(oled, *args, **kwargs):
+    return _cell(oled)
+
+def _text_pixels(oled, text, *args, **kwargs):
+    return len(text) * _cell(oled)
+
+def _draw_text_pixels(oled, x, y, text, *args, **kwargs):
+    return len(text) * _cell(oled)
+
+def _screen_pixels(oled, *args, **kwargs):
+    return oled.LCDWIDTH * oled.LCDHEIGHT
+
+_pixels = {'pixel': lambda oled, *args, **kwargs: 1,
+           'line': _line_pixels,
+           'line_h': lambda oled, x, y, width, *args, **kwargs: width,
+           'line_v': lambda oled, x, y, height, *args, **kwargs: height,
+           'rect': _rect_pixels,
+           'rect_fill': _fill_pixels,
+           'circle': _circle_pixels,
+           'draw_char': _char_pixels,
+           'print': _text_pixels,
+           'draw_text': _draw_text_pixels,
+           'draw_bitmap': _screen_pixels,
+           'display': _screen_pixels}
+
+#-----------------------------------------
+# The wrapper of a display method - times the call once, and records it in each
+# profiler of the display that is enabled
+
+def _wrap(oled, name, method):
+
+    pixels = _pixels.get(name)
+    clock = time.perf_counter
+    profilers = []
+
+    def profiled(*args, **kwargs):
+
+        tStart = clock()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            elapsed = clock() - tStart
+
+            count = 0
+            if pixels is not None:
+                try:
+                    count = pixels(oled, *args, **kwargs)
+                except (TypeError, ValueError):
+                    pass
+
+            for profiler in tuple(profilers):
+                profiler._record(name, elapsed, count) # pylint: disable=protected-access
+
+    profiled.__name__ = name
+    profiled.__doc__ = method.__doc__
+    profiled.profilers = profilers
+    # a method set on the display object before profiling, restored when the last profiler is disabled
+    profiled.previous = oled.__dict__.get(name)
+    return profiled
+
+#-----------------------------------------
+# The report of a profiler's records - one line per section and method
+
+def _format_report(records, lock, sort):
+
+    column = {'calls': 0, 'time': 1, 'pixels': 2}[sort]
+    with lock:
+        records = dict((key, list(record)) for key, record in records.items())
+    rows = sorted(records.items(), key=lambda item: item[1][column], reverse=True)
+
+    width = max([len(section or '-') for (section, _) in records] + [7])
+    lines = ['%-*s  %-12s %9s %12s %10s %12s' % (width, 'section', 'method', 'calls', 'time (ms)', 'us/call', 'pixels')]
+
+    for (section, name), (calls, elapsed, pixels) in rows:
+        lines.append('%-*s  %-12s %9d %12.3f %10.2f %12d' % (width, section or '-', name, calls, elapsed * 1e3,
+                                                          elapsed * 1e6 / calls if calls else 0.0, pixels))
+
+    return '\n'.join(lines)
+
+#-----------------------------------------
+class Profiler(object):
+    """
+    Profiler
+
+        :param oled: The display (QwiicOledBase) to profile
+        :param methods: The names of the methods to profile. Default is the drawing primitives
+        :return: The profiler object
+        :rtype: Object
+    """
+
+    def __init__(self, oled, methods=None):
+
+        self._oled = oled
+        self._methods = list(methods or PRIMITIVES)
+
+        # (section, method) -> [calls, time, pixels]
+        self.records = {}
+        self._lock = threading.Lock()
+
+        # the section stack of each thread
+        self._local = threading.local()
+        self.enabled = False
+
+    def enable(self):
+        """
+            Start profiling - wraps the methods of the display.
+
+            :return: No return value
+
+        """
+
+        if self.enabled:
+            return
+
+        for name in self._methods:
+            wrapper = self._oled.__dict__.get(name)
+            if getattr(wrapper, 'profilers', None) is None:
+                method = getattr(self._oled, name, None)
+                if method is None:
+                    continue
+                wrapper = _wrap(self._oled, name, method)
+                setattr(self._oled, name, wrapper)
+            wrapper.profilers.append(self)
+
+        self.enabled = True
+
+    def disable(self):
+        """
+            Stop profiling - the display methods are restored. The records are kept.
+
+            :return: No return value
+
+        """
+
+        if not self.enabled:
+            return
+
+        # remove this profiler from the shared wrappers - the last one out restores the method
+        for name in self._methods:
+            wrapper = self._oled.__dict__.get(name)
+            profilers = getattr(wrapper, 'profilers', None)
+            if profilers is None or self not in profilers:
+                continue
+            profilers.remove(self)
+            if not profilers:
+                if wrapper.previous is None:
+                    del self._oled.__dict__[name]
+                else:
+                    self._oled.__dict__[name] = wrapper.previous
+
+        self.enabled = False
+
+    def reset(self):
+        """
+            Clear the records.
+
+            :return: No return value
+
+        """
+        with self._lock:
+            self.records.clear()
+
+    def __enter__(self):
+        self.enable()
+        return self
+
+    def __exit__(self, *args):
+        self.disable()
+
+    def _record(self, name, elapsed, pixels):
+
+        sections = getattr(self._local, 'sections', None)
+        key = ('/'.join(sections) if sections else '', name)
+
+        with self._lock:
+            record = self.records.get(key)
+            if record is None:
+                record = self.records[key] = [0, 0.0, 0]
+
+            record[0] += 1
+            record[1] += elapsed
+            record[2] += pixels
+
+    #--------------------------------------------------------------------------
+    @contextmanager
+    def section(self, name):
+        """
+            Record the calls made in the block under a section name. Sections nest - the name
+            recorded is the path, such as 'status/clock'. Sections apply to the calls made by
+            the thread that opened them.
+
+            :param name: The section name
+            :return: A context manager
+
+        """
+
+        sections = getattr(self._local, 'sections', None)
+        if sections is None:
+            sections = self._local.sections = []
+
+        sections.append(name)
+        try:
+            yield self
+        finally:
+            sections.pop()
+
+    #--------------------------------------------------------------------------
+    def report(self, sort='time'):
+        """
+            A report of the records, one line per section and method.
+
+            :param sort: Sort by 'time', 'calls' or 'pixels' - highest first
+            :return: The report
+            :rtype: string
+
+        """
+
+        return _format_report(self.records, self._lock, sort)
+
+    def dump(self, stream=None, sort='time'):
+        """
+            Write the report to a stream.
+
+            :param stream: The stream. Default is sys.stderr
+            :param sort: Sort by 'time', 'calls' or 'pixels'
+            :return: No return value
+
+        """
+        print(self.report(sort), file=stream or sys.stderr)
+
+#-----------------------------------------
+# Profiling from the environment
+#
+# One exit hook writes the reports of every display profiled from the environment.
+# The hook holds the records and a description of each display, not the display -
+# a display that is closed and dropped before exit is freed, and its report is
+# still written.
+
+_envReports = []
+_envLock = threading.Lock()
+_envHooked = False
+
+def _write_env_reports():
+
+    with _envLock:
+        reports = list(_envReports)
+        del _envReports[:]
+
+    for header, records, lock, value in reports:
+        text = header + '\n' + _format_report(records, lock, 'time')
+        if value in ('1', 'stderr'):
+            print(text, file=sys.stderr)
+        else:
+            with open(value, 'a') as fp:
+                fp.write(text + '\n\n')
+
+def enable_from_env(oled, value):
+    """
+        Profile a display, and write the report at exit. Called for each display when the
+        QWIIC_OLED_PROFILE environment variable is set.
+
+        :param oled: The display
+        :param value: The value of the variable - '1' reports to stderr, otherwise the path
+                    of the report file. The reports of all displays are appended.
+
+        :return: The profiler
+        :rtype: Profiler
+
+    """
+
+    global _envHooked # pylint: disable=global-statement
+
+    profiler = Profiler(oled)
+    profiler.enable()
+
+    header = 'qwiic OLED profile - %s %dx%d at 0x%02X' % (type(oled).__name__, oled.LCDWIDTH, oled.LCDHEIGHT, oled.address)
+
+    with _envLock:
+        if not _envHooked:
+            atexit.register(_write_env_reports)
+            _envHooked = True
+        _envReports.append((header, profiler.records, profiler._lock, value)) # pylint: disable=protected-access
+
+    return profiler
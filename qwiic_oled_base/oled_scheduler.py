@@ -0,0 +1,266 @@
+#-----------------------------------------------------------------------------
+# oled_scheduler.py
+#
+# A priority flush scheduler for the OLED display
+#
+#------------------------------------------------------------------------
+#
+# Written by  SparkFun Electronics, October 2026
+#
+# This python library supports the SparkFun Electroncis qwiic
+# qwiic sensor/board ecosystem on a Raspberry Pi (and compatable) single
+# board computers.
+#
+# More information on qwiic is at https://www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#
+#==================================================================================
+# Copyright (c) 2026 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#==================================================================================
+#
+#
+# Sending a frame to a 128x64 display takes tens of milliseconds on a 100kHz bus.
+# The scheduler sends frames one block at a time, and checks for more urgent work
+# between blocks - an alarm screen submitted at a higher priority preempts the
+# frame being sent, and goes out at once.
+#
+# A preempted transfer loses nothing - blocks are only recorded as sent (in the
+# shadow buffer) once they are, so the blocks it didn't send are still different
+# from the display, and every later transfer sends them if they differ from its
+# frame. The display always ends up showing the latest frame submitted:
+#
+#   - the most urgent frame waiting is sent first
+#   - frames submitted before the frame being sent are dropped - a preempted
+#     frame is never resumed over newer content
+#   - frames submitted after it, at any priority, are sent when it is done
+#
+#   scheduler = FlushScheduler(oled)
+#   scheduler.start()                                   # a thread sends the frames
+#   scheduler.submit()                                  # the screen buffer, now
+#   scheduler.submit(alarm_frame, PRIORITY_HIGH)        # preempts
+#
+# Or, in an event loop without threads, call step() - it sends one block.
+#
+# A transfer that fails after its retries (see QwiicOledBase.set_retry()) is logged
+# and abandoned - the blocks it didn't send are stale, and the next frame sends them.
+#
+
+from __future__ import print_function
+
+import sys
+import threading
+
+PRIORITY_LOW = 0
+PRIORITY_NORMAL = 50
+PRIORITY_HIGH = 100
+
+#-----------------------------------------
+class FlushScheduler(object):
+    """
+    FlushScheduler
+
+        :param oled: The display (QwiicOledBase) to send frames to
+        :return: The scheduler object
+        :rtype: Object
+    """
+
+    def __init__(self, oled):
+
+        self._oled = oled
+
+        # priority -> (sequence number, frame) of the latest frame waiting at that priority
+        self._pending = {}
+        self._sequence = 0
+
+        # the transfer in progress - priority, sequence number and the transfer generator
+        self._current = None
+
+        self.preemptions = 0
+
+        # _condition guards the queue, _stepLock the transfer - only one step() runs at a time,
+        # and submit() doesn't wait for a block to be sent
+        self._condition = threading.Condition()
+        self._stepLock = threading.Lock()
+        self._thread = None
+        self._running = False
+
+    def submit(self, frame=None, priority=PRIORITY_NORMAL):
+        """
+            Queue a frame to send. A frame waiting at the same priority is replaced. A frame at a
+            higher priority than the one being sent preempts it, at the next block.
+
+            :param frame: The frame, in page format (a full screen buffer). Default is a copy of the
+                        screen buffer of the display.
+            :param priority: The priority - higher is more urgent
+            :return: No return value
+
+        """
+
+        if frame is None:
+            frame = self._oled.get_screenbuffer()
+        frame = bytes(frame)
+
+        with self._condition:
+            if priority in self._pending:
+                self._oled.counters.dropped += 1
+
+            self._sequence += 1
+            self._pending[priority] = (self._sequence, frame)
+            self._condition.notify()
+
+    def pending(self):
+        """
+            Is there anything to send?
+
+            :return: True if a frame is being sent, or waiting
+            :rtype: bool
+
+        """
+
+        with self._condition:
+            return self._current is not None or bool(self._pending)
+
+    #--------------------------------------------------------------------------
+    def step(self):
+        """
+            Send one block - of the most urgent frame. Nothing is sent while the display is
+            drawing a frame (see QwiicOledBase.frame()).
+
+            :return: True if there is more to send
+            :rtype: bool
+
+        """
+
+        with self._stepLock:
+
+            preempted = None
+
+            with self._condition:
+
+                if self._oled.in_frame():
+                    return self._current is not None or bool(self._pending)
+
+                if self._pending:
+                    top = max(self._pending)
+
+                    if self._current is not None and top > self._current[0]:
+                        # preempt - the blocks not sent stay different from the shadow buffer
+                        preempted = self._current[2]
+                        self._current = None
+                        self.preemptions += 1
+                        self._oled.counters.dropped += 1
+
+                    if self._current is None:
+                        sequence, frame = self._pending.pop(top)
+
+                        # frames older than this one would overwrite newer content
+                        for priority in [priority for priority, (older, _) in self._pending.items() if older < sequence]:
+                            del self._pending[priority]
+                            self._oled.counters.dropped += 1
+
+                        self._current = (top, sequence, self._oled._flush_iter(frame, chunked=True)) # pylint: disable=protected-access
+
+                transfer = None if self._current is None else self._current[2]
+
+            # send outside of the queue lock, so submit() never waits on the bus
+            if preempted is not None:
+                preempted.close()
+
+            if transfer is None:
+                return False
+
+            try:
+                next(transfer)
+            except StopIteration:
+                with self._condition:
+                    self._current = None
+            except (IOError, OSError) as err:
+                print("Flush scheduler - error sending the frame: %s" % err, file=sys.stderr)
+                with self._condition:
+                    self._current = None
+
+            with self._condition:
+                return self._current is not None or bool(self._pending)
+
+    def run_until_idle(self):
+        """
+            Send until nothing is waiting.
+
+            :return: No return value
+
+        """
+
+        while self.step():
+            pass
+
+    #--------------------------------------------------------------------------
+    def start(self):
+        """
+            Send frames from a background thread, as they are submitted.
+
+            :return: No return value
+
+        """
+
+        if self._thread is not None:
+            return
+
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name='qwiic-oled-flush')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        """
+            Stop the background thread. Frames waiting are kept - call run_until_idle() to send them.
+
+            :return: No return value
+
+        """
+
+        if self._thread is None:
+            return
+
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+
+        self._thread.join()
+        self._thread = None
+
+    def _run(self):
+
+        frameIdle = self._oled._frameIdle # pylint: disable=protected-access
+
+        while True:
+            with self._condition:
+                while self._running and self._current is None and not self._pending:
+                    self._condition.wait()
+                if not self._running:
+                    return
+
+            # nothing is sent while the display is drawing a frame - wait for it to end. The
+            # timeout only bounds how long stop() waits.
+            if not frameIdle.wait(0.1):
+                continue
+
+            self.step()
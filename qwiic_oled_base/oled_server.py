@@ -0,0 +1,590 @@
+#-----------------------------------------------------------------------------
+# oled_server.py
+#
+# A local display server - owns the displays and the I2C bus, draws for clients
+#
+#------------------------------------------------------------------------
+#
+# Written by  SparkFun Electronics, October 2026
+#
+# This python library supports the SparkFun Electroncis qwiic
+# qwiic sensor/board ecosystem on a Raspberry Pi (and compatable) single
+# board computers.
+#
+# More information on qwiic is at https://www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#
+#==================================================================================
+# Copyright (c) 2026 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#==================================================================================
+#
+# The server owns one or more displays, and accepts clients on a unix domain
+# socket. Clients send draw operations in a compact binary format. Operations are
+# held per client until the client commits, then applied together - so a frame is
+# never sent half drawn. The server sends each display at most once per frame
+# period, however many clients committed in that period.
+#
+# Message Structure - all values little endian
+#   byte  0         operation
+#   byte  1         display index
+#   bytes 2-3       payload length
+#   payload
+#
+# Operations and their payloads
+#   OP_CLEAR            -
+#   OP_REGION           x (u16), page (u8), width (u16), pages (u8), page format data
+#   OP_TEXT             x (s16), y (s16), font (u8), color (u8), mode (u8), utf-8 text
+#   OP_RECT             x (s16), y (s16), width (u16), height (u16), color (u8), mode (u8), fill (u8)
+#   OP_LINE             x0 (s16), y0 (s16), x1 (s16), y1 (s16), color (u8), mode (u8)
+#   OP_DEFINE_BITMAP    id (u16), width (u16), height (u16), page format data
+#   OP_BITMAP           id (u16), x (s16), y (s16)
+#   OP_COMMIT           -
+#
+# Bitmaps are defined once, and are then drawn by id by any client.
+#
+# Rectangles and lines are clipped to the display before they are drawn, so a huge
+# shape from one client can't stall the server - a shape entirely off the display is
+# invalid. A client may hold at most _MAX_PENDING bytes of operations before it
+# commits. A client that sends an invalid message, or too much, is disconnected.
+#
+
+from __future__ import print_function
+
+import os
+import sys
+import time
+import errno
+import socket
+import struct
+import selectors
+import argparse
+
+from . import oled_bitmap
+
+OP_CLEAR            = 0x01
+OP_REGION           = 0x02
+OP_TEXT             = 0x03
+OP_RECT             = 0x04
+OP_LINE             = 0x05
+OP_DEFINE_BITMAP    = 0x06
+OP_BITMAP           = 0x07
+OP_COMMIT           = 0x08
+
+_HEADER = struct.Struct('<BBH')
+_REGION = struct.Struct('<HBHB')
+_TEXT = struct.Struct('<hhBBB')
+_RECT = struct.Struct('<hhHHBBB')
+_LINE = struct.Struct('<hhhhBB')
+_DEFINE_BITMAP = struct.Struct('<HHH')
+_BITMAP = struct.Struct('<Hhh')
+
+_MAX_PAYLOAD = 0xFFFF
+
+# the most operation data a client can send before a commit
+_MAX_PENDING = 1 << 20
+
+#-----------------------------------------
+# A connected client
+
+class _Client(object):
+
+    def __init__(self, sock):
+
+        self.sock = sock
+        self.data = bytearray()
+
+        # operations received since the last commit, and the size of their payloads
+        self.pending = []
+        self.pendingBytes = 0
+
+#-----------------------------------------
+class DisplayServer(object):
+    """
+    DisplayServer
+
+        :param displays: List of displays (QwiicOledBase) - display index 0 is the first
+        :param path: Path of the unix domain socket
+        :param fps: The maximum number of times per second a display is sent. Default is 30
+        :return: The server object
+        :rtype: Object
+    """
+
+    def __init__(self, displays, path, fps=30):
+
+        if not fps > 0:
+            raise ValueError("The frame rate must be greater than 0")
+
+        self.displays = list(displays)
+        self.path = path
+        self.period = 1.0 / fps
+
+        # bitmap id -> (width, pages, data, mask)
+        self._bitmaps = {}
+
+        # displays with committed changes that are not sent yet
+        self._dirty = set()
+        self._lastFlush = 0.0
+
+        # a socket left by a server that exited is removed - one in use is not
+        if os.path.exists(path):
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(path)
+            except (ConnectionRefusedError, FileNotFoundError):
+                os.remove(path)
+            else:
+                raise OSError(errno.EADDRINUSE, "A display server is already running on this socket", path)
+            finally:
+                probe.close()
+
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.bind(path)
+        self._sock.listen(16)
+        self._sock.setblocking(False)
+
+        # shutdown() writes to the wakeup socket, to end a select() with no timeout
+        self._wakeup, self._wakeupWriter = socket.socketpair()
+        self._wakeup.setblocking(False)
+
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self._sock, selectors.EVENT_READ, None)
+        self._selector.register(self._wakeup, selectors.EVENT_READ, self._wakeup)
+
+        self._running = False
+
+    #--------------------------------------------------------------------------
+    def serve_once(self, timeout=None):
+        """
+            Handle the client activity of up to one frame period, then send the displays
+            that changed.
+
+            :param timeout: The longest time to wait for clients, in seconds. Default is until the
+                        displays with changes are due to be sent, or no limit if there are none.
+            :return: No return value
+
+        """
+
+        if timeout is None and self._dirty:
+            timeout = max(0.0, self._lastFlush + self.period - time.monotonic())
+
+        for key, _ in self._selector.select(timeout):
+            if key.data is None:
+                self._accept()
+            elif key.data is self._wakeup:
+                self._drain_wakeup()
+            else:
+                self._read(key.data)
+
+        if self._dirty and time.monotonic() >= self._lastFlush + self.period:
+            self.flush()
+
+    def serve_forever(self):
+        """
+            Serve clients until shutdown() is called.
+
+            :return: No return value
+
+        """
+
+        self._running = True
+        while self._running:
+            self.serve_once()
+
+    def shutdown(self):
+        """
+            Stop serve_forever(). Can be called from another thread.
+
+            :return: No return value
+
+        """
+        self._running = False
+        try:
+            self._wakeupWriter.send(b'\0')
+        except OSError:
+            pass
+
+    def close(self):
+        """
+            Disconnect all clients and remove the socket.
+
+            :return: No return value
+
+        """
+
+        for key in list(self._selector.get_map().values()):
+            self._selector.unregister(key.fileobj)
+            key.fileobj.close()
+
+        self._selector.close()
+        self._wakeupWriter.close()
+
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def flush(self):
+        """
+            Send the displays that have committed changes. A display that fails to send (an I2C
+            error) is logged, and sent again at the next frame.
+
+            :return: No return value
+
+        """
+
+        failed = set()
+        for iDisplay in sorted(self._dirty):
+            try:
+                self.displays[iDisplay].display()
+            except (IOError, OSError) as exError:
+                print("Display server - unable to send display %d: %s" % (iDisplay, exError), file=sys.stderr)
+                failed.add(iDisplay)
+
+        self._dirty = failed
+        self._lastFlush = time.monotonic()
+
+    #--------------------------------------------------------------------------
+    # Connection handling
+
+    def _accept(self):
+
+        sock, _ = self._sock.accept()
+        sock.setblocking(False)
+        self._selector.register(sock, selectors.EVENT_READ, _Client(sock))
+
+    def _drain_wakeup(self):
+
+        try:
+            while self._wakeup.recv(64):
+                pass
+        except (BlockingIOError, InterruptedError):
+            pass
+
+    def _drop(self, client):
+
+        self._selector.unregister(client.sock)
+        client.sock.close()
+
+    def _read(self, client):
+
+        try:
+            data = client.sock.recv(65536)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            data = b''
+
+        if not data:
+            self._drop(client)
+            return
+
+        client.data += data
+
+        try:
+            self._parse(client)
+        except (ValueError, IndexError, KeyError, struct.error) as exError:
+            print("Display server - invalid message from client: %s" % exError, file=sys.stderr)
+            self._drop(client)
+
+    def _parse(self, client):
+
+        iStart = 0
+        while len(client.data) - iStart >= _HEADER.size:
+
+            op, iDisplay, nPayload = _HEADER.unpack_from(client.data, iStart)
+            if len(client.data) - iStart - _HEADER.size < nPayload:
+                break
+
+            payload = bytes(client.data[iStart + _HEADER.size:iStart + _HEADER.size + nPayload])
+            iStart += _HEADER.size + nPayload
+
+            if iDisplay >= len(self.displays):
+                raise ValueError("no display %d" % iDisplay)
+
+            if op == OP_COMMIT:
+                operations = client.pending
+                client.pending = []
+                client.pendingBytes = 0
+                self._commit(operations)
+            elif op == OP_DEFINE_BITMAP:
+                self._define_bitmap(payload)
+            elif OP_CLEAR <= op <= OP_BITMAP:
+                client.pendingBytes += _HEADER.size + nPayload
+                if client.pendingBytes > _MAX_PENDING:
+                    raise ValueError("more than %d bytes of operations before a commit" % _MAX_PENDING)
+                client.pending.append((op, iDisplay, payload))
+            else:
+                raise ValueError("unknown operation %d" % op)
+
+        del client.data[:iStart]
+
+    #--------------------------------------------------------------------------
+    # Operations
+
+    # Apply the operations of a commit - all of them, or none. If an operation is invalid, the
+    # screen buffers are restored before the error is raised, so a half drawn frame is never sent.
+
+    def _commit(self, operations):
+
+        backups = {}
+        try:
+            for op, iDisplay, payload in operations:
+                oled = self.displays[iDisplay]
+                if iDisplay not in backups:
+                    backups[iDisplay] = bytes(oled.get_screenbuffer())
+                self._apply(op, oled, payload)
+
+        except BaseException:
+            for iDisplay, backup in backups.items():
+                self.displays[iDisplay].get_screenbuffer()[:] = backup
+            raise
+
+        self._dirty.update(backups)
+
+    def _define_bitmap(self, payload):
+
+        bId, width, height = _DEFINE_BITMAP.unpack_from(payload)
+        pages = (height + 7)//8
+        data = payload[_DEFINE_BITMAP.size:]
+        if len(data) != width * pages:
+            raise ValueError("bitmap %d - invalid size" % bId)
+
+        # the mask covers the rows of the bitmap - the last page may be partial
+        mask = bytearray(b'\xff' * (width * pages))
+        if height % 8:
+            mask[-width:] = bytes([(1 << (height % 8)) - 1]) * width
+
+        self._bitmaps[bId] = (width, pages, data, bytes(mask))
+
+    def _apply(self, op, oled, payload):
+
+        if op == OP_CLEAR:
+            oled.clear(oled.PAGE)
+
+        elif op == OP_REGION:
+            x, page, width, pages = _REGION.unpack_from(payload)
+            data = payload[_REGION.size:]
+            if len(data) != width * pages:
+                raise ValueError("region - invalid size")
+            oled_bitmap.blit_pages(oled.get_screenbuffer(), oled.LCDWIDTH, len(oled.get_screenbuffer())//oled.LCDWIDTH,
+                                   x, page, data, b'\xff' * len(data), width, pages)
+
+        elif op == OP_TEXT:
+            x, y, font, color, mode = _TEXT.unpack_from(payload)
+            oled.set_font_type(font)
+            oled.set_color(color)
+            oled.set_draw_modee(mode)
+            oled.set_cursor(x, y)
+            oled.print(payload[_TEXT.size:].decode('utf-8'))
+
+        elif op == OP_RECT:
+            x, y, width, height, color, mode, fill = _RECT.unpack_from(payload)
+            if fill:
+                _rect_fill(oled, x, y, width, height, color, mode)
+            else:
+                _rect(oled, x, y, width, height, color, mode)
+
+        elif op == OP_LINE:
+            x0, y0, x1, y1, color, mode = _LINE.unpack_from(payload)
+            _line(oled, x0, y0, x1, y1, color, mode)
+
+        elif op == OP_BITMAP:
+            bId, x, y = _BITMAP.unpack_from(payload)
+            width, pages, data, mask = self._bitmaps[bId]
+            shift = y % 8
+            oled_bitmap.blit_pages(oled.get_screenbuffer(), oled.LCDWIDTH, len(oled.get_screenbuffer())//oled.LCDWIDTH,
+                                   x, y//8, oled_bitmap.shift_pages(data, width, pages, shift),
+                                   oled_bitmap.shift_pages(mask, width, pages, shift), width, pages + (1 if shift else 0))
+
+#-----------------------------------------
+# Shapes clipped to the display - they draw the same pixels as the QwiicOledBase methods,
+# without visiting the pixels off the display
+
+def _clip(start, length, limit):
+
+    # the part of start..start+length-1 in 0..limit-1, as (start, length)
+    end = min(start + length, limit)
+    start = max(start, 0)
+    return start, max(0, end - start)
+
+def _rect_fill(oled, x, y, width, height, color, mode):
+
+    if x >= oled.LCDWIDTH or y >= oled.LCDHEIGHT or x + width <= 0 or y + height <= 0:
+        raise ValueError("rectangle - off the display")
+
+    x, width = _clip(x, width, oled.LCDWIDTH)
+    y, height = _clip(y, height, oled.LCDHEIGHT)
+    oled.rect_fill(x, y, width, height, color, mode)
+
+def _rect(oled, x, y, width, height, color, mode):
+
+    if x >= oled.LCDWIDTH or y >= oled.LCDHEIGHT or x + width <= 0 or y + height <= 0:
+        raise ValueError("rectangle - off the display")
+
+    # the edges on the display - drawn in the order of QwiicOledBase.rect(), for XOR
+    xStart, xWidth = _clip(x, width, oled.LCDWIDTH)
+    for yEdge in (y, y + height - 1):
+        if 0 <= yEdge < oled.LCDHEIGHT:
+            oled.line_h(xStart, yEdge, xWidth, color, mode)
+
+    if height - 2 < 1:
+        return
+
+    yStart, yHeight = _clip(y + 1, height - 2, oled.LCDHEIGHT)
+    for xEdge in (x, x + width - 1):
+        if 0 <= xEdge < oled.LCDWIDTH:
+            oled.line_v(xEdge, yStart, yHeight, color, mode)
+
+def _line(oled, x0, y0, x1, y1, color, mode):
+
+    if max(x0, x1) < 0 or max(y0, y1) < 0 or min(x0, x1) >= oled.LCDWIDTH or min(y0, y1) >= oled.LCDHEIGHT:
+        raise ValueError("line - off the display")
+
+    # QwiicOledBase.line() - Bresenham, stepping along the major axis
+    steep = abs(y1 - y0) > abs(x1 - x0)
+    if steep:
+        (x0, y0) = (y0, x0)
+        (x1, y1) = (y1, x1)
+
+    if x0 > x1:
+        (x0, x1) = (x1, x0)
+        (y0, y1) = (y1, y0)
+
+    dx = x1 - x0
+    dy = abs(y1 - y0)
+    err = dx // 2
+    ystep = 1 if y0 < y1 else -1
+
+    # only the steps with the major axis on the display. The minor axis position at step i
+    # is the number of times the error went negative in the steps before it.
+    limit = oled.LCDHEIGHT if steep else oled.LCDWIDTH
+    for i in range(max(0, -x0), min(dx, limit - x0)):
+        y = y0 + ystep * max(0, -((err - i * dy) // dx))
+        if steep:
+            oled.pixel(y, x0 + i, color, mode)
+        else:
+            oled.pixel(x0 + i, y, color, mode)
+
+#-----------------------------------------
+class DisplayClient(object):
+    """
+    DisplayClient
+
+        Draws on the displays of a display server. Operations are buffered, and sent to
+        the server by commit(). The server applies them together.
+
+        :param path: Path of the unix domain socket of the server
+        :return: The client object
+        :rtype: Object
+    """
+
+    def __init__(self, path):
+
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.connect(path)
+        self._data = bytearray()
+
+    def _op(self, op, display, payload=b''):
+
+        if len(payload) > _MAX_PAYLOAD:
+            raise ValueError("Operation too large for the display protocol")
+
+        self._data += _HEADER.pack(op, display, len(payload)) + payload
+
+    def clear(self, display=0):
+        """ Clear the screen buffer of a display """
+        self._op(OP_CLEAR, display)
+
+    def region(self, x, page, width, pages, data, display=0):
+        """ Copy a page format region into the screen buffer, at column x and page """
+        self._op(OP_REGION, display, _REGION.pack(x, page, width, pages) + bytes(bytearray(data)))
+
+    def text(self, x, y, text, font=0, color=1, mode=0, display=0):
+        """ Print text at x,y """
+        self._op(OP_TEXT, display, _TEXT.pack(x, y, font, color, mode) + text.encode('utf-8'))
+
+    def rect(self, x, y, width, height, color=1, mode=0, fill=False, display=0):
+        """ Draw a rectangle, optionally filled """
+        self._op(OP_RECT, display, _RECT.pack(x, y, width, height, color, mode, 1 if fill else 0))
+
+    def line(self, x0, y0, x1, y1, color=1, mode=0, display=0):
+        """ Draw a line """
+        self._op(OP_LINE, display, _LINE.pack(x0, y0, x1, y1, color, mode))
+
+    def define_bitmap(self, bitmap_id, width, height, data):
+        """ Define a page format bitmap, drawn later with bitmap() - by any client """
+        self._op(OP_DEFINE_BITMAP, 0, _DEFINE_BITMAP.pack(bitmap_id, width, height) + bytes(bytearray(data)))
+
+    def bitmap(self, bitmap_id, x, y, display=0):
+        """ Draw a defined bitmap at x,y """
+        self._op(OP_BITMAP, display, _BITMAP.pack(bitmap_id, x, y))
+
+    def commit(self):
+        """ Send the buffered operations - the server applies them together """
+        self._op(OP_COMMIT, 0)
+        self._sock.sendall(self._data)
+        self._data = bytearray()
+
+    def close(self):
+        """ Disconnect from the server """
+        self._sock.close()
+
+#-----------------------------------------
+# Server entry point
+
+def main(argv=None):
+    """
+        Run a display server.
+
+        usage: qwiic-oled-server [--socket PATH] [--display WIDTHxHEIGHT[@ADDRESS]]... [--fps FPS] [--warm]
+
+    """
+
+    parser = argparse.ArgumentParser(description="SparkFun qwiic OLED display server")
+    parser.add_argument('--socket', default='/run/qwiic-oled.sock', help="path of the unix domain socket")
+    parser.add_argument('--display', action='append', default=None,
+                        help="display as WIDTHxHEIGHT[@ADDRESS], for example 128x64@0x3C. Can be repeated")
+    parser.add_argument('--fps', type=float, default=30, help="maximum frames per second sent to a display")
+    parser.add_argument('--warm', action='store_true', help="attach to already initialized displays")
+    args = parser.parse_args(argv)
+
+    if not args.fps > 0:
+        parser.error("--fps must be greater than 0")
+
+    from .qwiic_oled_base import QwiicOledBase # pylint: disable=import-outside-toplevel
+
+    displays = []
+    for spec in args.display or ['128x64']:
+        size, _, address = spec.partition('@')
+        width, height = [int(value) for value in size.lower().split('x')]
+        oled = QwiicOledBase(int(address, 0) if address else None, width, height, splash=False)
+        oled.begin(warm=args.warm)
+        displays.append(oled)
+
+    server = DisplayServer(displays, args.socket, args.fps)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,400 @@
+#-----------------------------------------------------------------------------
+# oled_shared.py
+#
+# Shared memory frame buffer - many drawing processes, one process on the bus
+#
+#------------------------------------------------------------------------
+#
+# Written by  SparkFun Electronics, October 2026
+#
+# This python library supports the SparkFun Electroncis qwiic
+# qwiic sensor/board ecosystem on a Raspberry Pi (and compatable) single
+# board computers.
+#
+# More information on qwiic is at https://www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#
+#==================================================================================
+# Copyright (c) 2026 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#==================================================================================
+#
+# Only one process can own the display and the I2C bus. With a shared frame, other
+# processes each own a region of the screen and draw into it with a SharedCanvas -
+# the same drawing API as QwiicOledBase. Calling display() on a canvas publishes
+# its region into shared memory. The process that owns the display runs a
+# SharedFlusher, which picks up the regions that changed and sends them.
+#
+# Each region has one writer, and a sequence counter used as a seqlock: the
+# writer makes the counter odd while it copies the region in, and even when done.
+# The flusher only takes a copy of a region if the counter was even and did not
+# change while it was copying. Frames are never pickled or sent through a pipe.
+#
+# Regions must be page aligned (y and height multiples of 8), so two regions
+# never share a byte of the frame.
+#
+# Shared Memory Structure
+#   bytes 0-15      header - 'QOLS', version, number of regions, width, height
+#   16 bytes        per region - x, y, width, height, sequence counter
+#   N bytes         the frame, in page format (N = width * pages)
+#
+
+import struct
+import time
+
+from multiprocessing import shared_memory
+
+from .qwiic_oled_base import QwiicOledBase
+from .oled_virtual import NullDriver
+
+_MAGIC = b'QOLS'
+_VERSION = 1
+
+_HEADER = struct.Struct('<4sBBHH6x')
+_REGION = struct.Struct('<HHHHI4x')
+_SEQUENCE = struct.Struct('<I')
+_SEQUENCE_OFFSET = 8        # offset of the counter in a region entry
+
+#-----------------------------------------
+# The shared frame
+
+class SharedFrame(object):
+    """
+    SharedFrame
+
+        :param name: The name of the shared memory block
+        :param width: The width of the frame in pixels. Only used when creating the frame.
+        :param height: The height of the frame in pixels. Only used when creating the frame.
+        :param regions: List of regions (x, y, width, height) of the screen, one per drawing
+                        process. If set, the shared frame is created, otherwise an existing
+                        shared frame is attached to.
+        :return: The shared frame object
+        :rtype: Object
+    """
+
+    def __init__(self, name, width=None, height=None, regions=None):
+
+        self._owner = regions is not None
+
+        if self._owner:
+            for (x, y, rWidth, rHeight) in regions:
+                if y % 8 or rHeight % 8 or x < 0 or y < 0 or x + rWidth > width or y + rHeight > height:
+                    raise ValueError("Invalid region (%d, %d, %d, %d) - regions must be on the screen, with y and height a multiple of 8" % (x, y, rWidth, rHeight))
+
+            size = _HEADER.size + _REGION.size * len(regions) + width * ((height + 7)//8)
+            self._shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+            _created.add(self._shm.name)
+
+            _HEADER.pack_into(self._shm.buf, 0, _MAGIC, _VERSION, len(regions), width, height)
+            for iRegion, region in enumerate(regions):
+                _REGION.pack_into(self._shm.buf, _HEADER.size + iRegion * _REGION.size, *(tuple(region) + (0,)))
+
+        else:
+            self._shm = _attach(name)
+
+        magic, version, nRegions, self.width, self.height = _HEADER.unpack_from(self._shm.buf, 0)
+        if magic != _MAGIC or version != _VERSION:
+            self._shm.close()
+            raise ValueError("Not an OLED shared frame: %s" % name)
+
+        self.regions = [_REGION.unpack_from(self._shm.buf, _HEADER.size + iRegion * _REGION.size)[:4] for iRegion in range(nRegions)]
+
+        self._frameStart = _HEADER.size + _REGION.size * nRegions
+        self._frame = self._shm.buf[self._frameStart:self._frameStart + self.width * ((self.height + 7)//8)]
+
+    def sequence(self, iRegion):
+        """
+            The sequence counter of a region. Odd while the region is being written.
+
+            :param iRegion: The region index
+            :return: The sequence counter
+            :rtype: integer
+
+        """
+        return _SEQUENCE.unpack_from(self._shm.buf, _HEADER.size + iRegion * _REGION.size + _SEQUENCE_OFFSET)[0]
+
+    def _set_sequence(self, iRegion, sequence):
+
+        _SEQUENCE.pack_into(self._shm.buf, _HEADER.size + iRegion * _REGION.size + _SEQUENCE_OFFSET, sequence & 0xFFFFFFFF)
+
+    def publish(self, iRegion, screenbuffer):
+        """
+            Copy a region of a screen buffer into the shared frame. Only the one writer of the
+            region may call this.
+
+            :param iRegion: The region index
+            :param screenbuffer: A full screen buffer, in page format
+            :return: No return value
+
+        """
+
+        x, y, rWidth, rHeight = self.regions[iRegion]
+        sequence = self.sequence(iRegion)
+
+        self._set_sequence(iRegion, sequence + 1)   # odd - being written
+
+        for page in range(y//8, (y + rHeight)//8):
+            iStart = page * self.width + x
+            self._frame[iStart:iStart+rWidth] = screenbuffer[iStart:iStart+rWidth]
+
+        self._set_sequence(iRegion, sequence + 2)
+
+    def read(self, iRegion):
+        """
+            Take a consistent copy of a region of the shared frame.
+
+            :param iRegion: The region index
+            :return: The sequence counter and the region rows, one bytes object per page. None if
+                    the region is being written - try again later.
+            :rtype: tuple
+
+        """
+
+        sequence = self.sequence(iRegion)
+        if sequence & 1:
+            return None
+
+        x, y, rWidth, rHeight = self.regions[iRegion]
+        rows = [bytes(self._frame[page * self.width + x:page * self.width + x + rWidth]) for page in range(y//8, (y + rHeight)//8)]
+
+        if self.sequence(iRegion) != sequence:
+            return None
+
+        return sequence, rows
+
+    def close(self):
+        """
+            Detach from the shared frame. The owner also removes the shared memory block.
+
+            :return: No return value
+
+        """
+
+        self._frame.release()
+        self._shm.close()
+        if self._owner:
+            _created.discard(self._shm.name)
+            self._shm.unlink()
+
+# Attaching to shared memory registers it with the resource tracker, which removes the block
+# when the attaching process exits. Only the owner should do that. Python 3.13 and later can
+# skip the tracking, before that the block is unregistered after attaching - unless it was
+# created by this process, where the registration is the owner's, removed when it unlinks.
+
+# the names of the shared frames created by this process
+_created = set()
+
+def _attach(name):
+
+    try:
+        return shared_memory.SharedMemory(name=name, track=False) # pylint: disable=unexpected-keyword-arg
+    except TypeError:
+        pass
+
+    shm = shared_memory.SharedMemory(name=name)
+    if shm.name in _created:
+        return shm
+
+    try:
+        from multiprocessing import resource_tracker # pylint: disable=import-outside-toplevel
+        resource_tracker.unregister(shm._name, 'shared_memory') # pylint: disable=protected-access
+    except Exception: # pylint: disable=broad-except
+        pass
+
+    return shm
+
+#-----------------------------------------
+# A canvas for one region of a shared frame
+
+class SharedCanvas(QwiicOledBase):
+    """
+    SharedCanvas
+
+        A drawing surface for one region of a shared frame, with the QwiicOledBase drawing API.
+        Coordinates are screen coordinates. display() publishes the region to the shared frame,
+        the canvas never uses the I2C bus - display commands such as invert() and contrast() go
+        to a null driver, and do nothing.
+
+        :param name: The name of the shared frame
+        :param region: The index of the region this canvas draws
+        :return: The canvas object
+        :rtype: Object
+    """
+
+    def __init__(self, name, region):
+
+        self._sharedFrame = SharedFrame(name)
+        self._region = region
+
+        QwiicOledBase.__init__(self, pixel_width=self._sharedFrame.width, pixel_height=self._sharedFrame.height,
+                               i2c_driver=NullDriver(), splash=False)
+
+        self.set_font_type(0)
+
+    def is_connected(self):
+        """
+            A canvas has no device - it is always connected.
+
+            :return: True
+            :rtype: bool
+
+        """
+        return True
+
+    connected = property(is_connected)
+
+    def begin(self, warm=False):
+        """
+            Reset the drawing state of the canvas. There is no display to initialize.
+
+            :return: No return value
+
+        """
+        self.set_font_type(0)
+        self.set_color(self.WHITE)
+        self.set_draw_modee(self.NORM)
+        self.set_cursor(0, 0)
+
+    def _flush(self):
+
+        # display() publishes the region of this canvas to the shared frame
+        self._sharedFrame.publish(self._region, self._screenbuffer)
+
+    def display_iter(self, per_page=False):
+        """
+            Publish the region of this canvas - at once, there are no steps.
+
+            :return: An empty iterator
+
+        """
+        self.display()
+        return iter(())
+
+    def close(self):
+        """
+            Detach from the shared frame.
+
+            :return: No return value
+
+        """
+        self._sharedFrame.close()
+
+#-----------------------------------------
+# The flusher - runs in the process that owns the display
+
+class SharedFlusher(object):
+    """
+    SharedFlusher
+
+        Copies the regions of a shared frame that changed into a display, and sends them.
+
+        :param oled: The display (QwiicOledBase) - owned by this process
+        :param shared_frame: The shared frame (SharedFrame)
+        :return: The flusher object
+        :rtype: Object
+    """
+
+    def __init__(self, oled, shared_frame):
+
+        self._oled = oled
+        self._sharedFrame = shared_frame
+
+        # the last sequence counter seen for each region
+        self._seen = [None] * len(shared_frame.regions)
+
+        self._running = False
+
+    def poll(self):
+        """
+            Copy the regions that changed into the display, and send them.
+
+            :return: True if any region changed
+            :rtype: bool
+
+        """
+
+        oled = self._oled
+        screenbuffer = oled.get_screenbuffer()
+        width = oled.get_lcd_width()
+        bChanged = False
+
+        # The bus lock keeps display() and frame() out while the regions are copied in. In
+        # thread safe mode, drawing threads only hold page locks - take the lock of each page.
+        with oled._busLock: # pylint: disable=protected-access
+
+            # the display is drawing a frame of its own - copy the regions in after it
+            if oled.in_frame():
+                return False
+
+            pageLocks = oled._pageLocks # pylint: disable=protected-access
+
+            for iRegion, (x, y, _, _) in enumerate(self._sharedFrame.regions):
+
+                if self._sharedFrame.sequence(iRegion) == self._seen[iRegion]:
+                    continue
+
+                result = self._sharedFrame.read(iRegion)
+                if result is None:
+                    continue    # being written - pick it up on the next poll
+
+                sequence, rows = result
+                for iRow, row in enumerate(rows):
+                    page = y//8 + iRow
+                    iStart = page * width + x
+                    if pageLocks is None:
+                        screenbuffer[iStart:iStart+len(row)] = row
+                    else:
+                        with pageLocks[page]:
+                            screenbuffer[iStart:iStart+len(row)] = row
+
+                self._seen[iRegion] = sequence
+                bChanged = True
+
+            if bChanged:
+                oled.display()
+
+        return bChanged
+
+    def run(self, fps=30):
+        """
+            Poll the shared frame at a fixed rate, until stop() is called.
+
+            :param fps: Polls per second
+            :return: No return value
+
+        """
+
+        period = 1.0 / fps
+        self._running = True
+
+        while self._running:
+            tStart = time.monotonic()
+            self.poll()
+            time.sleep(max(0.0, period - (time.monotonic() - tStart)))
+
+    def stop(self):
+        """
+            Stop a running flusher.
+
+            :return: No return value
+
+        """
+        self._running = False
@@ -0,0 +1,295 @@
+#-----------------------------------------------------------------------------
+# oled_stats.py
+#
+# Latency histograms for the OLED display
+#
+#------------------------------------------------------------------------
+#
+# Written by  SparkFun Electronics, October 2026
+#
+# This python library supports the SparkFun Electroncis qwiic
+# qwiic sensor/board ecosystem on a Raspberry Pi (and compatable) single
+# board computers.
+#
+# More information on qwiic is at https://www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#
+#==================================================================================
+# Copyright (c) 2026 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#==================================================================================
+#
+#
+# Status panels have soft real time needs - the numbers that matter are the tail
+# latencies, not the averages. A LatencyHistogram records latencies in buckets of
+# fixed relative precision (HDR histogram style): values are in microseconds, the
+# buckets are exact up to 128us, and above that each power of two is split into
+# 64 buckets - better than 1.6% precision, in a fixed size list of counts. Any
+# number of samples uses the same memory, and recording is a few integer ops.
+#
+# FrameStats keeps two histograms for a display - the time in display() (the
+# transfer), and the time of each whole frame (drawing plus transfer) - and counts
+# the frames that missed the deadline of a target frame rate. A whole frame is
+# timed from the mark of the start of drawing (start_frame()) - time a loop spends
+# idle between frames is not frame time, and frames without a mark are not timed.
+#
+
+_SUB_BITS = 7
+_SUB_COUNT = 1 << _SUB_BITS
+_HALF_COUNT = _SUB_COUNT >> 1
+
+#-----------------------------------------
+class LatencyHistogram(object):
+    """
+    LatencyHistogram
+
+        :param highest: The highest latency tracked, in seconds - higher values are counted in
+                        the last bucket (the maximum is still exact). Default is 60 seconds.
+        :return: The histogram object
+        :rtype: Object
+    """
+
+    def __init__(self, highest=60.0):
+
+        self._nBuckets = self._bucket(int(highest * 1e6)) + 1
+        self.counts = [0] * self._nBuckets
+
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    @staticmethod
+    def _bucket(value):
+
+        if value < _SUB_COUNT:
+            return value
+
+        exponent = value.bit_length() - _SUB_BITS
+        return _SUB_COUNT + (exponent - 1) * _HALF_COUNT + ((value >> exponent) - _HALF_COUNT)
+
+    @staticmethod
+    def _bucket_high(bucket):
+
+        # the highest value counted in a bucket, in microseconds
+        if bucket < _SUB_COUNT:
+            return bucket
+
+        exponent = (bucket - _SUB_COUNT)//_HALF_COUNT + 1
+        mantissa = (bucket - _SUB_COUNT) % _HALF_COUNT + _HALF_COUNT
+        return ((mantissa + 1) << exponent) - 1
+
+    def record(self, seconds):
+        """
+            Record a latency.
+
+            :param seconds: The latency in seconds
+            :return: No return value
+
+        """
+
+        value = int(seconds * 1e6)
+        self.counts[min(self._bucket(value) if value > 0 else 0, self._nBuckets - 1)] += 1
+
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, percent):
+        """
+            The latency at a percentile.
+
+            :param percent: The percentile, 0-100
+            :return: The latency in seconds - the highest value of its bucket, at most the maximum
+            :rtype: float
+
+        """
+
+        if not self.count:
+            return 0.0
+
+        target = max(1, int(round(self.count * percent / 100.0)))
+        seen = 0
+        for bucket, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return min(self._bucket_high(bucket) / 1e6, self.max)
+
+        return self.max
+
+    def reset(self):
+        """
+            Clear the histogram.
+
+            :return: No return value
+
+        """
+
+        self.counts = [0] * self._nBuckets
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def summary(self):
+        """
+            The count, mean, p50, p95, p99 and max of the latencies, in seconds.
+
+            :return: The summary
+            :rtype: dict
+
+        """
+
+        return {'count': self.count,
+                'mean': self.total / self.count if self.count else 0.0,
+                'p50': self.percentile(50),
+                'p95': self.percentile(95),
+                'p99': self.percentile(99),
+                'max': self.max}
+
+#-----------------------------------------
+class FrameStats(object):
+    """
+    FrameStats
+
+        :param fps: The target frame rate - frames longer than 1/fps are missed deadlines. None
+                    for no deadline.
+        :return: The frame statistics object
+        :rtype: Object
+    """
+
+    def __init__(self, fps=None):
+
+        self.display = LatencyHistogram()
+        self.frame = LatencyHistogram()
+
+        self.fps = fps
+        self.deadline = 1.0 / fps if fps else None
+        self.missed = 0
+
+        self._tFrameStart = None
+
+    def start_frame(self, tStart):
+        """
+            Mark the start of drawing a frame. Only frames with a mark are recorded as whole
+            frames, and checked against the deadline.
+
+            :param tStart: The time, from time.perf_counter()
+            :return: No return value
+
+        """
+        self._tFrameStart = tStart
+
+    def record(self, tStart, tEnd):
+        """
+            Record a display() call.
+
+            :param tStart: The time display() started, from time.perf_counter()
+            :param tEnd: The time display() finished
+            :return: No return value
+
+        """
+
+        self.display.record(tEnd - tStart)
+
+        if self._tFrameStart is not None:
+            frameTime = tEnd - self._tFrameStart
+            self.frame.record(frameTime)
+            if self.deadline is not None and frameTime > self.deadline:
+                self.missed += 1
+
+        self._tFrameStart = None
+
+    def reset(self):
+        """
+            Clear the statistics.
+
+            :return: No return value
+
+        """
+
+        self.display.reset()
+        self.frame.reset()
+        self.missed = 0
+        self._tFrameStart = None
+
+    def summary(self):
+        """
+            The latency summaries of display() and of whole frames, and the missed deadlines.
+
+            :return: display, frame, target_fps and missed_deadlines
+            :rtype: dict
+
+        """
+
+        return {'display': self.display.summary(),
+                'frame': self.frame.summary(),
+                'target_fps': self.fps,
+                'missed_deadlines': self.missed}
+
+#-----------------------------------------
+class DisplayCounters(object):
+    """
+    DisplayCounters
+
+        The transfer counters of a display - updated by display().
+
+        :return: The counters object
+        :rtype: Object
+    """
+
+    def __init__(self):
+
+        self.reset()
+
+    def reset(self):
+        """
+            Set the counters to zero.
+
+            :return: No return value
+
+        """
+
+        self.frames = 0         # frames sent
+        self.bytes = 0          # bytes sent - commands and data
+        self.transactions = 0   # I2C writes
+        self.bus_time = 0.0     # seconds in display() calls that sent data
+        self.merged = 0         # display() calls merged into a later frame by the frame rate limit
+        self.dropped = 0        # frames replaced by a newer frame before they were sent (see FlushScheduler)
+        self.retries = 0        # block writes retried after an I2C error
+        self.errors = 0         # block writes that failed after all retries
+
+    def as_dict(self):
+        """
+            The counters.
+
+            :return: frames, bytes, transactions, bus_time, merged, dropped, retries and errors
+            :rtype: dict
+
+        """
+
+        return {'frames': self.frames,
+                'bytes': self.bytes,
+                'transactions': self.transactions,
+                'bus_time': self.bus_time,
+                'merged': self.merged,
+                'dropped': self.dropped,
+                'retries': self.retries,
+                'errors': self.errors}
@@ -0,0 +1,249 @@
+#-----------------------------------------------------------------------------
+# oled_text_cache.py
+#
+# A cache of rendered text for the OLED display
+#
+#------------------------------------------------------------------------
+#
+# Written by  SparkFun Electronics, October 2026
+#
+# This python library supports the SparkFun Electroncis qwiic
+# qwiic sensor/board ecosystem on a Raspberry Pi (and compatable) single
+# board computers.
+#
+# More information on qwiic is at https://www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#
+#==================================================================================
+# Copyright (c) 2026 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#==================================================================================
+#
+# Labels on a dashboard are drawn every frame, and drawing a string one pixel at
+# a time is slow. This cache holds strings that have already been rasterized, in
+# the page format of the screen buffer, so drawing them again is a blit.
+#
+# A rendered string is stored as a source bitmap and a mask. The mask selects the
+# bits the string touches, so the draw color and mode are baked into the entry:
+#
+#   NORM, WHITE  - source is the glyph bits, mask is the character cells
+#   NORM, BLACK  - source is clear, mask is the character cells
+#   XOR, WHITE   - source and mask are the glyph bits
+#   XOR, BLACK   - nothing is drawn
+#
+# This is the same result draw_char() gives, pixel by pixel.
+#
+# Text drawn at a y that is not a multiple of 8 spans an extra page. The shifted
+# versions of a string are built the first time they are needed, and kept with
+# the entry.
+#
+
+from collections import OrderedDict
+
+from . import oled_bitmap
+
+#-----------------------------------------
+# A rasterized string
+
+class RenderedText(object):
+
+    def __init__(self, src, mask, width, pages, xor):
+
+        self.width = width
+        self.pages = pages
+        self.xor = xor
+
+        # shift -> (source, mask)
+        self._variants = {0: (src, mask)}
+
+    def variant(self, shift):
+        """
+            Return the source and mask of the string, shifted down by 0-7 pixels.
+
+            :param shift: The number of pixels to shift by
+            :return: source bitmap, mask bitmap
+            :rtype: tuple
+
+        """
+
+        bitmaps = self._variants.get(shift)
+        if bitmaps is None:
+            src, mask = self._variants[0]
+            bitmaps = (oled_bitmap.shift_pages(src, self.width, self.pages, shift),
+                       oled_bitmap.shift_pages(mask, self.width, self.pages, shift))
+            self._variants[shift] = bitmaps
+
+        return bitmaps
+
+    def nbytes(self):
+        """
+            The memory used by the bitmaps of this string.
+
+            :return: number of bytes
+            :rtype: integer
+
+        """
+        return sum(len(src) + len(mask) for src, mask in self._variants.values())
+
+#-----------------------------------------
+def render_text(font, codes, advance, color, mode, lookup=None):
+    """
+        Rasterize a string into a page format bitmap.
+
+        :param font: The font used for the string
+        :param codes: The character codes of the string
+        :param advance: The distance between characters, in pixels
+        :param color: The draw color. WHITE (1) draws the glyph bits, any other color clears them.
+        :param mode: The draw mode. NORM (0) or XOR (1)
+        :param lookup: Function returning the rows of a character. If not set, font.glyph is used.
+
+        :return: The rendered string
+        :rtype: RenderedText
+
+    """
+
+    if lookup is None:
+        lookup = font.glyph
+
+    pages = (font.height + 7)//8
+    width = (len(codes) - 1) * advance + font.cell_width if codes else 0
+
+    ink = bytearray(width * pages)
+    cell = bytearray(width * pages)
+
+    for iChar, c in enumerate(codes):
+
+        rows = lookup(c)
+        if rows is None:
+            continue
+
+        xPos = iChar * advance
+        for row in range(min(pages, len(rows))):
+            fBuffer = rows[row]
+            nCol = min(len(fBuffer), width - xPos)
+            iStart = row * width + xPos
+            ink[iStart:iStart+nCol] = fBuffer[:nCol]
+            cell[iStart:iStart+nCol] = b'\xff' * nCol
+
+    xor = (mode == 1)
+
+    src = ink if color == 1 else bytearray(len(ink))
+    mask = src if xor else cell
+
+    return RenderedText(bytes(src), bytes(mask), width, pages, xor)
+
+#-----------------------------------------
+# The cache - an LRU of rendered strings.
+
+class TextCache(object):
+
+    def __init__(self, max_entries=64):
+
+        self.max_entries = max_entries
+
+        self._entries = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """
+            Look up a rendered string.
+
+            :param key: The key of the string - (font, text, color, mode)
+            :return: The rendered string, or None if it is not in the cache
+            :rtype: RenderedText
+
+        """
+
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key, entry):
+        """
+            Add a rendered string to the cache, evicting the least recently used strings
+            if the cache is full.
+
+            :param key: The key of the string - (font, text, color, mode)
+            :param entry: The rendered string
+            :return: No return value
+
+        """
+
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def resize(self, max_entries):
+        """
+            Change the size of the cache.
+
+            :param max_entries: The maximum number of strings in the cache
+            :return: No return value
+
+        """
+
+        self.max_entries = max_entries
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        """
+            Remove all strings from the cache. The statistics are not reset.
+
+            :return: No return value
+
+        """
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        """
+            The cache statistics.
+
+            :return: hits, misses, evictions, entries, max_entries, bytes and hit_rate
+            :rtype: dict
+
+        """
+
+        lookups = self.hits + self.misses
+
+        return {'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'bytes': sum(entry.nbytes() for entry in self._entries.values()),
+                'hit_rate': (self.hits / float(lookups)) if lookups else 0.0}
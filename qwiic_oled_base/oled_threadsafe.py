@@ -0,0 +1,236 @@
+#-----------------------------------------------------------------------------
+# oled_threadsafe.py
+#
+# Thread safe drawing for the OLED display
+#
+#------------------------------------------------------------------------
+#
+# Written by  SparkFun Electronics, October 2026
+#
+# This python library supports the SparkFun Electroncis qwiic
+# qwiic sensor/board ecosystem on a Raspberry Pi (and compatable) single
+# board computers.
+#
+# More information on qwiic is at https://www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#
+#==================================================================================
+# Copyright (c) 2026 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#==================================================================================
+#
+#
+# The drawing methods of QwiicOledBase use shared state - the cursor, color, draw
+# mode and font - and change the screen buffer without locks. ThreadSafeDrawing
+# (from oled.thread_safe()) is a drawing API for many threads:
+#
+#   - each call takes its color, mode and font as parameters - no shared state
+#   - each call locks only the pages of the screen it changes, in page order, so
+#     threads drawing in different parts of the screen don't wait for each other
+#   - display() sends a copy of the screen buffer taken with all pages locked, so
+#     a call is never sent half drawn
+#   - the I2C bus has its own lock, held for each group of commands and data -
+#     sending a frame doesn't block drawing
+#
+#   safe = oled.thread_safe()
+#   safe.text(0, 0, 'CPU 12%', font=0)          # in one thread
+#   safe.rect_fill(0, 40, 64, 8, safe.WHITE)    # in another
+#   safe.display()
+#
+
+import threading
+
+from . import oled_fonts
+from . import oled_bitmap
+from . import oled_text_cache
+
+#-----------------------------------------
+# Hold the locks of a range of pages
+
+class _PageLock(object):
+
+    def __init__(self, locks, first, last):
+
+        self._locks = locks[max(0, first):max(0, min(len(locks), last + 1))]
+
+    def __enter__(self):
+        for lock in self._locks:
+            lock.acquire()
+
+    def __exit__(self, *args):
+        for lock in reversed(self._locks):
+            lock.release()
+
+#-----------------------------------------
+class ThreadSafeDrawing(object):
+    """
+    ThreadSafeDrawing
+
+        The thread safe drawing API of a display - use oled.thread_safe() to get it.
+
+        :param oled: The display (QwiicOledBase)
+        :return: The drawing API object
+        :rtype: Object
+    """
+
+    BLACK = 0
+    WHITE = 1
+
+    NORM = 0
+    XOR = 1
+
+    def __init__(self, oled):
+
+        self._oled = oled
+        self._locks = oled._pageLocks # pylint: disable=protected-access
+
+        # rendered strings, shared by the drawing threads
+        self._textCache = oled_text_cache.TextCache()
+        self._cacheLock = threading.Lock()
+
+    def _pages(self, y0, y1):
+
+        # lock the pages that rows y0 to y1 are on
+        return _PageLock(self._locks, int(min(y0, y1))//8, int(max(y0, y1))//8)
+
+    #--------------------------------------------------------------------------
+    def pixel(self, x, y, color=WHITE, mode=NORM):
+        """ Draw a pixel at x,y """
+        with self._pages(y, y):
+            self._oled.pixel(x, y, color, mode)
+
+    def line(self, x0, y0, x1, y1, color=WHITE, mode=NORM):
+        """ Draw a line from x0,y0 to x1,y1 """
+        with self._pages(y0, y1):
+            self._oled.line(x0, y0, x1, y1, color, mode)
+
+    def line_h(self, x, y, width, color=WHITE, mode=NORM):
+        """ Draw a horizontal line from x,y """
+        with self._pages(y, y):
+            self._oled.line_h(x, y, width, color, mode)
+
+    def line_v(self, x, y, height, color=WHITE, mode=NORM):
+        """ Draw a vertical line from x,y """
+        with self._pages(y, y + height):
+            self._oled.line_v(x, y, height, color, mode)
+
+    def rect(self, x, y, width, height, color=WHITE, mode=NORM):
+        """ Draw a rectangle outline at x,y """
+        with self._pages(y, y + height):
+            self._oled.rect(x, y, width, height, color, mode)
+
+    def rect_fill(self, x, y, width, height, color=WHITE, mode=NORM):
+        """ Draw a filled rectangle at x,y """
+        with self._pages(y, y + height):
+            self._oled.rect_fill(x, y, width, height, color, mode)
+
+    def circle(self, x0, y0, radius, color=WHITE, mode=NORM):
+        """ Draw a circle outline centered at x0,y0 """
+        with self._pages(y0 - radius, y0 + radius):
+            self._oled.circle(x0, y0, radius, color, mode)
+
+    def clear(self, value=0):
+        """ Set every byte of the screen buffer to value """
+        with self._pages(0, self._oled.LCDHEIGHT - 1):
+            self._oled.clear(self._oled.PAGE, value)
+
+    #--------------------------------------------------------------------------
+    def text(self, x, y, text, font=0, color=WHITE, mode=NORM):
+        """
+            Draw text at x,y. Newlines start a new line at x.
+
+            :param x: The X position of the text
+            :param y: The Y position of the top of the text
+            :param text: The text. Characters that are not in the font are drawn from the
+                    fallback fonts of the display. A byte array or list of integers is drawn
+                    as font indexes.
+            :param font: The font index, or a font object
+            :param color: WHITE or BLACK
+            :param mode: NORM or XOR
+
+            :return: The x position after the text
+            :rtype: integer
+
+        """
+
+        fontObj = oled_fonts.get_font(font) if isinstance(font, int) else font
+        color = self.WHITE if color == self.WHITE else self.BLACK
+        mode = self.XOR if mode == self.XOR else self.NORM
+        fallbackFonts = tuple(self._oled._fallbackFonts) # pylint: disable=protected-access
+
+        # a list or array? If not, make it one - the same as QwiicOledBase.print()
+        if not hasattr(text, '__len__'):
+            text = str(text)
+        codes = tuple(text)
+
+        # split into lines - integer codes are font indexes, never newlines
+        lines = [[]]
+        for c in codes:
+            if c == '\n':
+                lines.append([])
+            elif c != '\r':
+                lines[-1].append(c)
+
+        def glyph(c):
+            for f in (fontObj,) + fallbackFonts:
+                rows = f.unicode_glyph(ord(c)) if isinstance(c, str) else f.glyph(c)
+                if rows is not None:
+                    return rows
+            return None
+
+        xPos = x
+        for iLine, line in enumerate(lines):
+            if not line:
+                continue
+
+            line = tuple(line)
+            key = (fontObj.serial, tuple(f.serial for f in fallbackFonts), line, color, mode)
+
+            # each line has its own position in the page, unless the font height is
+            # a multiple of 8
+            lineY = int(y) + iLine * fontObj.height
+
+            with self._cacheLock:
+                entry = self._textCache.get(key)
+                if entry is None:
+                    entry = oled_text_cache.render_text(fontObj, line, fontObj.width + 1, color, mode, glyph)
+                    self._textCache.put(key, entry)
+                src, mask = entry.variant(lineY % 8)
+
+            self._blit(x, lineY, entry, src, mask)
+            xPos = x + len(line) * (fontObj.width + 1)
+
+        return xPos
+
+    def _blit(self, x, y, entry, src, mask):
+
+        oled = self._oled
+        pages = entry.pages + (1 if y % 8 else 0)
+        screenbuffer = oled.get_screenbuffer()
+
+        with self._pages(y, y + pages * 8 - 1):
+            oled_bitmap.blit_pages(screenbuffer, oled.LCDWIDTH, len(screenbuffer)//oled.LCDWIDTH,
+                                   int(x), y//8, src, mask, entry.width, pages, entry.xor)
+
+    #--------------------------------------------------------------------------
+    def display(self, force=False):
+        """ Send the screen buffer - see QwiicOledBase.display() """
+        self._oled.display(force)
@@ -0,0 +1,273 @@
+#-----------------------------------------------------------------------------
+# oled_virtual.py
+#
+# A virtual OLED display - the full API, no hardware
+#
+#------------------------------------------------------------------------
+#
+# Written by  SparkFun Electronics, October 2026
+#
+# This python library supports the SparkFun Electroncis qwiic
+# qwiic sensor/board ecosystem on a Raspberry Pi (and compatable) single
+# board computers.
+#
+# More information on qwiic is at https://www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#
+#==================================================================================
+# Copyright (c) 2026 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#==================================================================================
+#
+#
+# VirtualDisplay is a QwiicOledBase on a null I2C driver - nothing goes on a bus.
+# display() shows the frame on a terminal (with unicode half blocks, two pixel
+# rows per line), or writes it to a rotating set of PBM/PNG files, or does
+# nothing - to load test UI code, or run many panels in one process.
+#
+# The time between display() calls (the UI code drawing the frame) and the time
+# spent in display() are counted, see stats().
+#
+#   oled = VirtualDisplay(128, 64, output='terminal')
+#   oled = VirtualDisplay(128, 64, output='/tmp/frames/frame_{:03d}.png', keep=100)
+#
+
+from __future__ import print_function
+
+import os
+import sys
+import time
+
+from .qwiic_oled_base import QwiicOledBase
+from . import oled_bitmap
+
+# two pixel rows -> half block character
+_halfBlocks = {('0', '0'): ' ', ('1', '0'): u'▀', ('0', '1'): u'▄', ('1', '1'): u'█'}
+
+#-----------------------------------------
+# An I2C driver that goes nowhere - counts what would be sent
+
+class NullDriver(object):
+
+    def __init__(self):
+
+        self.transactions = 0
+        self.bytes = 0
+
+    def writeByte(self, address, commandCode, value):
+        self.transactions += 1
+        self.bytes += 1
+
+    def writeBlock(self, address, commandCode, value):
+        self.transactions += 1
+        self.bytes += len(value)
+
+    def readByte(self, address, commandCode=None):
+        return 0
+
+    def isDeviceConnected(self, address):
+        return True
+
+#-----------------------------------------
+class VirtualDisplay(QwiicOledBase):
+    """
+    VirtualDisplay
+
+        :param pixel_width: The width of the display in pixels
+        :param pixel_height: The height of the display in pixels
+        :param output: Where display() shows the frame - 'terminal', a file path pattern with a
+                        frame number field (such as 'frame_{:03d}.png', the extension selects PBM
+                        or PNG), or None for no output.
+        :param keep: For file output, the number of files before the frame number wraps around
+        :param scale: For file output, scale the frame by a whole number
+        :param stream: For terminal output, the stream to write to. Default is sys.stdout
+        :param splash: If True, the screen buffer starts with the SparkFun logo
+        :return: The virtual display object
+        :rtype: Object
+    """
+
+    def __init__(self, pixel_width=128, pixel_height=64, output=None, keep=10, scale=1, stream=None, splash=False):
+
+        QwiicOledBase.__init__(self, pixel_width=pixel_width, pixel_height=pixel_height, i2c_driver=NullDriver(), splash=splash)
+
+        self.output = output
+        self.keep = keep
+        self.scale = scale
+        self.stream = stream
+
+        # counted when a frame is shown - not for display() calls merged by the frame rate
+        # limit (see set_frame_rate()), or made inside a frame() block
+        self.frames = 0
+        self.render_time = 0.0      # time drawing - from the end of a frame to the request for the next
+        self.display_time = 0.0     # time sending and showing frames
+        self.last_render_time = 0.0
+
+        self._tFrameStart = None
+        self._tRequest = None
+
+    def is_connected(self):
+        """
+            A virtual display is always connected.
+
+            :return: True
+            :rtype: bool
+
+        """
+        return True
+
+    connected = property(is_connected)
+
+    def begin(self, warm=False):
+        """
+            Initialize the virtual display, and start timing the first frame.
+
+            :return: No return value
+
+        """
+
+        QwiicOledBase.begin(self, warm)
+        self._tFrameStart = time.perf_counter()
+
+    def display(self, force=False):
+        """
+            Show the screen buffer - on the terminal, in a file, or nowhere, as set by output.
+
+            :param force: If True, show now, even if a frame rate is set (see set_frame_rate())
+            :return: No return value
+
+        """
+
+        # drawing ends at the last request - the frame may be sent later, by the frame rate thread
+        self._tRequest = time.perf_counter()
+
+        QwiicOledBase.display(self, force)
+
+    def stats(self):
+        """
+            The frame counters.
+
+            :return: frames, render_time, display_time and mean_render_time (seconds), and the
+                    bytes and transactions that would have been sent on the bus
+            :rtype: dict
+
+        """
+
+        return {'frames': self.frames,
+                'render_time': self.render_time,
+                'display_time': self.display_time,
+                'mean_render_time': self.render_time / self.frames if self.frames else 0.0,
+                'bytes': self._i2c.bytes,
+                'transactions': self._i2c.transactions}
+
+    #--------------------------------------------------------------------------
+    # Output
+
+    def render_text(self):
+        """
+            Render the screen buffer as text, with unicode half blocks - two pixel rows per line.
+
+            :return: The lines of text
+            :rtype: list
+
+        """
+
+        width = self.LCDWIDTH
+        stride = (width + 7)//8
+        rows = oled_bitmap.pages_to_rows(self._screenbuffer, width, self.LCDHEIGHT)
+
+        bits = [format(int.from_bytes(rows[row * stride:(row + 1) * stride], 'big'), '0%db' % (stride * 8))[:width]
+                for row in range(self.LCDHEIGHT)]
+        if len(bits) % 2:
+            bits.append('0' * width)
+
+        return [''.join(_halfBlocks[pair] for pair in zip(bits[row], bits[row + 1])) for row in range(0, len(bits), 2)]
+
+    def _flush(self):
+
+        tStart = time.perf_counter()
+        QwiicOledBase._flush(self)
+        self._output()
+        self._count_frame(tStart)
+
+    def display_iter(self, per_page=False):
+        """
+            Show the screen buffer, a step at a time - see QwiicOledBase.display_iter(). The frame
+            is shown when all the steps are done.
+
+            :param per_page: If True, yield after each page rather than each block
+            :return: A generator
+
+        """
+
+        tStart = time.perf_counter()
+        nFrames = self.counters.frames
+
+        for page in QwiicOledBase.display_iter(self, per_page):
+            yield page
+
+        # nothing is sent inside a frame() block - the frame is shown when the block ends
+        if self.counters.frames == nFrames:
+            return
+
+        self._tRequest = tStart
+        self._output()
+        self._count_frame(tStart)
+
+    def _count_frame(self, tStart):
+
+        tEnd = time.perf_counter()
+        tRequest = self._tRequest if self._tRequest is not None else tStart
+
+        if self._tFrameStart is not None:
+            self.last_render_time = max(0.0, tRequest - self._tFrameStart)
+            self.render_time += self.last_render_time
+
+        self.frames += 1
+        self.display_time += tEnd - tStart
+        self._tFrameStart = tEnd
+        self._tRequest = None
+
+    def _output(self):
+
+        if self.output == 'terminal':
+            self._show_terminal()
+        elif self.output:
+            self._write_file()
+
+    def _show_terminal(self):
+
+        stream = self.stream or sys.stdout
+
+        # home the cursor, so frames are drawn in place
+        stream.write('\x1b[H' + '\n'.join(self.render_text()) + '\n')
+        stream.flush()
+
+    def _write_file(self):
+
+        nFrame = self.counters.frames - 1
+        path = self.output.format(nFrame % self.keep if self.keep else nFrame)
+        fmt = 'png' if os.path.splitext(path)[1].lower() == '.png' else 'pbm'
+
+        # write then rename, so a viewer never sees a partial frame
+        tmpFile = path + '.tmp'
+        with open(tmpFile, 'wb') as fp:
+            fp.write(self.snapshot(fmt, self.scale))
+        os.replace(tmpFile, path)
@@ -56,13 +56,24 @@ New to qwiic? Take a look at the entire [SparkFun qwiic ecosystem](https://www.s
 
 from __future__ import print_function
 import sys
+import os
 import math
+import time
+import threading
+
+from contextlib import contextmanager
 # import time
 
-import qwiic_i2c
+# Note: qwiic_i2c is imported when the I2C bus is first used. Loading it probes the
+# platform drivers, which is slow and not needed to draw into the screen buffer.
 
 from . import oled_fonts
 from . import oled_logos
+from . import oled_layout
+from . import oled_bitmap
+from . import oled_text_cache
+from . import oled_framemap
+from . import oled_stats
 
 # Define the device name and I2C addresses. These are set in the class defintion
 # as class variables, making them avilable without having to create a class instance.
@@ -86,6 +97,9 @@ _LCDHEIGHT           = 48
 I2C_COMMAND = 0x00
 I2C_DATA = 0x40
 
+# The I2C library sends blocks of up to 32 bytes
+_BLOCK_LEN = 32
+
 FONTHEADERSIZE      = 6
 
 WIDGETSTYLE0            = 0
@@ -115,6 +129,7 @@ SEGREMAP            = 0xA0
 CHARGEPUMP          = 0x8D
 EXTERNALVCC         = 0x01
 SWITCHCAPVCC        = 0x02
+NOP                 = 0xE3
 
 #  Scroll
 ACTIVATESCROLL                  = 0x2F
@@ -133,7 +148,9 @@ class QwiicOledBase(object):
         :param address: The I2C address to use for the device.
                         If not provided, the default address is used.
         :param i2c_driver: An existing i2c driver object. If not provided
-                        a driver object is created.
+                        a driver object is created when the bus is first used.
+        :param splash: If True, the screen buffer starts with the SparkFun logo,
+                        otherwise it starts blank. Default is True
         :return: The SSD1306 OLED device object.
         :rtype: Object
     """
@@ -152,8 +169,11 @@ class QwiicOledBase(object):
     PAGE                = 0
     ALL                 = 1
 
+    ALIGN_LEFT          = oled_layout.ALIGN_LEFT
+    ALIGN_CENTER        = oled_layout.ALIGN_CENTER
+    ALIGN_RIGHT         = oled_layout.ALIGN_RIGHT
 
-    def __init__(self, address=None, pixel_width = _LCDWIDTH, pixel_height = _LCDHEIGHT, i2c_driver=None):
+    def __init__(self, address=None, pixel_width = _LCDWIDTH, pixel_height = _LCDHEIGHT, i2c_driver=None, splash=True):
 
         # Did the user specify an I2C address?
         self.address = address if address is not None else self.available_addresses[0]
@@ -162,25 +182,33 @@ class QwiicOledBase(object):
         self.LCDHEIGHT = pixel_height
         self.LCDWIDTH  = pixel_width
 
-        # Load the I2C driver if one isn't provided
-
-        if i2c_driver is None:
-            self._i2c = qwiic_i2c.getI2CDriver()
-            if self._i2c is None:
-                print("Unable to load I2C driver for this platform.")
-                return
-        else:
-            self._i2c = i2c_driver
+        # The I2C driver - if one isn't provided, it's loaded on first use (see _i2c)
+        self._i2cDriver = i2c_driver
 
         # define the screen buffer - since this is a two color display, only bits are used
         # So the height is 8  bits / byte or LCDHEIGHT/8
         self._screenbuffer = bytearray(self.LCDWIDTH * int(math.ceil(self.LCDHEIGHT/8.)))
 
-        # Set initial contents
-        self._screenbuffer = [0x00]*int(self.LCDWIDTH*self.LCDHEIGHT/8) #Screen Area in bytes (Total Pixels/8)
-        
+        # What the display is showing - a copy of the screen buffer as last sent. Used
+        # so display() only sends what changed. None if the display contents are unknown.
+        self._shadowbuffer = None
+
+        # Blocks of the shadow buffer not confirmed on the display - a write failed, or the
+        # transfer was abandoned before they were sent. buffer offset -> end offset.
+        self._staleBlocks = {}
+
+        # the page address last set by _send_block()
+        self._page = 0
+
+        # file the last sent frame is saved to, so a restarted process can resume it
+        self._frameFile = None
+
+        # memory mapped file backing the screen and shadow buffers (see map_framebuffer())
+        self._frameMap = None
+
         # Display SparkFun Logo
-        oled_logos.add_logo(self._screenbuffer)
+        if splash:
+            oled_logos.add_logo(self._screenbuffer)
         
         # Display ans Clear Page
         # self.display()
@@ -201,8 +229,76 @@ class QwiicOledBase(object):
         # self.fontData = None
         self._font = None
 
-        self.nFonts = oled_fonts.count()
+        # fonts searched for characters that are not in the current font
+        self._fallbackFonts = []
+
+        # draw characters from the pre-shifted glyphs of the font atlas
+        self._glyphAtlas = True
+
+        # rendered strings, so labels that are drawn every frame are a blit
+        self._textCache = oled_text_cache.TextCache()
+
+        # latency histograms of display() and whole frames (see set_latency_stats())
+        self._latency = None
+
+        # transfer counters - frames, bytes, transactions, bus time, merged and dropped frames
+        self.counters = oled_stats.DisplayCounters()
+
+        # serializes use of the I2C bus - display() from the program and the frame rate thread
+        self._busLock = threading.RLock()
+
+        # frame rate limit (see set_frame_rate()) - the interval, and the frame waiting to be sent
+        # at the due time by the frame rate thread. The thread is started for the first deferred
+        # frame, and ends when no frame has been deferred for an interval.
+        self._frameInterval = None
+        self._framePending = False
+        self._frameDue = 0.0
+        self._frameThread = None
+        self._frameWake = threading.Condition(self._busLock)
+        self._lastFlush = 0.0
+
+        # retry a failed block write (see set_retry()) - retries, first and longest wait in seconds
+        self._retries = 2
+        self._retryDelay = 0.001
+        self._retryMaxDelay = 0.02
+
+        # thread safe mode (see thread_safe()) - a lock per page of the screen buffer
+        self._pageLocks = None
+        self._safeDrawing = None
+
+        # the screen buffer at the start of each open frame (see frame()) - restored if a frame fails.
+        # One thread at a time has frames open - the owner of _frameOwner.
+        self._frameBackups = []
+        self._frameOwner = threading.RLock()
+
+        # set while no frame is open - threads that send frames wait on it
+        self._frameIdle = threading.Event()
+        self._frameIdle.set()
+
+        # profile the drawing primitives (see oled_profile.py)
+        if os.environ.get('QWIIC_OLED_PROFILE'):
+            from . import oled_profile # pylint: disable=import-outside-toplevel
+            oled_profile.enable_from_env(self, os.environ['QWIIC_OLED_PROFILE'])
+
+    #--------------------------------------------------------------------------
+    # The I2C driver. Loaded the first time the bus is used, if one wasn't provided.
+
+    def _get_i2c(self):
+
+        if self._i2cDriver is None:
+            import qwiic_i2c # pylint: disable=import-outside-toplevel
+
+            self._i2cDriver = qwiic_i2c.getI2CDriver()
+            if self._i2cDriver is None:
+                raise IOError("Unable to load I2C driver for this platform.")
+
+        return self._i2cDriver
+
+    def _set_i2c(self, i2c_driver):
+
+        self._i2cDriver = i2c_driver
 
+    _i2c = property(_get_i2c, _set_i2c)
 
     #--------------------------------------------------------------------------
     def is_connected(self):
@@ -213,15 +309,23 @@ class QwiicOledBase(object):
             :rtype: bool
 
         """
+        import qwiic_i2c # pylint: disable=import-outside-toplevel
+
         return qwiic_i2c.isDeviceConnected(self.address)
 
     connected = property(is_connected)
 
     #--------------------------------------------------------------------------
-    def begin(self):
+    def begin(self, warm=False):
         """
             Initialize the operation of the SSD1306 display driver for the OLED module
 
+            :param warm: If True, the display is assumed to still be configured from an earlier
+                    run - the init sequence and the clear of the display memory are skipped, so
+                    the display doesn't flash blank. If a frame file is set (see set_frame_file()),
+                    the last frame is restored and the next display() only sends what changed.
+                    Default is False
+
             :return: Returns true of the initializtion was successful, otherwise False.
             :rtype: bool
 
@@ -232,46 +336,60 @@ class QwiicOledBase(object):
         self.set_draw_modee(self.NORM)
         self.set_cursor(0,0)
 
-        #  Display Init sequence
-        self._i2c.writeByte(self.address, I2C_COMMAND, DISPLAYOFF)          #  0xAE
+        # the init sequence is one group of commands on the bus
+        with self._busLock:
+            if warm:
+                # The controller keeps its configuration - just make sure it's not scrolling
+                # (the addressing of display() assumes a static display memory), and it's on.
+                self._i2c.writeByte(self.address, I2C_COMMAND, DEACTIVATESCROLL)
+                self._i2c.writeByte(self.address, I2C_COMMAND, DISPLAYON)
+
+                # a mapped frame buffer already holds the last frame
+                if self._frameMap is None:
+                    self._set_shadow(None)
+                    self._load_frame()
+                return
+
+            #  Display Init sequence
+            self._i2c.writeByte(self.address, I2C_COMMAND, DISPLAYOFF)          #  0xAE
 
-        self._i2c.writeByte(self.address, I2C_COMMAND, SETDISPLAYCLOCKDIV)  #  0xD5
-        self._i2c.writeByte(self.address, I2C_COMMAND, 0x80)                    #  the suggested ratio 0x80
+            self._i2c.writeByte(self.address, I2C_COMMAND, SETDISPLAYCLOCKDIV)  #  0xD5
+            self._i2c.writeByte(self.address, I2C_COMMAND, 0x80)                    #  the suggested ratio 0x80
 
-        self._i2c.writeByte(self.address, I2C_COMMAND, SETMULTIPLEX)            #  0xA8
-        self._i2c.writeByte(self.address, I2C_COMMAND, self.LCDHEIGHT - 1)
+            self._i2c.writeByte(self.address, I2C_COMMAND, SETMULTIPLEX)            #  0xA8
+            self._i2c.writeByte(self.address, I2C_COMMAND, self.LCDHEIGHT - 1)
 
-        self._i2c.writeByte(self.address, I2C_COMMAND, SETDISPLAYOFFSET)        #  0xD3
-        self._i2c.writeByte(self.address, I2C_COMMAND, 0x0)                 #  no offset
+            self._i2c.writeByte(self.address, I2C_COMMAND, SETDISPLAYOFFSET)        #  0xD3
+            self._i2c.writeByte(self.address, I2C_COMMAND, 0x0)                 #  no offset
 
-        self._i2c.writeByte(self.address, I2C_COMMAND, SETSTARTLINE | 0x0)  #  line #0
+            self._i2c.writeByte(self.address, I2C_COMMAND, SETSTARTLINE | 0x0)  #  line #0
 
-        self._i2c.writeByte(self.address, I2C_COMMAND, CHARGEPUMP)          #  enable charge pump
-        self._i2c.writeByte(self.address, I2C_COMMAND, 0x14)
+            self._i2c.writeByte(self.address, I2C_COMMAND, CHARGEPUMP)          #  enable charge pump
+            self._i2c.writeByte(self.address, I2C_COMMAND, 0x14)
 
-        self._i2c.writeByte(self.address, I2C_COMMAND, NORMALDISPLAY)           #  0xA6
-        self._i2c.writeByte(self.address, I2C_COMMAND, DISPLAYALLONRESUME)  #  0xA4
+            self._i2c.writeByte(self.address, I2C_COMMAND, NORMALDISPLAY)           #  0xA6
+            self._i2c.writeByte(self.address, I2C_COMMAND, DISPLAYALLONRESUME)  #  0xA4
 
-        self._i2c.writeByte(self.address, I2C_COMMAND, SEGREMAP | 0x1)
-        self._i2c.writeByte(self.address, I2C_COMMAND, COMSCANDEC)
+            self._i2c.writeByte(self.address, I2C_COMMAND, SEGREMAP | 0x1)
+            self._i2c.writeByte(self.address, I2C_COMMAND, COMSCANDEC)
 
-        self._i2c.writeByte(self.address, I2C_COMMAND, SETCOMPINS)          #  0xDA
-        if len(self._screenbuffer) == 512:
-            self._i2c.writeByte(self.address, I2C_COMMAND, 0x02)                # rect (128x32 OLED modules)
-        else:
-            self._i2c.writeByte(self.address, I2C_COMMAND, 0x12)                # square and large (64x48 or 128x64 OLED modules)
+            self._i2c.writeByte(self.address, I2C_COMMAND, SETCOMPINS)          #  0xDA
+            if len(self._screenbuffer) == 512:
+                self._i2c.writeByte(self.address, I2C_COMMAND, 0x02)                # rect (128x32 OLED modules)
+            else:
+                self._i2c.writeByte(self.address, I2C_COMMAND, 0x12)                # square and large (64x48 or 128x64 OLED modules)
 
-        self._i2c.writeByte(self.address, I2C_COMMAND, SETCONTRAST)         #  0x81
-        self._i2c.writeByte(self.address, I2C_COMMAND, 0x8F)
+            self._i2c.writeByte(self.address, I2C_COMMAND, SETCONTRAST)         #  0x81
+            self._i2c.writeByte(self.address, I2C_COMMAND, 0x8F)
 
-        self._i2c.writeByte(self.address, I2C_COMMAND, SETPRECHARGE)            #  0xd9
-        self._i2c.writeByte(self.address, I2C_COMMAND, 0x22)
+            self._i2c.writeByte(self.address, I2C_COMMAND, SETPRECHARGE)            #  0xd9
+            self._i2c.writeByte(self.address, I2C_COMMAND, 0x22)
 
-        self._i2c.writeByte(self.address, I2C_COMMAND, SETVCOMDESELECT)         #  0xDB
-        self._i2c.writeByte(self.address, I2C_COMMAND, 0x30)
+            self._i2c.writeByte(self.address, I2C_COMMAND, SETVCOMDESELECT)         #  0xDB
+            self._i2c.writeByte(self.address, I2C_COMMAND, 0x30)
 
-        self._i2c.writeByte(self.address, I2C_COMMAND, DISPLAYON)               # --turn on oled panel
-        self.clear(self.ALL)                        #  Erase hardware memory inside the OLED controller to aself random data in memory.
+            self._i2c.writeByte(self.address, I2C_COMMAND, DISPLAYON)               # --turn on oled panel
+            self.clear(self.ALL)                        #  Erase hardware memory inside the OLED controller to aself random data in memory.
 
     #----------------------------------------------------
     # brief Set SSD1306 page address.
@@ -329,15 +447,23 @@ class QwiicOledBase(object):
         """
 
         if mode == self.ALL:
-            for i in range(8):
-                self.set_page_address(i)
-                self.set_column_address(0)
-                #pylint: disable=unused-variable
-                for j in range(0x80):
-                    self._i2c.writeByte(self.address, I2C_DATA, value)
-                #pylint: enable=unused-variable
+            self._set_shadow(None)
+            self._save_frame()
+
+            with self._busLock:
+                for i in range(8):
+                    self.set_page_address(i)
+                    self.set_column_address(0)
+                    #pylint: disable=unused-variable
+                    for j in range(0x80):
+                        self._i2c.writeByte(self.address, I2C_DATA, value)
+                    #pylint: enable=unused-variable
+
+            # the display memory now holds value
+            self._set_shadow(bytearray([value & 0xFF]*len(self._screenbuffer)))
+            self._save_frame()
         else:
-            self._screenbuffer[:] = [value]*len(self._screenbuffer)
+            self._screenbuffer[:] = bytearray([value]*len(self._screenbuffer))
 
     #--------------------------------------------------------------------------
     # The WHITE color of the display will turn to BLACK and the BLACK will turn to WHITE.
@@ -351,10 +477,8 @@ class QwiicOledBase(object):
             :return: No return value
 
         """
-        if inv:
-            self._i2c.writeByte(self.address, I2C_COMMAND, INVERTDISPLAY)
-        else:
-            self._i2c.writeByte(self.address, I2C_COMMAND, NORMALDISPLAY)
+        with self._busLock:
+            self._i2c.writeByte(self.address, I2C_COMMAND, INVERTDISPLAY if inv else NORMALDISPLAY)
 
     #--------------------------------------------------------------------------
     # OLED contract value from 0 to 255. Note: Contrast level is not very obvious.
@@ -368,44 +492,648 @@ class QwiicOledBase(object):
             :return: No return value
 
         """
-        self._i2c.writeByte(self.address, I2C_COMMAND, SETCONTRAST)     #  0x81
-        self._i2c.writeByte(self.address, I2C_COMMAND, contrast)
+        with self._busLock:
+            self._i2c.writeByte(self.address, I2C_COMMAND, SETCONTRAST)     #  0x81
+            self._i2c.writeByte(self.address, I2C_COMMAND, contrast)
 
     #--------------------------------------------------------------------------
     # Bulk move the screen buffer to the SSD1306 controller's memory so that images/graphics drawn on the screen buffer will be displayed on the OLED.
 
-    def display(self):
+    def display(self, force=False):
         """
             Display the current screen buffer on the Display device.
             Bulk move the screen buffer to the SSD1306 controller's memory so that images/graphics drawn on the screen buffer will be displayed on the OLED.
+            Only the parts of the screen buffer that changed since the last display() are sent.
+
+            If a frame rate is set (see set_frame_rate()), the screen buffer is sent at most once per
+            frame interval - calls within an interval are merged into one transfer, sent by a thread
+            at the end of the interval.
+
+            :param force: If True, send now, even if a frame rate is set. Default is False
+            :return: No return value
+
+        """
+
+        with self._busLock:
+
+            if self._frameBackups:
+                # inside a frame (see frame()) - sent when the frame ends
+                return
+
+            if self._frameInterval is None or force:
+                self._cancel_deferred()
+                self._flush()
+                return
+
+            if self._framePending:
+                # merged into the frame waiting to be sent
+                self.counters.merged += 1
+                return
+
+            due = self._lastFlush + self._frameInterval
+            if due <= time.monotonic():
+                self._flush()
+                return
+
+            self._framePending = True
+            self._frameDue = due
+
+            if self._frameThread is None:
+                self._frameThread = threading.Thread(target=self._frame_rate_thread, name='qwiic-oled-frame-rate')
+                self._frameThread.daemon = True
+                self._frameThread.start()
+            else:
+                self._frameWake.notify()
+
+    #--------------------------------------------------------------------------
+    @contextmanager
+    def frame(self):
+        """
+            Draw a frame as one transaction. Inside the with block, display() doesn't send
+            anything - from this thread, another thread, or the frame rate thread. When the block
+            ends, the changes are sent once, by display() - merged with other frames if a frame
+            rate is set (see set_frame_rate()). If the block raises an exception, the frame is
+            dropped - the screen buffer is restored to what it was when the block started.
+            Frames can be nested - only the outer frame sends. One thread draws a frame at a
+            time - frame() in another thread waits for the frame to end.
+
+                with oled.frame():
+                    oled.clear(oled.PAGE)
+                    draw_status(oled)
+
+            :return: A context manager
+
+        """
+
+        with self._frameOwner:
+
+            with self._busLock:
+                self._frameBackups.append(bytes(self._screenbuffer) if self._pageLocks is None else self._copy_screen())
+                if len(self._frameBackups) == 1:
+                    self._frameIdle.clear()
+                    if self._latency is not None:
+                        self._latency.start_frame(time.perf_counter())
+
+            try:
+                yield self
+
+            except BaseException:
+                with self._busLock:
+                    self._write_screen(self._frameBackups.pop())
+                    if not self._frameBackups:
+                        self._frameIdle.set()
+                raise
+
+            with self._busLock:
+                self._frameBackups.pop()
+                if not self._frameBackups:
+                    self._frameIdle.set()
+                    self.display()
+
+    def in_frame(self):
+        """
+            Is a frame (see frame()) being drawn?
+
+            :return: True if inside a frame
+            :rtype: bool
+
+        """
+        return bool(self._frameBackups)
+
+    #--------------------------------------------------------------------------
+    def set_frame_rate(self, fps):
+        """
+            Limit the rate display() sends frames at. Calls to display() within one frame interval
+            are merged into one transfer - scripts that call display() after each drawing call no
+            longer saturate the bus. Use display(force=True) to send at once, such as before exit.
+
+            :param fps: Frames per second. None or 0 for no limit - any frame waiting is sent.
 
             :return: No return value
 
         """
+
+        with self._busLock:
+            self._frameInterval = 1.0 / fps if fps else None
+
+            if self._frameInterval is None and self._framePending:
+                self._cancel_deferred()
+                self._flush()
+
+    #--------------------------------------------------------------------------
+    # The frame rate limiter thread - sends the frame waiting when it is due. One thread
+    # serves every deferred frame, and exits when no frame is deferred for an interval.
+
+    def _frame_rate_thread(self):
+
+        with self._busLock:
+            while True:
+
+                if not self._framePending:
+                    if self._frameInterval is not None:
+                        self._frameWake.wait(self._frameInterval)
+                    if not self._framePending:
+                        self._frameThread = None
+                        return
+                    continue
+
+                wait = self._frameDue - time.monotonic()
+                if wait > 0:
+                    self._frameWake.wait(wait)
+                    continue
+
+                self._framePending = False
+
+                # a frame in progress is sent when it ends
+                if self._frameBackups:
+                    continue
+
+                try:
+                    self._flush()
+                except (IOError, OSError) as err:
+                    # the blocks not sent are stale, and are sent with the next frame
+                    print("Frame rate limiter - error sending the frame: %s" % err, file=sys.stderr)
+
+    def _cancel_deferred(self):
+
+        # the thread exits when it wakes with nothing to send
+        if self._framePending:
+            self._framePending = False
+            self._frameWake.notify()
+
+    #--------------------------------------------------------------------------
+    # Send the screen buffer to the display - the parts that changed since the last transfer.
+
+    def _flush(self):
+
+        for _ in self._flush_iter(self._screenbuffer if self._pageLocks is None else self._copy_screen()):
+            pass
+
+    # The transfer, one step at a time - yields the page after each block is sent (chunked), or
+    # after each page. The bus is locked for each step - for a chunked transfer the page address is
+    # sent with each block, as another user of the bus may have changed it between blocks.
+
+    def _flush_iter(self, screen, chunked=False):
+
         # the I2C library being used allows blocks upto 32 ints to be sent at a time.
         #
         # The screenbuffer is sliced into 32 int blocks and set. This results in a faster
         # refresh than the ported method (Good god, it was updating a pixel at a time ... )
         #
-        lenBlock = 32
+        # Blocks that match what the display is showing (the shadow buffer) are skipped.
+        #
+        tStart = time.perf_counter()
+
+        lenBlock = _BLOCK_LEN
         lenLine = self.get_lcd_width()
         lenHieght = self.get_lcd_height()
         nBlocks = int(math.ceil(lenLine/lenBlock))
         mBlocks = int(math.ceil(lenHieght/8))
 
-        for i in range(mBlocks):
+        bSent = False
+        bDone = False
+
+        # the display contents are unknown - every block is stale until it is sent. If the
+        # transfer fails or is abandoned, the next one only sends the blocks that were not.
+        if self._shadowbuffer is None:
+            self._set_shadow(screen)
+            self._staleBlocks = {page * lenLine + iStart: page * lenLine + min(iStart + lenBlock, lenLine)
+                                 for page in range(mBlocks) for iStart in range(0, lenLine, lenBlock)}
+
+        shadow = self._shadowbuffer
+        stale = self._staleBlocks
+
+        try:
+            for i in range(mBlocks):
+
+                lineStart = i * lenLine  # offset in the screen buffer for the current line/row
+                bPageSet = False
+
+                with self._busLock:
+                    for iBlock in range(nBlocks):
+
+                        iStart = iBlock * lenBlock
+                        iEnd = iStart  + min(lenLine - iStart, lenBlock) # what's left - not > 32 in len
+
+                        bStart = lineStart + iStart
+                        bEnd = lineStart + iEnd
+                        if bStart not in stale and shadow[bStart:bEnd] == screen[bStart:bEnd]:
+                            continue
+
+                        if not bSent:
+                            # the saved frame is out of date until the transfer completes
+                            self._remove_frame()
+                            bSent = True
+
+                        # Send the block - take into account the current line/row offset
+                        self._send_block(None if bPageSet else i, iStart, screen[bStart:bEnd])
+
+                        if chunked:
+                            self._busLock.release()
+                            try:
+                                yield i
+                            finally:
+                                self._busLock.acquire()
+                        else:
+                            bPageSet = True
+
+                if bPageSet:
+                    yield i
+
+            bDone = True
+
+        finally:
+            # an abandoned or failed transfer leaves the blocks not sent different from the shadow
+            # buffer, or stale - they are sent by the next transfer
+            if bSent:
+                self._save_frame()
+
+            tEnd = time.perf_counter()
+            if bDone:
+                self._lastFlush = time.monotonic()
+                self.counters.frames += 1
+                if self._latency is not None:
+                    self._latency.record(tStart, tEnd)
+            if bSent:
+                self.counters.bus_time += tEnd - tStart
+
+    #--------------------------------------------------------------------------
+    def display_iter(self, per_page=False):
+        """
+            Send the screen buffer a step at a time - a generator, that yields after each block
+            (up to 32 bytes) is sent, or after each page. An event loop can do other work between
+            steps, and only blocks for one step. The frame sent is the screen buffer when the
+            generator started. If the generator is closed early, the blocks not sent are sent by
+            the next transfer.
+
+                for _ in oled.display_iter():
+                    read_sensors()
+
+            Inside a frame (see frame()) nothing is sent - the frame is sent when it ends.
+
+            :param per_page: If True, yield after each page rather than each block. Default is False
+            :return: A generator - yields the page of the step just sent
+
+        """
+
+        with self._busLock:
+            if self._frameBackups:
+                return
+            self._cancel_deferred()
+            screen = bytes(self._screenbuffer) if self._pageLocks is None else self._copy_screen()
+
+        for page in self._flush_iter(screen, chunked=not per_page):
+            yield page
+
+    #--------------------------------------------------------------------------
+    def thread_safe(self):
+        """
+            Switch to thread safe mode, and return the thread safe drawing API. Drawing calls of
+            the thread safe API take their color, mode and font as parameters - they don't use the
+            cursor, color or font of the display - and lock only the pages of the screen they
+            change. display() sends a copy of the screen buffer taken with all pages locked, so a
+            drawing call is never sent half done. The bus is locked separately, so drawing threads
+            and a thread sending frames run at the same time.
+
+            :return: The thread safe drawing API
+            :rtype: ThreadSafeDrawing
+
+        """
+
+        from . import oled_threadsafe # pylint: disable=import-outside-toplevel
+
+        with self._busLock:
+            if self._pageLocks is None:
+                self._pageLocks = [threading.Lock() for _ in range(len(self._screenbuffer)//self.LCDWIDTH)]
+                self._safeDrawing = oled_threadsafe.ThreadSafeDrawing(self)
+
+        return self._safeDrawing
+
+    # A copy of the screen buffer, taken - or the whole screen buffer written - with all the pages
+    # locked, in order, as drawing calls lock them
+
+    def _copy_screen(self):
+
+        for lock in self._pageLocks:
+            lock.acquire()
+        try:
+            return bytes(self._screenbuffer)
+        finally:
+            for lock in self._pageLocks:
+                lock.release()
+
+    def _write_screen(self, screen):
+
+        if self._pageLocks is None:
+            self._screenbuffer[:] = screen
+            return
+
+        for lock in self._pageLocks:
+            lock.acquire()
+        try:
+            self._screenbuffer[:] = screen
+        finally:
+            for lock in self._pageLocks:
+                lock.release()
+
+    #--------------------------------------------------------------------------
+    def set_retry(self, retries=2, delay=0.001, max_delay=0.02):
+        """
+            Set how a block write that fails is retried - after a wait that doubles with each
+            retry, up to max_delay. If the retries fail, the error is raised, and the blocks that
+            were not confirmed are sent by the next display() - not the whole frame.
+
+            :param retries: The number of retries of a failed block. 0 raises the first error.
+            :param delay: The wait before the first retry, in seconds
+            :param max_delay: The longest wait between retries, in seconds
+
+            :return: No return value
+
+        """
+
+        self._retries = max(0, int(retries))
+        self._retryDelay = delay
+        self._retryMaxDelay = max_delay
+
+    #--------------------------------------------------------------------------
+    # Send a block of up to 32 bytes of page data to the display at page, column, and record it
+    # in the shadow buffer. If page is None, the page address set by the last block is used.
+    #
+    # A failed write is retried, with the page and column address sent again - a failed write may
+    # have moved the display's address pointer. A failed command may have left the controller
+    # waiting for the arguments of an address command - two NOPs complete it first. If the retries
+    # fail, the blocks the data covers are marked stale and the error is raised.
+
+    def _send_block(self, page, column, data):
+
+        # the commands - page address 3 bytes, column address 2 bytes (64x48) or 3
+        nColumnCommands = 2 if len(self._screenbuffer) == 384 else 3
+
+        if page is not None:
+            self._page = page
+
+        iStart = self._page * self.LCDWIDTH + column
+        iEnd = iStart + len(data)
+
+        delay = self._retryDelay
+        nTry = 0
+
+        while True:
+            nCommands = nColumnCommands
+            try:
+                if nTry:
+                    self._i2c.writeByte(self.address, I2C_COMMAND, NOP)
+                    self._i2c.writeByte(self.address, I2C_COMMAND, NOP)
+                    nCommands += 2
+
+                if page is not None or nTry:
+                    self.set_page_address(self._page)
+                    nCommands += 3
+
+                self.set_column_address(column)
+                self._i2c.writeBlock(self.address, I2C_DATA, list(data))
+                break
+
+            except (IOError, OSError):
+                if nTry >= self._retries:
+                    self.counters.errors += 1
+                    self._mark_stale(iStart, iEnd)
+                    raise
+
+                nTry += 1
+                self.counters.retries += 1
+                time.sleep(delay)
+                delay = min(delay * 2, self._retryMaxDelay)
+
+        self.counters.transactions += nCommands + 1
+        self.counters.bytes += nCommands + len(data)
+
+        if self._shadowbuffer is not None:
+            self._shadowbuffer[iStart:iEnd] = data
+
+        # the stale blocks this write covers are confirmed
+        if self._staleBlocks:
+            for bStart in [bStart for bStart, bEnd in self._staleBlocks.items() if bStart >= iStart and bEnd <= iEnd]:
+                del self._staleBlocks[bStart]
+
+    # Mark the blocks that the buffer range start - end touches as stale
+
+    def _mark_stale(self, start, end):
+
+        width = self.LCDWIDTH
+        lineStart = start - start % width
+
+        for iStart in range((start - lineStart) // _BLOCK_LEN * _BLOCK_LEN, end - lineStart, _BLOCK_LEN):
+            self._staleBlocks[lineStart + iStart] = lineStart + min(iStart + _BLOCK_LEN, width)
+
+    #--------------------------------------------------------------------------
+    def set_latency_stats(self, enable=True, fps=None):
+        """
+            Record latency histograms of display() and of whole frames (drawing plus transfer).
+            A whole frame is timed from the start of drawing - marked by frame(), or by calling
+            start_frame(). Frames without a mark only count in the display() histogram.
+
+            :param enable: True to record, False to stop recording and drop the histograms
+            :param fps: The target frame rate - frames longer than 1/fps count as missed deadlines
+
+            :return: No return value
+
+        """
+
+        if enable:
+            self._latency = oled_stats.FrameStats(fps)
+        else:
+            self._latency = None
+
+    def start_frame(self):
+        """
+            Mark the start of drawing a frame, for the frame latency statistics (see
+            set_latency_stats()). frame() marks it - call this in loops that don't use frame().
+
+            :return: No return value
+
+        """
+
+        if self._latency is not None:
+            self._latency.start_frame(time.perf_counter())
+
+    def get_latency_stats(self):
+        """
+            The latency statistics - count, mean, p50, p95, p99 and max (in seconds) of display()
+            and of whole frames, and the number of missed deadlines.
+
+            :return: The statistics, or None if not recording (see set_latency_stats())
+            :rtype: dict
+
+        """
+        return None if self._latency is None else self._latency.summary()
+
+    #--------------------------------------------------------------------------
+    def invalidate(self):
+        """
+            Forget what the display is showing. The next call to display() sends the whole
+            screen buffer. Use if the display memory was changed outside of this object.
+
+            :return: No return value
+
+        """
+
+        self._set_shadow(None)
+        self._remove_frame()
+
+    #--------------------------------------------------------------------------
+    def set_frame_file(self, path):
+        """
+            Set a file to save the frame the display is showing to. The file is updated after
+            each display(), and is used by begin(warm=True) to resume the last frame after a
+            restart. Put the file on a RAM backed file system, such as /run or /dev/shm.
+
+            :param path: Path of the frame file. None stops saving the frame.
+
+            :return: No return value
+
+        """
+
+        self._frameFile = path
+
+        # keep an existing frame file for begin(warm=True) until the display is known
+        if self._shadowbuffer is not None:
+            self._save_frame()
+
+    #--------------------------------------------------------------------------
+    # Frame file utils
+
+    def _save_frame(self):
+
+        # the display contents are only known if all blocks were confirmed
+        if self._staleBlocks:
+            self._remove_frame()
+            return
+
+        if self._frameMap is not None:
+            if self._shadowbuffer is None:
+                self._frameMap.shadow_valid = False
+            else:
+                self._frameMap.frame_done()
+
+        if self._frameFile is None:
+            return
+
+        if self._shadowbuffer is None:
+            self._remove_frame()
+            return
+
+        # write then rename, so a reader never sees a partial frame
+        tmpFile = self._frameFile + '.tmp'
+        with open(tmpFile, 'wb') as fp:
+            fp.write(self._shadowbuffer)
+        os.replace(tmpFile, self._frameFile)
+
+    def _remove_frame(self):
+
+        if self._frameMap is not None:
+            self._frameMap.shadow_valid = False
+
+        if self._frameFile is None:
+            return
+
+        try:
+            os.remove(self._frameFile)
+        except OSError:
+            pass
+
+    def _load_frame(self):
+
+        if self._frameFile is None:
+            return
+
+        try:
+            with open(self._frameFile, 'rb') as fp:
+                frame = fp.read()
+        except (IOError, OSError):
+            return
+
+        if len(frame) != len(self._screenbuffer):
+            print("Frame file does not match the display size - ignored.", file=sys.stderr)
+            return
+
+        self._screenbuffer[:] = frame
+        self._set_shadow(frame)
+
+    #--------------------------------------------------------------------------
+    # Set the shadow buffer - a copy of frame, or None if the display contents are unknown.
+
+    def _set_shadow(self, frame):
+
+        self._staleBlocks = {}
+
+        if self._frameMap is None:
+            self._shadowbuffer = None if frame is None else bytearray(frame)
+
+        elif frame is None:
+            self._frameMap.shadow_valid = False
+            self._shadowbuffer = None
+
+        else:
+            self._frameMap.shadow[:] = frame
+            self._shadowbuffer = self._frameMap.shadow
+
+    #--------------------------------------------------------------------------
+    def map_framebuffer(self, path):
+        """
+            Back the screen buffer, and the copy of what the display is showing, with a memory
+            mapped file. The file is always up to date, so after a crash or restart the display
+            contents are known (use begin(warm=True)) and only changes are sent. Other processes
+            can read the file (see oled_framemap.read_frame_map()) to see what the display shows
+            without using the I2C bus. Put the file on a RAM backed file system, such as /dev/shm.
+
+            :param path: Path of the frame map file. Created if it doesn't exist.
+
+            :return: True if the file held a frame for this display size, which is restored.
+            :rtype: bool
+
+        """
+
+        if self._frameMap is not None:
+            self.unmap_framebuffer()
+
+        frameMap = oled_framemap.FrameMap(path, self.LCDWIDTH, self.LCDHEIGHT)
+
+        if frameMap.restored:
+            shadow = frameMap.shadow if frameMap.shadow_valid else None
+        else:
+            frameMap.screen[:] = self._screenbuffer
+            if self._shadowbuffer is not None:
+                frameMap.shadow[:] = self._shadowbuffer
+            shadow = frameMap.shadow if self._shadowbuffer is not None else None
+            frameMap.shadow_valid = shadow is not None
+
+        self._frameMap = frameMap
+        self._screenbuffer = frameMap.screen
+        self._shadowbuffer = shadow
+
+        return frameMap.restored
+
+    #--------------------------------------------------------------------------
+    def unmap_framebuffer(self):
+        """
+            Stop backing the screen buffer with a memory mapped file. The buffers are copied back
+            into memory, the file is left in place. Any references to the mapped screen buffer
+            (from get_screenbuffer()) must be released first.
 
-            self.set_page_address(i)
-            lineStart = i * lenLine  # offset in the screen buffer for the current line/row
+            :return: No return value
+
+        """
 
-            for iBlock in range(nBlocks):
+        if self._frameMap is None:
+            return
 
-                iStart = iBlock * lenBlock
-                self.set_column_address(iStart)
-                iEnd = iStart  + min(lenLine - iStart, lenBlock) # what's left - not > 32 in len
+        self._screenbuffer = bytearray(self._screenbuffer)
+        if self._shadowbuffer is not None:
+            self._shadowbuffer = bytearray(self._shadowbuffer)
 
-                # Send the block - take into account the current line/row offset
-                self._i2c.writeBlock(self.address, I2C_DATA, self._screenbuffer[lineStart+iStart:lineStart+iEnd])
+        self._frameMap.close()
+        self._frameMap = None
 
     #     Leftover from port -> Arduino's print overridden so that we can use uView.print().
     #--------------------------------------------------------------------------
@@ -437,7 +1165,8 @@ class QwiicOledBase(object):
             Print a line of text on the display using the current font,
             starting at the current position.
 
-            :param text: The line of text to write.
+            :param text: The line of text to write. Characters that are not in the current
+                    font are drawn from the fallback fonts. A byte array is drawn as font indexes.
 
             :return: No return value
 
@@ -447,11 +1176,155 @@ class QwiicOledBase(object):
         if not hasattr(text, '__len__'): # scalar?
             text = str(text)
 
-        if isinstance(text, str):
-            text = bytearray(text, encoding='ascii')
+        if isinstance(text, (str, bytes, bytearray)):
+            text = tuple(text)
+
+        if self._textCache is None or self._font is None or not isinstance(text, tuple):
+            for curr in text:
+                self.write(curr)
+            return
+
+        # Draw the text a line at a time from the text cache - the cursor moves the same
+        # way it does in write()
+        advance = self._font.width + 1
+        wrapX = self.LCDWIDTH - self._font.width
+        iChar = 0
+
+        while iChar < len(text):
+
+            if text[iChar] in ('\n', '\r'):
+                self.write(text[iChar])
+                iChar += 1
+                continue
+
+            # the number of characters before write() would wrap to the next line
+            nChar = max(1, (wrapX - self.cursorX)//advance + 1)
+            codes = text[iChar:iChar+nChar]
+
+            for iEnd, c in enumerate(codes):
+                if c in ('\n', '\r'):
+                    codes = codes[:iEnd]
+                    break
+
+            self._draw_codes(self.cursorX, self.cursorY, codes)
+
+            iChar += len(codes)
+            self.cursorX += len(codes) * advance
+            if self.cursorX > wrapX:
+                self.cursorY += self._font.height
+                self.cursorX = 0
+
+    #--------------------------------------------------------------------------
+    # Draw a string of characters (or font indexes) at x,y from the text cache.
+
+    def _draw_codes(self, x, y, codes, color=None, mode=None):
 
-        for curr in text:
-            self.write(curr)
+        if color is None:
+            color = self.foreColor
+
+        if mode is None:
+            mode = self.drawMode
+
+        if self._textCache is None:
+            for c in codes:
+                self.draw_char(x, y, c, color, mode)
+                x += self._font.width + 1
+            return
+
+        color = self.WHITE if color == self.WHITE else self.BLACK
+        mode = self.XOR if mode == self.XOR else self.NORM
+
+        key = (self.fontType, codes, color, mode)
+        entry = self._textCache.get(key)
+        if entry is None:
+            entry = oled_text_cache.render_text(self._font, codes, self._font.width + 1, color, mode, self._glyph)
+            self._textCache.put(key, entry)
+
+        x = int(x)
+        y = int(y)
+        shift = y % 8
+        src, mask = entry.variant(shift)
+
+        oled_bitmap.blit_pages(self._screenbuffer, self.LCDWIDTH, len(self._screenbuffer)//self.LCDWIDTH,
+                               x, y//8, src, mask, entry.width, entry.pages + (1 if shift else 0), entry.xor)
+
+    #--------------------------------------------------------------------------
+    def set_text_cache_size(self, max_entries):
+        """
+            Set the size of the rendered text cache. The cache holds strings drawn with
+            print() and draw_text(), so drawing the same string again is a single copy.
+
+            :param max_entries: The maximum number of strings in the cache. A value of 0 disables the cache.
+
+            :return: No return value
+
+        """
+
+        if max_entries <= 0:
+            self._textCache = None
+        elif self._textCache is None:
+            self._textCache = oled_text_cache.TextCache(max_entries)
+        else:
+            self._textCache.resize(max_entries)
+
+    #--------------------------------------------------------------------------
+    def get_text_cache_stats(self):
+        """
+            Return the statistics of the rendered text cache - use to tune the cache size.
+
+            :return: hits, misses, evictions, entries, max_entries, bytes and hit_rate. None if the cache is disabled.
+            :rtype: dict
+
+        """
+
+        if self._textCache is None:
+            return None
+
+        return self._textCache.stats()
+
+    #--------------------------------------------------------------------------
+    # Layout text in a box (wrap, align, clip) and draw the glyphs that are visible.
+
+    def draw_text(self, x, y, text, width=None, height=None, align=None, wrap=True, ellipsis=True, color=None, mode=None):
+        """
+            Draw text inside a box using the current font. The text is word wrapped (or truncated)
+            at the box width, aligned within the box and clipped at the box height. Only the
+            glyphs that fit in the box are drawn. The cursor position is not changed.
+
+            :param x: The X position of the box on the display
+            :param y: The Y position of the box on the display
+            :param text: The text to draw. A value of '\\\\n' starts a new line.
+            :param width: The width of the box. If not set, the box extends to the right edge of the display.
+            :param height: The height of the box. If not set, the box extends to the bottom of the display.
+            :param align: ALIGN_LEFT, ALIGN_CENTER or ALIGN_RIGHT. Default is ALIGN_LEFT
+            :param wrap: If True, lines are word wrapped at the box width, otherwise they are truncated
+            :param ellipsis: If True, truncated text ends with '...'
+            :param color: The color to draw. If not set, the default foreground color is used.
+            :param mode: The mode to draw the pixl to the screen bufffer. Value can be either XOR or NORM. Default is NORM
+
+            :return: The layout used to draw the text. The truncated attribute is True if the text did not fit.
+            :rtype: TextLayout
+
+        """
+
+        if self._font is None:
+            return None
+
+        if width is None:
+            width = self.LCDWIDTH - x
+
+        if height is None:
+            height = self.LCDHEIGHT - y
+
+        if align is None:
+            align = self.ALIGN_LEFT
+
+        layout = oled_layout.layout_text(text, self._font, width, height, align, wrap, ellipsis)
+
+        for run in layout.runs:
+            self._draw_codes(x + run.x, y + run.y, run.chars, color, mode)
+
+        return layout
 
 
     #--------------------------------------------------------------------------
@@ -831,7 +1704,10 @@ class QwiicOledBase(object):
             :rvalue: integer
 
         """
-        return self.nFonts
+        # the font folder is only scanned the first time this is called
+        return oled_fonts.count()
+
+    nFonts = property(get_total_fonts)
 
     # Return the font type number of the current font.
     def get_font_type(self):
@@ -898,7 +1774,7 @@ class QwiicOledBase(object):
 
             :param x: The X position on the display
             :param y: The Y position on the display
-            :param c: The character to draw
+            :param c: The character to draw - either a font index or a (unicode) character
             :param color: The color to draw. If not set, the default foreground color is used.
             :param mode: The mode to draw the pixl to the screen bufffer. Value can be either XOR or NORM. Default is NORM
 
@@ -915,30 +1791,20 @@ class QwiicOledBase(object):
         if self._font is None:
             return
 
-        if c < self._font.start_char or c > (self._font.start_char + self._font.total_char - 1): # no bitmap for the required c
+        if self._glyphAtlas:
+            self._draw_shifted_glyph(int(x), int(y), c, color, mode)
             return
 
-        tempC = c - self._font.start_char
-
-        # // each row (in datasheet is call page) is 8 bits high, 16 bit high character will have 2 rows to be drawn
-        rowsToDraw = self._font.height//8   # 8 is LCD's page size, see SSD1306 datasheet
-
-        if rowsToDraw <= 1:
-            rowsToDraw = 1
-
-        # figure out position of the character in the font map. integer math is key here
-        charPerRow = self._font.map_width // self._font.width
-
-        rowPos = tempC // charPerRow  # the number of full rows to skip
-        colPos = tempC % charPerRow # the number of chars into the last
-        iStart = rowPos * charPerRow * self._font.height//8 + colPos
+        rows = self._glyph(c)
+        if rows is None: # no bitmap for the required c
+            return
 
         # each row on LCD is 8 bit height (see datasheet for explanation)
-        for row in range(rowsToDraw):
+        for row in range(len(rows)):
 
             # load in the current character block.
             #pylint: disable=consider-using-enumerate, invalid-unary-operand-type
-            fBuffer = self._font[iStart + row * charPerRow]
+            fBuffer = rows[row]
             for i in range(len(fBuffer)):
 
                 for j in range(8):  # 8 is the LCD's page height (see datasheet for explanation)
@@ -948,6 +1814,93 @@ class QwiicOledBase(object):
                         mode)
             #pylint: enable=consider-using-enumerate, invalid-unary-operand-type
 
+    #--------------------------------------------------------------------------
+    # Draw a character from the glyph atlas - the glyph is already shifted for y, so it's
+    # masked into the (up to two) pages it covers.
+
+    def _draw_shifted_glyph(self, x, y, c, color, mode):
+
+        shift = y % 8
+
+        bitmaps = self._font.shifted_glyph(c, shift)
+        if bitmaps is None:
+            for font in self._fallbackFonts:
+                bitmaps = font.shifted_glyph(c, shift)
+                if bitmaps is not None:
+                    break
+            else:
+                return # no bitmap for the required c
+
+        ink, cell, width, pages = bitmaps
+
+        if mode == self.XOR:
+            if color != self.WHITE: # XOR with black is a no-op
+                return
+            cell = ink
+        elif color != self.WHITE:
+            ink = bytes(len(cell))
+
+        oled_bitmap.blit_pages(self._screenbuffer, self.LCDWIDTH, len(self._screenbuffer)//self.LCDWIDTH,
+                               x, y//8, ink, cell, width, pages, mode == self.XOR)
+
+    #--------------------------------------------------------------------------
+    def set_glyph_atlas(self, enable):
+        """
+            Enable or disable the glyph atlas. With the atlas, each font keeps a copy of its glyphs
+            pre-shifted for the 8 possible pixel offsets within a page, built as the glyphs are drawn.
+            Drawing a character is then a copy of ready made bytes into the screen buffer, instead of
+            a pixel at a time. This uses a few KB of memory per font.
+
+            :param enable: If True, characters are drawn from the glyph atlas.
+
+            :return: No return value
+
+        """
+
+        self._glyphAtlas = bool(enable)
+
+    #--------------------------------------------------------------------------
+    # Find the font data for a character in the current font, then in the fallback fonts.
+
+    def _glyph(self, c):
+
+        if isinstance(c, str):
+            cp = ord(c)
+            rows = self._font.unicode_glyph(cp)
+            if rows is None:
+                for font in self._fallbackFonts:
+                    rows = font.unicode_glyph(cp)
+                    if rows is not None:
+                        break
+        else:
+            rows = self._font.glyph(c)
+            if rows is None:
+                for font in self._fallbackFonts:
+                    rows = font.glyph(c)
+                    if rows is not None:
+                        break
+
+        return rows
+
+    #--------------------------------------------------------------------------
+    def set_fallback_fonts(self, fonts):
+        """
+            Set the fonts used for characters that are not in the current font. The fonts
+            are searched in order. Fallback fonts should have the same character size as
+            the current font.
+
+            :param fonts: List of fonts - font type numbers, or fonts from oled_fonts.load_font()
+
+            :return: No return value
+
+        """
+
+        self._fallbackFonts = [oled_fonts.get_font(font) if isinstance(font, int) else font for font in fonts]
+
+        # the cached strings were rendered with the old fallback fonts
+        if self._textCache is not None:
+            self._textCache.clear()
+
     def scroll_stop(self):
         """
             Stop scrolling operation.
@@ -956,7 +1909,11 @@ class QwiicOledBase(object):
 
         """
 
-        self._i2c.writeByte(self.address, I2C_COMMAND, DEACTIVATESCROLL)
+        with self._busLock:
+            self._i2c.writeByte(self.address, I2C_COMMAND, DEACTIVATESCROLL)
+
+            # scrolling moves the contents of the display memory
+            self.invalidate()
 
 
     # Set row start to row stop on the OLED to scroll right.
@@ -979,14 +1936,15 @@ class QwiicOledBase(object):
 
         self.scroll_stop()       # need to disable scrolling before starting to avoid memory corrupt
 
-        self._i2c.writeByte(self.address, I2C_COMMAND, RIGHTHORIZONTALSCROLL)
-        self._i2c.writeByte(self.address, I2C_COMMAND, 0x00)
-        self._i2c.writeByte(self.address, I2C_COMMAND, start)
-        self._i2c.writeByte(self.address, I2C_COMMAND, 0x7)     # scroll speed frames , TODO
-        self._i2c.writeByte(self.address, I2C_COMMAND, stop)
-        self._i2c.writeByte(self.address, I2C_COMMAND, 0x00)
-        self._i2c.writeByte(self.address, I2C_COMMAND, 0xFF)
-        self._i2c.writeByte(self.address, I2C_COMMAND, ACTIVATESCROLL)
+        with self._busLock:
+            self._i2c.writeByte(self.address, I2C_COMMAND, RIGHTHORIZONTALSCROLL)
+            self._i2c.writeByte(self.address, I2C_COMMAND, 0x00)
+            self._i2c.writeByte(self.address, I2C_COMMAND, start)
+            self._i2c.writeByte(self.address, I2C_COMMAND, 0x7)     # scroll speed frames , TODO
+            self._i2c.writeByte(self.address, I2C_COMMAND, stop)
+            self._i2c.writeByte(self.address, I2C_COMMAND, 0x00)
+            self._i2c.writeByte(self.address, I2C_COMMAND, 0xFF)
+            self._i2c.writeByte(self.address, I2C_COMMAND, ACTIVATESCROLL)
 
 
     # Flip the graphics on the OLED vertically.
@@ -999,7 +1957,8 @@ class QwiicOledBase(object):
 
         """
 
-        self._i2c.writeByte(self.address, I2C_COMMAND, COMSCANINC if flip else COMSCANDEC)
+        with self._busLock:
+            self._i2c.writeByte(self.address, I2C_COMMAND, COMSCANINC if flip else COMSCANDEC)
 
 
 
@@ -1013,7 +1972,11 @@ class QwiicOledBase(object):
 
         """
 
-        self._i2c.writeByte(self.address, I2C_COMMAND, SEGREMAP | ( 0x0 if flip else 0x1))
+        with self._busLock:
+            self._i2c.writeByte(self.address, I2C_COMMAND, SEGREMAP | ( 0x0 if flip else 0x1))
+
+            # the remap only applies to new data - the whole screen must be sent again
+            self.invalidate()
 
     # Return a pointer to the start of the RAM screen buffer for direct access.
     def get_screenbuffer(self):
@@ -1044,4 +2007,81 @@ class QwiicOledBase(object):
             print("draw_bitmap - Invalid Input size.", file-sys.stderr)
             return
 
-        self._screenbuffer[:] = bitArray
+        self._screenbuffer[:] = bytearray(bitArray)
+
+    #--------------------------------------------------------------------------
+    # Export the screen buffer, or what the display is showing, as an image - no bus access.
+
+    def snapshot(self, fmt='pbm', scale=1, source='buffer'):
+        """
+            Export the screen buffer, or the last frame sent to the display, as an image file.
+            The display is not read - the image comes from memory.
+
+            :param fmt: 'pbm' (lit pixels are black) or 'png' (lit pixels are white)
+            :param scale: Scale the image by a whole number
+            :param source: 'buffer' for the screen buffer, 'shadow' for the last frame sent
+
+            :return: The image file contents. None if source is 'shadow' and the display
+                    contents are unknown.
+            :rtype: bytes
+
+        """
+
+        if source == 'shadow':
+            frame = self._shadowbuffer
+            if frame is None or self._staleBlocks:
+                return None
+        elif source == 'buffer':
+            frame = self._screenbuffer
+        else:
+            raise ValueError("Invalid snapshot source '%s' - use 'buffer' or 'shadow'" % source)
+
+        scale = max(1, int(scale))
+        width = self.LCDWIDTH * scale
+        height = self.LCDHEIGHT * scale
+        rows = oled_bitmap.scale_rows(oled_bitmap.pages_to_rows(frame, self.LCDWIDTH, self.LCDHEIGHT),
+                                      self.LCDWIDTH, self.LCDHEIGHT, scale)
+
+        if fmt == 'pbm':
+            return b'P4\n%d %d\n' % (width, height) + rows
+        if fmt == 'png':
+            return oled_bitmap.rows_to_png(rows, width, height)
+
+        raise ValueError("Invalid snapshot format '%s' - use 'pbm' or 'png'" % fmt)
+
+    #--------------------------------------------------------------------------
+    # Draw a Pillow image or numpy array at x,y - converted to one bit per pixel (needs numpy)
+
+    def draw_image(self, img, x=0, y=0, dither='floyd-steinberg', threshold=128, invert=False, mode=None):
+        """
+            Draw an image on the screen buffer. The image is converted to one bit per pixel with
+            the dither selected, and drawn at its size, clipped to the screen. Converted images are
+            cached, so drawing the same image again is quick. Needs numpy.
+
+            :param img: A Pillow image or numpy array (gray, RGB/RGBA, boolean or 0.0-1.0)
+            :param x: The X position of the image
+            :param y: The Y position of the image
+            :param dither: 'threshold', 'bayer', 'floyd-steinberg' or 'atkinson'
+            :param threshold: The level (0-255) for a lit pixel, for 'threshold'
+            :param invert: If True, dark pixels of the image are lit
+            :param mode: NORM replaces the screen under the image, XOR inverts the screen under its lit pixels
+
+            :return: No return value
+
+        """
+        from . import oled_image # pylint: disable=import-outside-toplevel
+
+        if mode is None:
+            mode = self.drawMode
+
+        packed = oled_image.convert_image(img, dither, threshold, invert)
+
+        x = int(x)
+        y = int(y)
+
+        shift = y % 8
+        bitmap, mask = packed.variant(shift)
+        xor = mode == self.XOR
+
+        oled_bitmap.blit_pages(self._screenbuffer, self.LCDWIDTH, len(self._screenbuffer)//self.LCDWIDTH,
+                               x, y//8, bitmap, bitmap if xor else mask, packed.width, packed.pages + (1 if shift else 0), xor)
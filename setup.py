@@ -66,6 +66,12 @@ setup(
 
     install_requires=['sparkfun_qwiic_i2c'],
 
+    # Optional features - pip install sparkfun_qwiic_oled_base[convert]
+    extras_require={
+        'convert': ['Pillow'],
+        'image': ['numpy'],
+    },
+
     # Choose your license
     license='MIT',
 
@@ -98,10 +104,19 @@ setup(
 
     # You can just specify the packages manually here if your project is
     # simple. Or you can use find_packages().
-    packages=["qwiic_oled_base", "qwiic_oled_base/fonts"],
+    packages=["qwiic_oled_base", "qwiic_oled_base/fonts", "qwiic_oled_base/logos"],
 
     package_data={
-         "qwiic_oled_base/fonts" : ['*.bin']
+         "qwiic_oled_base/fonts" : ['*.bin'],
+         "qwiic_oled_base/logos" : ['*.bin']
+    },
+
+    # Command line programs
+    entry_points={
+        'console_scripts': [
+            'qwiic-oled-server=qwiic_oled_base.oled_server:main',
+            'qwiic-oled-convert=qwiic_oled_base.oled_convert:main',
+        ],
     },
 
 )
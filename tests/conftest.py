@@ -0,0 +1,99 @@
+#-----------------------------------------------------------------------------
+# conftest.py
+#
+# Test fixtures - a fake I2C driver, and a model of the SSD1306 display memory
+#
+#------------------------------------------------------------------------
+
+import pytest
+
+from qwiic_oled_base import QwiicOledBase
+
+I2C_COMMAND = 0x00
+
+#-----------------------------------------
+# An I2C driver that records every write. Set fail to a function of (kind, value) that returns
+# True to make a write raise an I/O error.
+
+class FakeDriver(object):
+
+    def __init__(self):
+
+        self.log = []
+        self.fail = None
+
+    def writeByte(self, address, commandCode, value):
+        if self.fail is not None and self.fail('byte', value):
+            raise OSError(121, 'Remote I/O error')
+        self.log.append(('byte', commandCode, value))
+
+    def writeBlock(self, address, commandCode, value):
+        value = list(value)
+        if self.fail is not None and self.fail('block', value):
+            # half the block made it
+            self.log.append(('block', commandCode, value[:len(value)//2]))
+            raise OSError(121, 'Remote I/O error')
+        self.log.append(('block', commandCode, value))
+
+    def readByte(self, address, commandCode=None):
+        return 0
+
+    def isDeviceConnected(self, address):
+        return True
+
+    def blocks(self):
+        return [entry for entry in self.log if entry[0] == 'block']
+
+#-----------------------------------------
+# Replay the writes on a model of the display memory - the page and column address commands,
+# and data writes with the column wrapping onto the next page.
+
+def replay(log, width, pages, ram=None):
+
+    ram = bytearray(width * pages) if ram is None else ram
+    page = column = 0
+    command = None
+    args = []
+
+    for kind, code, value in log:
+
+        if kind == 'byte' and code == I2C_COMMAND:
+            if command is not None:
+                args.append(value)
+            elif value in (0x21, 0x22):
+                command = value
+                args = []
+
+            if command is not None and len(args) == 2:
+                if command == 0x22:
+                    page = args[0] % pages
+                else:
+                    column = args[0] % width
+                command = None
+
+        elif kind == 'block':
+            for byte in value:
+                ram[page * width + column] = byte
+                column += 1
+                if column == width:
+                    column = 0
+                    page = (page + 1) % pages
+
+    return ram
+
+def glass(oled):
+    """ What the display shows - the writes replayed on a blank display """
+    return bytes(replay(oled._i2c.log, oled.LCDWIDTH, len(oled._screenbuffer)//oled.LCDWIDTH))
+
+#-----------------------------------------
+@pytest.fixture
+def driver():
+    return FakeDriver()
+
+@pytest.fixture
+def oled(driver):
+
+    display = QwiicOledBase(pixel_width=128, pixel_height=64, i2c_driver=driver, splash=False)
+    display.begin()
+    display.set_font_type(0)
+    return display
@@ -0,0 +1,93 @@
+#-----------------------------------------------------------------------------
+# test_animation.py
+#
+# The animation file format and player
+#
+#------------------------------------------------------------------------
+
+import random
+import threading
+
+import pytest
+
+from qwiic_oled_base.oled_animation import AnimationPlayer, write_animation, encode_changes
+
+from conftest import glass
+
+def _frames(nFrames):
+
+    rand = random.Random(5)
+    frames = [bytearray(1024)]
+    for _ in range(nFrames - 1):
+        frame = bytearray(frames[-1])
+        for _ in range(40):
+            frame[rand.randrange(1024)] = rand.randrange(256)
+        frames.append(frame)
+    return [bytes(frame) for frame in frames]
+
+def test_play(tmp_path, oled):
+
+    path = str(tmp_path / 'clip.qola')
+    frames = _frames(6)
+    write_animation(path, 128, 64, frames, fps=25)
+
+    player = AnimationPlayer(oled, path)
+    assert (player.frames, player.fps) == (6, 25)
+
+    player.play(loops=2, fps=1000)
+    player.close()
+
+    assert glass(oled) == frames[-1]
+    assert bytes(oled.get_screenbuffer()) == frames[-1]
+
+def test_runs_fit_a_block():
+
+    frames = _frames(2)
+    changes = encode_changes(frames[0], frames[1], 128)
+
+    offset = 0
+    while offset < len(changes):
+        length = changes[offset + 2]
+        assert 1 <= length <= 32
+        offset += 3 + length
+    assert offset == len(changes)
+
+def test_fractional_fps_is_rejected(tmp_path):
+
+    with pytest.raises(ValueError):
+        write_animation(str(tmp_path / 'clip.qola'), 128, 64, _frames(2), fps=12.5)
+
+def test_play_inside_frame(tmp_path, oled, driver):
+
+    path = str(tmp_path / 'clip.qola')
+    write_animation(path, 128, 64, _frames(3), fps=30)
+    oled.invalidate()
+
+    player = AnimationPlayer(oled, path)
+    with oled.frame():
+        nWrites = len(driver.log)
+        with pytest.raises(RuntimeError):
+            player.play(loops=1, fps=1000)
+        assert len(driver.log) == nWrites
+    player.close()
+
+    assert glass(oled) == bytes(oled.get_screenbuffer())
+
+def test_play_waits_for_frame_in_other_thread(tmp_path, oled, driver):
+
+    path = str(tmp_path / 'clip.qola')
+    frames = _frames(4)
+    write_animation(path, 128, 64, frames, fps=30)
+    player = AnimationPlayer(oled, path)
+
+    with oled.frame():
+        thread = threading.Thread(target=player.play, kwargs={'loops': 1, 'fps': 1000})
+        nWrites = len(driver.log)
+        thread.start()
+        thread.join(0.2)
+        assert thread.is_alive()
+        assert len(driver.log) == nWrites
+
+    thread.join(2)
+    player.close()
+    assert glass(oled) == bytes(frames[-1])
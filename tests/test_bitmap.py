@@ -0,0 +1,64 @@
+#-----------------------------------------------------------------------------
+# test_bitmap.py
+#
+# Bitmap conversions and file formats
+#
+#------------------------------------------------------------------------
+
+import random
+
+from qwiic_oled_base import oled_bitmap
+
+def _random_bytes(count, seed=1):
+
+    rand = random.Random(seed)
+    return bytes(rand.randrange(256) for _ in range(count))
+
+def test_rows_pages_round_trip():
+
+    for width, height in ((128, 64), (64, 48), (20, 13)):
+        rows = bytearray(_random_bytes(((width + 7)//8) * height))
+
+        # the padding bits at the end of each row are not part of the image
+        stride = (width + 7)//8
+        if width % 8:
+            for row in range(height):
+                rows[row * stride + stride - 1] &= (0xFF << (8 - width % 8)) & 0xFF
+
+        pages = oled_bitmap.rows_to_pages(bytes(rows), width, height)
+        assert len(pages) == width * ((height + 7)//8)
+        assert bytes(oled_bitmap.pages_to_rows(pages, width, height)) == bytes(rows)
+
+def test_rows_to_pages_bit_order():
+
+    # the top left pixel is bit 0 of the first byte
+    rows = bytearray(2 * 16)
+    rows[0] = 0x80
+    pages = oled_bitmap.rows_to_pages(bytes(rows), 16, 16)
+    assert pages[0] == 0x01
+
+def test_pbm_round_trip():
+
+    pages = _random_bytes(128 * 8)
+    width, height, parsed = oled_bitmap.parse_pbm(oled_bitmap.pages_to_pbm(pages, 128, 64))
+    assert (width, height) == (128, 64)
+    assert bytes(parsed) == pages
+
+def test_plain_pbm_and_xbm():
+
+    width, height, pages = oled_bitmap.parse_pbm(b'P1\n# comment\n3 2\n1 0 1\n0 1 0\n')
+    assert (width, height) == (3, 2)
+    assert bytes(pages) == bytes([0x01, 0x02, 0x01])
+
+    xbm = '#define t_width 3\n#define t_height 2\nstatic char t_bits[] = { 0x05, 0x02 };\n'
+    assert oled_bitmap.parse_xbm(xbm) == (3, 2, pages)
+
+def test_snapshot(oled):
+
+    oled.rect_fill(0, 0, 8, 8)
+    pbm = oled.snapshot('pbm')
+    width, height, pages = oled_bitmap.parse_pbm(pbm)
+    assert (width, height) == (128, 64)
+    assert bytes(pages) == bytes(oled.get_screenbuffer())
+
+    assert oled.snapshot('png', 2).startswith(b'\x89PNG')
@@ -0,0 +1,98 @@
+#-----------------------------------------------------------------------------
+# test_canvas.py
+#
+# The numpy canvas - packing to page format, and drawing parity with the display
+# methods. Needs numpy
+#
+#------------------------------------------------------------------------
+
+import threading
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from qwiic_oled_base import QwiicOledBase
+from qwiic_oled_base.oled_canvas import NumpyCanvas
+
+from conftest import FakeDriver
+
+def _new_display(width=128, height=64):
+
+    return QwiicOledBase(pixel_width=width, pixel_height=height, i2c_driver=FakeDriver(), splash=False)
+
+@pytest.mark.parametrize('size', [(128, 64), (64, 48), (128, 32)])
+def test_pack_unpack_round_trip(size):
+
+    oled = _new_display(*size)
+    canvas = NumpyCanvas(oled)
+    rand = np.random.RandomState(3)
+
+    pixels = rand.rand(size[1], size[0]) > 0.5
+    canvas.array[...] = pixels
+    canvas.pack()
+    canvas.clear()
+    canvas.unpack()
+    assert (canvas.array == pixels).all()
+
+    screen = bytes(bytearray(rand.randint(0, 256, len(oled.get_screenbuffer())).astype(np.uint8)))
+    oled.get_screenbuffer()[:] = screen
+    canvas.unpack()
+    canvas.pack()
+    assert bytes(oled.get_screenbuffer()) == screen
+
+def test_uint8_canvas_packs_nonzero():
+
+    oled = _new_display()
+    canvas = NumpyCanvas(oled, dtype=np.uint8)
+    canvas.array[0, :8] = 7
+    canvas.pack()
+    assert bytes(oled.get_screenbuffer()[:9]) == bytes([1] * 8 + [0])
+
+def test_drawing_matches_display_methods():
+
+    direct = _new_display()
+    direct.rect_fill(10, 5, 30, 20)
+    direct.rect_fill(20, 10, 40, 30, direct.WHITE, direct.XOR)
+    direct.pixel(127, 63)
+
+    oled = _new_display()
+    canvas = NumpyCanvas(oled)
+    canvas.array[5:25, 10:40] = True
+    canvas.blit(np.ones((30, 40), dtype=np.bool_), 20, 10, op='xor')
+    canvas.array[63, 127] = True
+    canvas.pack()
+
+    assert bytes(oled.get_screenbuffer()) == bytes(direct.get_screenbuffer())
+
+    # invert and shift against the unpacked pixels
+    before = canvas.array.copy()
+    canvas.invert()
+    assert (canvas.array == ~before).all()
+
+    canvas.array[...] = before
+    canvas.shift(3, -2)
+    expected = np.zeros_like(before)
+    expected[:-2, 3:] = before[2:, :-3]
+    assert (canvas.array == expected).all()
+
+def test_pack_locks_pages():
+
+    oled = _new_display()
+    oled.thread_safe()
+    canvas = NumpyCanvas(oled)
+    canvas.array[...] = True
+
+    lock = oled._pageLocks[3]
+    lock.acquire()
+    try:
+        thread = threading.Thread(target=canvas.pack)
+        thread.start()
+        thread.join(0.1)
+        assert thread.is_alive()
+        assert not any(oled.get_screenbuffer())
+    finally:
+        lock.release()
+
+    thread.join(2)
+    assert bytes(oled.get_screenbuffer()) == bytes([0xFF] * 1024)
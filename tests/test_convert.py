@@ -0,0 +1,70 @@
+#-----------------------------------------------------------------------------
+# test_convert.py
+#
+# The animation converter - needs Pillow
+#
+#------------------------------------------------------------------------
+
+import pytest
+
+Image = pytest.importorskip('PIL.Image')
+
+from qwiic_oled_base import oled_convert
+from qwiic_oled_base.oled_animation import AnimationPlayer
+
+from conftest import glass
+
+def _write_gif(path, nFrames):
+
+    frames = []
+    for iFrame in range(nFrames):
+        frame = Image.new('L', (256, 128), 0)
+        frame.paste(255, (iFrame * 16, 0, iFrame * 16 + 40, 60))
+        frames.append(frame)
+
+    frames[0].save(path, save_all=True, append_images=frames[1:], duration=100, loop=0)
+    return frames
+
+def test_convert_in_workers(tmp_path, oled):
+
+    gif = str(tmp_path / 'clip.gif')
+    frames = _write_gif(gif, 9)
+    output = str(tmp_path / 'clip.qola')
+
+    assert oled_convert.convert([gif], output, 128, 64, workers=2) == 9
+
+    player = AnimationPlayer(oled, output)
+    assert (player.frames, player.fps) == (9, 10)
+    player.play(loops=1, fps=1000)
+    player.close()
+
+    assert glass(oled) == oled_convert.convert_frame(frames[-1], 128, 64)
+
+def test_threshold_zero(tmp_path, oled):
+
+    gif = str(tmp_path / 'clip.gif')
+    _write_gif(gif, 2)
+    output = str(tmp_path / 'clip.qola')
+
+    assert oled_convert.main([gif, '-o', output, '--threshold', '0', '--workers', '1']) == 0
+
+    player = AnimationPlayer(oled, output)
+    player.play(loops=1, fps=1000)
+    player.close()
+
+    # every pixel is at or above level 0
+    assert glass(oled) == b'\xff' * 1024
+
+@pytest.mark.parametrize('size', [(128, 64), (64, 48), (13, 11)])
+def test_image_to_pages(size):
+
+    width, height = size
+    img = Image.new('1', size, 0)
+    img.putpixel((0, 0), 1)
+    img.putpixel((width - 1, height - 1), 1)
+
+    pages = oled_convert.image_to_pages(img)
+    assert len(pages) == width * ((height + 7)//8)
+    assert pages[0] == 0x01
+    assert pages[-1] == 1 << ((height - 1) % 8)
+    assert sum(bin(b).count('1') for b in pages) == 2
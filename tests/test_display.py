@@ -0,0 +1,212 @@
+#-----------------------------------------------------------------------------
+# test_display.py
+#
+# Sending frames - the shadow buffer diff, frame files, frames, chunked transfers and
+# the frame rate limit
+#
+#------------------------------------------------------------------------
+
+import time
+import threading
+
+from qwiic_oled_base import QwiicOledBase
+from qwiic_oled_base import oled_framemap
+
+from conftest import FakeDriver, glass
+
+def test_display_sends_changes_only(oled, driver):
+
+    oled.rect_fill(0, 0, 128, 64)
+    oled.display()
+    assert glass(oled) == bytes(oled.get_screenbuffer())
+
+    nWrites = len(driver.log)
+    oled.display()
+    assert len(driver.log) == nWrites
+
+    nBlocks = len(driver.blocks())
+    oled.pixel(5, 5, oled.BLACK)
+    oled.display()
+    assert len(driver.blocks()) - nBlocks == 1
+    assert glass(oled) == bytes(oled.get_screenbuffer())
+
+def test_frame_file_warm_begin(tmp_path, driver):
+
+    path = str(tmp_path / 'frame.bin')
+
+    oled = QwiicOledBase(pixel_width=128, pixel_height=64, i2c_driver=driver, splash=False)
+    oled.set_frame_file(path)
+    oled.begin()
+    oled.circle(60, 30, 20)
+    oled.display()
+
+    restarted = QwiicOledBase(pixel_width=128, pixel_height=64, i2c_driver=FakeDriver(), splash=False)
+    restarted.set_frame_file(path)
+    restarted.begin(warm=True)
+    assert bytes(restarted.get_screenbuffer()) == bytes(oled.get_screenbuffer())
+
+    restarted.display()
+    assert restarted._i2c.blocks() == []
+
+def test_frame_map(tmp_path, driver):
+
+    path = str(tmp_path / 'frame.map')
+
+    oled = QwiicOledBase(pixel_width=128, pixel_height=32, i2c_driver=driver, splash=False)
+    assert not oled.map_framebuffer(path)
+    oled.begin()
+    oled.rect(10, 10, 20, 10)
+    oled.display()
+
+    width, height, screen, shadow, sequence = oled_framemap.read_frame_map(path)
+    assert (width, height) == (128, 32)
+    assert shadow == screen == bytes(oled.get_screenbuffer())
+    assert sequence > 0
+
+def test_frame_is_atomic(oled, driver):
+
+    nWrites = len(driver.log)
+    with oled.frame():
+        oled.rect_fill(0, 0, 50, 20)
+        oled.display()
+        assert len(driver.log) == nWrites
+    assert glass(oled) == bytes(oled.get_screenbuffer())
+
+    before = bytes(oled.get_screenbuffer())
+    try:
+        with oled.frame():
+            oled.clear(oled.PAGE)
+            raise ValueError('failed frame')
+    except ValueError:
+        pass
+    assert bytes(oled.get_screenbuffer()) == before
+    assert not oled.in_frame()
+
+def test_frame_one_thread_at_a_time(oled, driver):
+
+    entered = threading.Event()
+    done = []
+
+    def other():
+        entered.wait(2)
+        with oled.frame():
+            oled.rect_fill(64, 0, 64, 64)
+        done.append(True)
+
+    thread = threading.Thread(target=other)
+    thread.start()
+
+    before = bytes(oled.get_screenbuffer())
+    try:
+        with oled.frame():
+            entered.set()
+            oled.rect_fill(0, 0, 64, 64)
+            # the other thread waits for this frame - its drawing isn't rolled back with it
+            thread.join(0.1)
+            assert not done
+            raise ValueError('failed frame')
+    except ValueError:
+        pass
+    assert bytes(oled.get_screenbuffer()) == before
+
+    thread.join(2)
+    assert done
+    assert bytes(oled.get_screenbuffer()[64:128]) == bytes([0xFF] * 64)
+    assert glass(oled) == bytes(oled.get_screenbuffer())
+
+def test_frame_end_uses_frame_rate_limit(oled, driver):
+
+    oled.display()
+    oled.set_frame_rate(1)
+
+    frames = oled.counters.frames
+    for x in range(5):
+        with oled.frame():
+            oled.pixel(x, 0)
+    assert oled.counters.frames - frames <= 1
+    assert oled.counters.merged >= 3
+
+    oled.set_frame_rate(None)
+    assert glass(oled) == bytes(oled.get_screenbuffer())
+
+def test_display_iter(oled, driver):
+
+    oled.rect_fill(0, 0, 128, 30)
+    steps = list(oled.display_iter())
+    assert len(steps) == len(driver.blocks()) == 16
+    assert glass(oled) == bytes(oled.get_screenbuffer())
+
+    # an abandoned transfer is finished by the next one
+    oled.clear(oled.PAGE)
+    oled.line(0, 0, 127, 63)
+    transfer = oled.display_iter(per_page=True)
+    next(transfer)
+    transfer.close()
+    oled.display()
+    assert glass(oled) == bytes(oled.get_screenbuffer())
+
+def test_retry(oled, driver):
+
+    oled.set_retry(3, 0, 0)
+    failures = iter([True, False, True, True] + [False] * 1000)
+    driver.fail = lambda kind, value: kind == 'block' and next(failures)
+
+    oled.rect_fill(0, 0, 128, 64)
+    oled.display()
+
+    assert oled.counters.retries == 3
+    assert oled.counters.errors == 0
+    assert glass(oled) == bytes(oled.get_screenbuffer())
+
+def test_failed_frame_resumes(oled, driver):
+
+    oled.set_retry(0)
+    oled.rect_fill(0, 0, 128, 64)
+
+    nBlocks = [0]
+    def fail(kind, value):
+        if kind == 'block':
+            nBlocks[0] += 1
+            return nBlocks[0] == 10
+        return False
+    driver.fail = fail
+
+    try:
+        oled.display()
+        assert False, 'the error is raised'
+    except OSError:
+        pass
+
+    assert oled.counters.errors == 1
+    assert oled.snapshot(source='shadow') is None
+
+    nSent = len(driver.blocks())
+    oled.display()
+    assert len(driver.blocks()) - nSent == 32 - 9
+    assert glass(oled) == bytes(oled.get_screenbuffer())
+
+def test_frame_rate_limit_one_thread(oled, driver):
+
+    oled.display()
+    oled.set_frame_rate(20)
+
+    threads = set()
+    tEnd = time.monotonic() + 0.3
+    while time.monotonic() < tEnd:
+        oled.pixel(int(time.monotonic() * 1000) % 128, 10, oled.WHITE, oled.XOR)
+        oled.display()
+        if oled._frameThread is not None:
+            threads.add(oled._frameThread)
+        time.sleep(0.002)
+
+    # every deferred frame is sent by the same thread
+    assert len(threads) == 1
+    assert oled.counters.merged > 0
+    assert oled.counters.dropped == 0
+    assert oled.counters.frames > 2
+
+    # the last frame is sent when due, and the thread exits when idle
+    thread = threads.pop()
+    thread.join(1.0)
+    assert not thread.is_alive()
+    assert glass(oled) == bytes(oled.get_screenbuffer())
@@ -0,0 +1,60 @@
+#-----------------------------------------------------------------------------
+# test_image.py
+#
+# Image import and dithering - needs numpy
+#
+#------------------------------------------------------------------------
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from qwiic_oled_base import oled_image
+
+# The error diffusion dither, a pixel at a time
+
+def _reference_dither(gray, method):
+
+    kernel, divisor = oled_image._KERNELS[method]
+    height, width = gray.shape
+    work = gray.astype(np.float32)
+    out = np.zeros((height, width), dtype=np.bool_)
+
+    for y in range(height):
+        for x in range(width):
+            value = work[y, x]
+            out[y, x] = value >= 128
+            error = value - np.float32(255.0) * out[y, x]
+            for dy, dx, weight in kernel:
+                if 0 <= x + dx < width and y + dy < height:
+                    work[y + dy, x + dx] += error * np.float32(weight / divisor)
+
+    return out
+
+@pytest.mark.parametrize('method', [oled_image.DITHER_FLOYD_STEINBERG, oled_image.DITHER_ATKINSON])
+@pytest.mark.parametrize('shape', [(64, 128), (48, 64), (7, 5), (1, 9), (9, 1)])
+def test_error_diffusion_matches_reference(method, shape):
+
+    gray = np.random.default_rng(7).integers(0, 256, shape).astype(np.uint8)
+    assert (oled_image.dither(gray, method) == _reference_dither(gray, method)).all()
+
+def test_dither_keeps_the_level():
+
+    # Atkinson drops part of the error, so it is not included
+    gray = np.full((64, 128), 64, dtype=np.uint8)
+    for method in (oled_image.DITHER_BAYER, oled_image.DITHER_FLOYD_STEINBERG):
+        assert abs(oled_image.dither(gray, method).mean() - 0.25) < 0.01
+    assert not oled_image.dither(gray, oled_image.DITHER_THRESHOLD).any()
+
+def test_pack_round_trip():
+
+    pixels = np.random.default_rng(2).integers(0, 2, (48, 64)).astype(np.bool_)
+    pages, nPages = oled_image.pack_pages(pixels)
+    assert nPages == 6
+    assert (oled_image.unpack_pages(pages, 64, 48) == pixels).all()
+
+def test_draw_image_float_position(oled):
+
+    image = np.ones((8, 8), dtype=np.bool_)
+    oled.draw_image(image, 10.6, 8.2, dither='threshold')
+    assert bytes(oled.get_screenbuffer()[128 + 10:128 + 18]) == b'\xff' * 8
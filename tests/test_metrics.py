@@ -0,0 +1,81 @@
+#-----------------------------------------------------------------------------
+# test_metrics.py
+#
+# The Prometheus textfile exporter
+#
+#------------------------------------------------------------------------
+
+import time
+
+import pytest
+
+from qwiic_oled_base import QwiicOledBase
+from qwiic_oled_base.oled_metrics import TextfileExporter
+
+from conftest import FakeDriver
+
+def _new_display():
+
+    oled = QwiicOledBase(pixel_width=128, pixel_height=64, i2c_driver=FakeDriver(), splash=False)
+    oled.begin()
+    oled.set_font_type(0)
+    return oled
+
+def test_render(tmp_path):
+
+    first = _new_display()
+    second = _new_display()
+    for oled in (first, second):
+        oled.draw_text(0, 0, 'metrics')
+        oled.display()
+
+    exporter = TextfileExporter(str(tmp_path / 'oled.prom'))
+    exporter.add(first, 'first')
+    exporter.add(second, 'second')
+    text = exporter.render()
+
+    assert 'qwiic_oled_frames_total{display="first"} 1' in text
+    assert 'qwiic_oled_frames_total{display="second"} 1' in text
+    assert 'qwiic_oled_merged_frames_total{display="first"} 0' in text
+
+    # the font is shared - its atlas is exported once
+    atlasHits = [line for line in text.splitlines() if line.startswith('qwiic_oled_glyph_atlas_hits_total')]
+    assert atlasHits == ['qwiic_oled_glyph_atlas_hits_total{font="0"} %d' % first._font.atlas_hits]
+
+def test_render_without_text_cache(tmp_path):
+
+    oled = _new_display()
+    oled.set_text_cache_size(0)
+
+    exporter = TextfileExporter(str(tmp_path / 'oled.prom'))
+    exporter.add(oled)
+    assert 'text_cache' not in exporter.render()
+
+def test_duplicate_label_rejected(tmp_path):
+
+    # the same default address - on different buses
+    first = _new_display()
+    second = _new_display()
+
+    exporter = TextfileExporter(str(tmp_path / 'oled.prom'))
+    exporter.add(first)
+    with pytest.raises(ValueError):
+        exporter.add(second)
+
+    exporter.add(second, 'bus3')
+    assert 'qwiic_oled_frames_total{display="bus3"} 0' in exporter.render()
+
+def test_thread_survives_errors(tmp_path, capsys):
+
+    exporter = TextfileExporter(str(tmp_path / 'missing' / 'oled.prom'), interval=0.01)
+    exporter.add(_new_display())
+    exporter.start()
+    time.sleep(0.05)
+    assert exporter._thread.is_alive()
+
+    exporter.path = str(tmp_path / 'oled.prom')
+    time.sleep(0.05)
+    exporter.stop()
+
+    assert 'unable to write' in capsys.readouterr().err
+    assert (tmp_path / 'oled.prom').read_text().startswith('# HELP')
@@ -0,0 +1,85 @@
+#-----------------------------------------------------------------------------
+# test_profile.py
+#
+# The drawing profiler - shared method wrappers, per thread sections and the
+# report at exit
+#
+#------------------------------------------------------------------------
+
+import gc
+import weakref
+import threading
+
+from qwiic_oled_base import QwiicOledBase
+from qwiic_oled_base import oled_profile
+
+from conftest import FakeDriver
+
+def _new_display():
+
+    return QwiicOledBase(pixel_width=128, pixel_height=64, i2c_driver=FakeDriver(), splash=False)
+
+def test_profilers_disabled_in_any_order():
+
+    oled = _new_display()
+    first = oled_profile.Profiler(oled, ['pixel'])
+    second = oled_profile.Profiler(oled, ['pixel'])
+
+    first.enable()
+    second.enable()
+    oled.pixel(1, 1)
+
+    # the first one out must not remove the second one's wrapper
+    first.disable()
+    oled.pixel(2, 2)
+
+    assert first.records[('', 'pixel')][0] == 1
+    assert second.records[('', 'pixel')][0] == 2
+
+    second.disable()
+    assert 'pixel' not in oled.__dict__
+    oled.pixel(3, 3)
+    assert second.records[('', 'pixel')][0] == 2
+
+def test_sections_are_per_thread():
+
+    oled = _new_display()
+    profiler = oled_profile.Profiler(oled, ['pixel'])
+    inSection = threading.Event()
+    done = threading.Event()
+
+    def worker():
+        with profiler.section('worker'):
+            inSection.set()
+            done.wait(5)
+
+    with profiler:
+        thread = threading.Thread(target=worker)
+        thread.start()
+        inSection.wait(5)
+        oled.pixel(0, 0)
+        done.set()
+        thread.join()
+
+    assert list(profiler.records) == [('', 'pixel')]
+
+def test_env_report_does_not_keep_display(tmp_path, monkeypatch):
+
+    path = str(tmp_path / 'profile.txt')
+    monkeypatch.setattr(oled_profile, '_envReports', [])
+    monkeypatch.setattr(oled_profile, '_envHooked', True)
+
+    oled = _new_display()
+    oled_profile.enable_from_env(oled, path)
+    oled.pixel(0, 0)
+
+    ref = weakref.ref(oled)
+    del oled
+    gc.collect()
+    assert ref() is None
+
+    oled_profile._write_env_reports()
+    with open(path) as fp:
+        report = fp.read()
+    assert 'QwiicOledBase 128x64' in report
+    assert 'pixel' in report
@@ -0,0 +1,114 @@
+#-----------------------------------------------------------------------------
+# test_scheduler.py
+#
+# The priority flush scheduler
+#
+#------------------------------------------------------------------------
+
+import threading
+import time
+
+from qwiic_oled_base.oled_scheduler import FlushScheduler, PRIORITY_LOW, PRIORITY_HIGH
+
+from conftest import glass
+
+def test_preempted_frame_is_not_resumed(oled):
+
+    scheduler = FlushScheduler(oled)
+    low = bytes([0x55] * 1024)
+    alarm = bytes([0xFF] * 512 + [0x00] * 512)
+
+    scheduler.submit(low, PRIORITY_LOW)
+    for _ in range(5):
+        scheduler.step()
+    scheduler.submit(alarm, PRIORITY_HIGH)
+    scheduler.run_until_idle()
+
+    assert scheduler.preemptions == 1
+    assert glass(oled) == alarm
+
+def test_converges_to_latest_frame(oled):
+
+    scheduler = FlushScheduler(oled)
+    alarm = bytes([0xFF] * 1024)
+    latest = bytes([0x0F] * 1024)
+
+    scheduler.submit(bytes([0x01] * 1024), PRIORITY_LOW)
+    scheduler.step()
+    scheduler.submit(alarm, PRIORITY_HIGH)
+    scheduler.submit(latest, PRIORITY_LOW)
+    scheduler.run_until_idle()
+
+    assert glass(oled) == latest
+
+def test_submit_does_not_wait_for_the_bus(oled, driver):
+
+    scheduler = FlushScheduler(oled)
+    sending = threading.Event()
+    release = threading.Event()
+
+    writeBlock = driver.writeBlock
+    def slow_write(address, commandCode, value):
+        sending.set()
+        release.wait(2)
+        writeBlock(address, commandCode, value)
+    driver.writeBlock = slow_write
+
+    scheduler.submit(bytes([0x01] * 1024))
+    stepper = threading.Thread(target=scheduler.step)
+    stepper.start()
+    assert sending.wait(2)
+
+    tStart = time.monotonic()
+    scheduler.submit(bytes([0x02] * 1024), PRIORITY_HIGH)
+    assert time.monotonic() - tStart < 0.5
+
+    release.set()
+    stepper.join()
+    scheduler.run_until_idle()
+    assert glass(oled) == bytes([0x02] * 1024)
+
+def test_thread_waits_for_open_frame(oled, driver):
+
+    scheduler = FlushScheduler(oled)
+    scheduler.start()
+    try:
+        with oled.frame():
+            nBlocks = len(driver.blocks())
+            scheduler.submit(bytes([0x03] * 1024))
+            time.sleep(0.05)
+            assert len(driver.blocks()) == nBlocks
+
+        deadline = time.monotonic() + 2
+        while scheduler.pending() and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        scheduler.stop()
+
+    assert glass(oled) == bytes([0x03] * 1024)
+
+def test_thread_survives_bus_error(oled, driver, capsys):
+
+    oled.set_retry(0)
+    failing = [True]
+    driver.fail = lambda kind, value: kind == 'block' and failing[0]
+
+    scheduler = FlushScheduler(oled)
+    scheduler.start()
+    try:
+        scheduler.submit(bytes([0x05] * 1024))
+        deadline = time.monotonic() + 2
+        while scheduler.pending() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert 'error sending the frame' in capsys.readouterr().err
+
+        # the bus recovers - the next frame reaches the glass
+        failing[0] = False
+        scheduler.submit(bytes([0x06] * 1024))
+        deadline = time.monotonic() + 2
+        while scheduler.pending() and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        scheduler.stop()
+
+    assert glass(oled) == bytes([0x06] * 1024)
@@ -0,0 +1,186 @@
+#-----------------------------------------------------------------------------
+# test_server.py
+#
+# The display server, end to end - a client drawing on a display on the fake driver
+#
+#------------------------------------------------------------------------
+
+import random
+import threading
+import time
+
+import pytest
+
+from qwiic_oled_base import QwiicOledBase
+from qwiic_oled_base import oled_server
+from qwiic_oled_base.oled_server import DisplayServer, DisplayClient, OP_REGION, _REGION
+
+from conftest import FakeDriver, glass
+
+@pytest.fixture
+def server(tmp_path, oled):
+
+    displayServer = DisplayServer([oled], str(tmp_path / 'oled.sock'), fps=1000)
+    yield displayServer
+    displayServer.close()
+
+def _serve(server):
+
+    # accept, read and send - a few rounds, the server never blocks
+    for _ in range(5):
+        server.serve_once(0.01)
+    server.flush()
+
+def test_client_draws(server, oled):
+
+    client = DisplayClient(server.path)
+    client.clear()
+    client.rect(10, 10, 30, 20, fill=True)
+    client.line(0, 63, 127, 0)
+    client.text(50, 20, 'hi')
+    client.define_bitmap(1, 8, 8, bytes(range(1, 9)))
+    client.bitmap(1, 100, 48)
+    client.commit()
+    _serve(server)
+    client.close()
+
+    expected = QwiicOledBase(pixel_width=128, pixel_height=64, i2c_driver=FakeDriver(), splash=False)
+    expected.begin()
+    expected.rect_fill(10, 10, 30, 20, 1, 0)
+    expected.line(0, 63, 127, 0, 1, 0)
+    expected.set_font_type(0)
+    expected.set_cursor(50, 20)
+    expected.print('hi')
+    expected.get_screenbuffer()[6 * 128 + 100:6 * 128 + 108] = bytes(range(1, 9))
+
+    assert bytes(oled.get_screenbuffer()) == bytes(expected.get_screenbuffer())
+    assert glass(oled) == bytes(oled.get_screenbuffer())
+
+def test_invalid_commit_is_not_applied(server, oled):
+
+    client = DisplayClient(server.path)
+    client.rect(0, 0, 20, 20, fill=True)
+    client.commit()
+    _serve(server)
+    before = bytes(oled.get_screenbuffer())
+
+    # a valid operation, then a region with the wrong payload size
+    client.rect(40, 0, 20, 20, fill=True)
+    client._op(OP_REGION, 0, _REGION.pack(0, 0, 10, 1) + bytes(5))
+    client.commit()
+    _serve(server)
+    client.close()
+
+    assert bytes(oled.get_screenbuffer()) == before
+    assert glass(oled) == before
+
+def test_flush_error_is_logged(server, oled, driver, capsys):
+
+    client = DisplayClient(server.path)
+    client.rect(0, 0, 20, 20, fill=True)
+    client.commit()
+
+    oled.set_retry(0)
+    driver.fail = lambda kind, value: kind == 'block'
+    _serve(server)
+    assert 'unable to send display 0' in capsys.readouterr().err
+
+    # sent at the next frame, once the bus works
+    driver.fail = None
+    server.flush()
+    client.close()
+    assert glass(oled) == bytes(oled.get_screenbuffer())
+
+def test_idle_server_blocks(server):
+
+    rounds = [0]
+    serve_once = server.serve_once
+    def counting_serve_once(timeout=None):
+        rounds[0] += 1
+        serve_once(timeout)
+    server.serve_once = counting_serve_once
+
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    time.sleep(0.2)
+    server.shutdown()
+    thread.join(2)
+
+    assert not thread.is_alive()
+    assert rounds[0] <= 2
+
+def _new_display():
+
+    return QwiicOledBase(pixel_width=128, pixel_height=64, i2c_driver=FakeDriver(), splash=False)
+
+def test_clipped_shapes_match_display_methods():
+
+    clipped = _new_display()
+    direct = _new_display()
+    rand = random.Random(7)
+
+    # XOR - every pixel is drawn the same number of times
+    for _ in range(300):
+        x0, x1 = rand.randint(-200, 300), rand.randint(-200, 300)
+        y0, y1 = rand.randint(-100, 160), rand.randint(-100, 160)
+        width, height = rand.randint(0, 300), rand.randint(0, 200)
+        for draw, shape in ((oled_server._line, 'line'), (oled_server._rect, 'rect'), (oled_server._rect_fill, 'rect_fill')):
+            args = (x0, y0, x1, y1) if shape == 'line' else (x0, y0, width, height)
+            try:
+                draw(clipped, *(args + (1, 1)))
+            except ValueError:
+                # off the display - the display method draws nothing either
+                before = bytes(direct.get_screenbuffer())
+                getattr(direct, shape)(*(args + (1, 1)))
+                assert bytes(direct.get_screenbuffer()) == before
+                continue
+            getattr(direct, shape)(*(args + (1, 1)))
+
+    assert bytes(clipped.get_screenbuffer()) == bytes(direct.get_screenbuffer())
+
+def test_huge_rect_is_clipped(server, oled):
+
+    client = DisplayClient(server.path)
+    client.rect(0, 0, 0xFFFF, 0xFFFF, fill=True)
+    client.rect(-32768, -32768, 0xFFFF, 0xFFFF)
+    client.commit()
+
+    tStart = time.monotonic()
+    _serve(server)
+    client.close()
+
+    assert time.monotonic() - tStart < 2
+    assert glass(oled) == bytes([0xFF] * 1024)
+
+def test_second_server_refused(server, tmp_path, oled):
+
+    with pytest.raises(OSError):
+        DisplayServer([oled], server.path)
+
+    # a client still reaches the first server
+    client = DisplayClient(server.path)
+    client.rect(0, 0, 8, 8, fill=True)
+    client.commit()
+    _serve(server)
+    client.close()
+    assert glass(oled)[:8] == bytes([0xFF] * 8)
+
+def test_invalid_fps(tmp_path, oled):
+
+    with pytest.raises(ValueError):
+        DisplayServer([oled], str(tmp_path / 'zero.sock'), fps=0)
+
+def test_client_over_pending_limit_dropped(server, oled, monkeypatch, capsys):
+
+    monkeypatch.setattr(oled_server, '_MAX_PENDING', 1000)
+    before = bytes(oled.get_screenbuffer())
+
+    client = DisplayClient(server.path)
+    for _ in range(200):
+        client.rect(0, 0, 8, 8, fill=True)
+    client.commit()
+    _serve(server)
+    client.close()
+
+    assert 'operations before a commit' in capsys.readouterr().err
+    assert bytes(oled.get_screenbuffer()) == before
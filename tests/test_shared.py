@@ -0,0 +1,90 @@
+#-----------------------------------------------------------------------------
+# test_shared.py
+#
+# The shared memory frame - canvases, and the flusher that owns the display
+#
+#------------------------------------------------------------------------
+
+import uuid
+import multiprocessing
+
+import pytest
+
+from qwiic_oled_base.oled_shared import SharedFrame, SharedCanvas, SharedFlusher
+
+from conftest import glass
+
+@pytest.fixture
+def frame():
+
+    sharedFrame = SharedFrame('qoled_%s' % uuid.uuid4().hex[:12], 128, 64, [(0, 0, 128, 32), (0, 32, 64, 32)])
+    yield sharedFrame
+    sharedFrame.close()
+
+def test_regions_are_flushed(frame, oled):
+
+    top = SharedCanvas(frame._shm.name, 0)
+    bottom = SharedCanvas(frame._shm.name, 1)
+    flusher = SharedFlusher(oled, frame)
+
+    top.rect_fill(0, 0, 128, 8)
+    top.display()
+    bottom.line(0, 32, 63, 63)
+    bottom.display()
+
+    assert flusher.poll()
+    assert not flusher.poll()
+
+    expected = bytearray(1024)
+    expected[:128] = top.get_screenbuffer()[:128]
+    expected[512:1024] = bottom.get_screenbuffer()[512:1024]
+    assert glass(oled) == bytes(expected)
+
+    top.close()
+    bottom.close()
+
+def test_canvas_never_uses_the_bus(frame):
+
+    # the I2C library is not installed here - any use of the bus raises ImportError
+    canvas = SharedCanvas(frame._shm.name, 0)
+    canvas.clear(canvas.ALL)
+    canvas.invert(True)
+    canvas.contrast(10)
+    canvas.scroll_right(0, 3)
+    canvas.scroll_stop()
+    canvas.flip_vertical(True)
+    canvas.flip_horizontal(True)
+    assert canvas.is_connected()
+    canvas.close()
+
+def test_poll_in_thread_safe_mode(frame, oled):
+
+    oled.thread_safe()
+    canvas = SharedCanvas(frame._shm.name, 0)
+    flusher = SharedFlusher(oled, frame)
+
+    canvas.rect_fill(10, 0, 20, 16)
+    canvas.display()
+    assert flusher.poll()
+    assert glass(oled)[:256] == bytes(canvas.get_screenbuffer()[:256])
+
+    canvas.close()
+
+def _draw_in_child(name):
+
+    canvas = SharedCanvas(name, 1)
+    canvas.rect_fill(0, 32, 64, 32)
+    canvas.display()
+    canvas.close()
+
+def test_canvas_in_child_process(frame, oled):
+
+    child = multiprocessing.Process(target=_draw_in_child, args=(frame._shm.name,))
+    child.start()
+    child.join(10)
+    assert child.exitcode == 0
+
+    # the block outlives the child - it belongs to the creator
+    flusher = SharedFlusher(oled, frame)
+    assert flusher.poll()
+    assert glass(oled)[512:1024] == bytes([0xFF] * 64 + [0x00] * 64) * 4
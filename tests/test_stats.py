@@ -0,0 +1,65 @@
+#-----------------------------------------------------------------------------
+# test_stats.py
+#
+# Latency histograms and frame statistics
+#
+#------------------------------------------------------------------------
+
+import random
+import time
+
+from qwiic_oled_base.oled_stats import LatencyHistogram, FrameStats
+
+def test_histogram_percentiles():
+
+    histogram = LatencyHistogram()
+    rand = random.Random(3)
+    values = [rand.uniform(0.0001, 0.05) for _ in range(5000)]
+    for value in values:
+        histogram.record(value)
+
+    values.sort()
+    summary = histogram.summary()
+    assert summary['count'] == len(values)
+    assert abs(summary['p95'] - values[int(0.95 * len(values))]) < 0.02 * values[int(0.95 * len(values))]
+    assert abs(summary['max'] - max(values)) < 1e-5
+
+def test_idle_time_is_not_frame_time():
+
+    stats = FrameStats(fps=10)
+
+    # a loop paced at the target rate - 10ms drawing, then idle until the next frame
+    tNow = 0.0
+    for _ in range(20):
+        stats.start_frame(tNow)
+        stats.record(tNow + 0.010, tNow + 0.012)
+        tNow += 0.1
+
+    summary = stats.summary()
+    assert summary['frame']['count'] == 20
+    assert summary['frame']['max'] < 0.013
+    assert summary['missed_deadlines'] == 0
+
+def test_unmarked_frames_are_not_timed():
+
+    stats = FrameStats(fps=10)
+    stats.record(0.0, 0.002)
+    stats.record(0.5, 0.502)
+
+    summary = stats.summary()
+    assert summary['display']['count'] == 2
+    assert summary['frame']['count'] == 0
+    assert summary['missed_deadlines'] == 0
+
+def test_display_frame_marks(oled):
+
+    oled.set_latency_stats(fps=20)
+    oled.start_frame()
+    oled.rect_fill(0, 0, 10, 10)
+    oled.display()
+    time.sleep(0.01)
+    with oled.frame():
+        oled.pixel(20, 20)
+
+    assert oled.get_latency_stats()['frame']['count'] == 2
+    assert oled.get_latency_stats()['missed_deadlines'] == 0
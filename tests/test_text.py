@@ -0,0 +1,86 @@
+#-----------------------------------------------------------------------------
+# test_text.py
+#
+# Text - layout, the rendered text cache and the glyph atlas
+#
+#------------------------------------------------------------------------
+
+from qwiic_oled_base import QwiicOledBase
+from qwiic_oled_base import oled_fonts
+from qwiic_oled_base import oled_layout
+
+from conftest import FakeDriver
+
+def _new_display():
+
+    oled = QwiicOledBase(pixel_width=128, pixel_height=64, i2c_driver=FakeDriver(), splash=False)
+    oled.set_font_type(0)
+    return oled
+
+def test_layout_wrap_and_align():
+
+    font = oled_fonts.get_font(0)      # 5x7, 6 pixel advance
+
+    layout = oled_layout.layout_text('hello big world', font, 60, 32)
+    assert [''.join(run.chars) for run in layout.runs] == ['hello big', 'world']
+    assert [run.y for run in layout.runs] == [0, 8]
+    assert not layout.truncated
+
+    layout = oled_layout.layout_text('abc', font, 60, 8, align=oled_layout.ALIGN_RIGHT)
+    assert layout.runs[0].x == 60 - (2 * 6 + font.cell_width)
+
+def test_layout_truncates():
+
+    font = oled_fonts.get_font(0)
+
+    layout = oled_layout.layout_text('a long line of text', font, 36, 8, wrap=False)
+    assert layout.truncated
+    assert ''.join(layout.runs[0].chars).endswith('...')
+
+def test_text_cache_matches_direct_drawing():
+
+    cached = _new_display()
+    direct = _new_display()
+    direct.set_text_cache_size(0)
+
+    for display in (cached, direct):
+        for _ in range(2):
+            display.draw_text(3, 5, 'Cached text')
+            display.set_cursor(7, 30)
+            display.print('42')
+
+    assert bytes(cached.get_screenbuffer()) == bytes(direct.get_screenbuffer())
+    assert cached.get_text_cache_stats()['hits'] > 0
+    assert direct.get_text_cache_stats() is None
+
+def test_glyph_atlas_matches_pixels():
+
+    atlas = _new_display()
+    pixels = _new_display()
+    pixels.set_glyph_atlas(False)
+
+    for display in (atlas, pixels):
+        display.set_text_cache_size(0)
+        for y in range(0, 40, 5):
+            display.draw_char(y, y, ord('A') + y % 26)
+            display.draw_char(y + 60, y, ord('g'), mode=display.XOR)
+
+    assert bytes(atlas.get_screenbuffer()) == bytes(pixels.get_screenbuffer())
+
+def test_sparse_font_partial_page(tmp_path):
+
+    # 12 pixel high glyphs - two pages, the second one partial
+    path = str(tmp_path / 'sparse.bin')
+    glyphs = {u'é': bytes([0x11] * 4 + [0x01] * 4), u'→': bytes([0x22] * 4 + [0x02] * 4)}
+    oled_fonts.write_sparse_font(path, 4, 12, glyphs)
+
+    font = oled_fonts.load_font(path)
+    assert [bytes(row) for row in font.glyph(0x2192)] == [bytes([0x22] * 4), bytes([0x02] * 4)]
+    assert [bytes(row) for row in font.glyph(0x00e9)] == [bytes([0x11] * 4), bytes([0x01] * 4)]
+
+    # drawn with the font - the text cache keeps the partial page
+    oled = _new_display()
+    oled._font = font
+    for _ in range(2):
+        oled.draw_text(0, 0, u'→')
+    assert bytes(oled.get_screenbuffer()[128:132]) == bytes([0x02] * 4)
@@ -0,0 +1,108 @@
+#-----------------------------------------------------------------------------
+# test_threadsafe.py
+#
+# Thread-safe drawing - text matches the text drawn by QwiicOledBase, and display
+# commands are serialized with transfers
+#
+#------------------------------------------------------------------------
+
+import gc
+import threading
+
+from qwiic_oled_base import QwiicOledBase
+from qwiic_oled_base import oled_fonts
+
+from conftest import FakeDriver
+
+def _new_display():
+
+    oled = QwiicOledBase(pixel_width=128, pixel_height=64, i2c_driver=FakeDriver(), splash=False)
+    oled.set_font_type(0)
+    return oled
+
+def _sparse_font(tmp_path):
+
+    # 12 pixel high glyphs - lines after the first are not page aligned
+    path = str(tmp_path / 'sparse.bin')
+    glyphs = {u'é': bytes([0x11] * 4 + [0x01] * 4), u'→': bytes([0x22] * 4 + [0x02] * 4)}
+    oled_fonts.write_sparse_font(path, 4, 12, glyphs)
+    return oled_fonts.load_font(path)
+
+def test_text_lines_not_page_aligned(tmp_path):
+
+    font = _sparse_font(tmp_path)
+
+    safe = _new_display()
+    safe.thread_safe().text(0, 3, u'é\n→\né', font=font)
+
+    direct = _new_display()
+    direct._font = font
+    for iLine, c in enumerate(u'é→é'):
+        direct.draw_text(0, 3 + iLine * 12, c)
+
+    assert bytes(safe.get_screenbuffer()) == bytes(direct.get_screenbuffer())
+
+def test_text_fallback_fonts_and_font_indexes(tmp_path):
+
+    font = _sparse_font(tmp_path)
+
+    safe = _new_display()
+    direct = _new_display()
+    for display in (safe, direct):
+        display.set_fallback_fonts([font])
+
+    safe.thread_safe().text(0, 0, u'a→b', font=0)
+    safe.thread_safe().text(0, 20, b'AB', font=0)
+
+    direct.draw_text(0, 0, u'a→b')
+    direct.set_cursor(0, 20)
+    direct.print(b'AB')
+
+    assert bytes(safe.get_screenbuffer()) == bytes(direct.get_screenbuffer())
+    assert any(safe.get_screenbuffer()[:128])
+
+def test_text_cache_keyed_on_font_serial(tmp_path):
+
+    oled = _new_display()
+    safe = oled.thread_safe()
+
+    # fonts alive one after the other - a font may get the id() of one freed before it
+    for iFont in range(20):
+        pattern = 1 << (iFont % 8)
+        path = str(tmp_path / ('font%d.bin' % iFont))
+        oled_fonts.write_sparse_font(path, 4, 8, {u'x': bytes([pattern] * 4)})
+        font = oled_fonts.load_font(path)
+
+        oled.clear(oled.PAGE)
+        safe.text(0, 0, u'x', font=font)
+        assert bytes(oled.get_screenbuffer()[:4]) == bytes([pattern] * 4)
+        del font
+        gc.collect()
+
+def test_display_commands_hold_bus_lock():
+
+    oled = _new_display()
+    driver = oled._i2c
+    held = threading.Event()
+    release = threading.Event()
+
+    def hold():
+        with oled._busLock:
+            held.set()
+            release.wait(2)
+
+    holder = threading.Thread(target=hold)
+    holder.start()
+    held.wait(2)
+
+    nWrites = len(driver.log)
+    commands = threading.Thread(target=lambda: (oled.invert(True), oled.flip_vertical(True),
+                                                oled.flip_horizontal(True), oled.scroll_stop()))
+    commands.start()
+    commands.join(0.1)
+    assert len(driver.log) == nWrites
+
+    release.set()
+    holder.join(2)
+    commands.join(2)
+    assert len(driver.log) == nWrites + 4
@@ -0,0 +1,65 @@
+#-----------------------------------------------------------------------------
+# test_virtual.py
+#
+# The virtual display - frames are counted when they are shown
+#
+#------------------------------------------------------------------------
+
+from qwiic_oled_base.oled_virtual import VirtualDisplay
+
+def _new_display():
+
+    oled = VirtualDisplay(128, 64)
+    oled.begin()
+    return oled
+
+def test_frames_counted_once_per_frame_block():
+
+    oled = _new_display()
+    frames = oled.frames
+
+    with oled.frame():
+        for x in range(10):
+            oled.pixel(x, 0)
+            oled.display()
+
+    assert oled.frames == frames + 1
+
+def test_merged_frames_not_counted():
+
+    oled = _new_display()
+    oled.display()
+    frames = oled.frames
+
+    # a long interval - the calls after the first are merged into the frame waiting to be sent
+    oled.set_frame_rate(0.1)
+    for x in range(5):
+        oled.pixel(x, 0)
+        oled.display()
+    assert oled.frames == frames
+
+    oled.set_frame_rate(None)
+    assert oled.frames == frames + 1
+    assert oled.stats()['mean_render_time'] >= 0.0
+
+def test_display_iter_counts_frame():
+
+    oled = _new_display()
+    frames = oled.frames
+
+    oled.pixel(0, 0)
+    steps = list(oled.display_iter())
+    assert steps
+    assert oled.frames == frames + 1
+
+def test_display_iter_inside_frame_not_counted():
+
+    oled = _new_display()
+    frames = oled.frames
+
+    with oled.frame():
+        oled.pixel(0, 0)
+        assert not list(oled.display_iter())
+        assert oled.frames == frames
+
+    assert oled.frames == frames + 1